@@ -0,0 +1,158 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Round-trip benchmark for Mechanical servers.
+
+Each trivial call sent to a server goes through the network, the RPC layer, and
+a hop to Mechanical's main thread. This module measures the round-trip time of
+such calls and reports their percentiles, which shows the dispatch overhead of
+the server independently of the work done in Mechanical. It works with the
+embedded RPC server as well as with a gRPC session.
+
+.. code:: python
+
+    from ansys.mechanical.core.benchmark import benchmark_round_trip
+    from ansys.mechanical.core.embedding.rpc import Client
+
+    client = Client("localhost", 20000)
+    stats = benchmark_round_trip(client, calls=1000)
+    print(stats.summary())
+"""
+
+import dataclasses
+import time
+import typing
+
+from ansys.mechanical.core.replay import percentile
+
+DEFAULT_BENCHMARK_CALLS = 1000
+"""Default number of timed calls of a round-trip benchmark."""
+
+DEFAULT_BENCHMARK_WARMUP = 20
+"""Default number of calls made before timing starts."""
+
+
+@dataclasses.dataclass
+class RoundTripStats:
+    """Round-trip times of the calls of a benchmark."""
+
+    latencies: list[float] = dataclasses.field(default_factory=list)
+    """Round-trip time of each timed call, in seconds."""
+    wall_time: float = 0.0
+    """Duration of the timed calls, in seconds."""
+
+    @property
+    def p50(self) -> float:
+        """Median round-trip time, in seconds."""
+        return percentile(self.latencies, 0.5)
+
+    @property
+    def p99(self) -> float:
+        """99th percentile of the round-trip time, in seconds."""
+        return percentile(self.latencies, 0.99)
+
+    @property
+    def mean(self) -> float:
+        """Mean round-trip time, in seconds."""
+        if not self.latencies:
+            return 0.0
+        return sum(self.latencies) / len(self.latencies)
+
+    @property
+    def calls_per_second(self) -> float:
+        """Number of calls completed per second."""
+        if self.wall_time <= 0:
+            return 0.0
+        return len(self.latencies) / self.wall_time
+
+    def summary(self) -> dict:
+        """Get the summary of the benchmark, with times in milliseconds.
+
+        Examples
+        --------
+        >>> RoundTripStats([0.001, 0.002, 0.003], wall_time=0.006).summary()["p50_ms"]
+        2.0
+        """
+        return {
+            "calls": len(self.latencies),
+            "p50_ms": self.p50 * 1000,
+            "p99_ms": self.p99 * 1000,
+            "mean_ms": self.mean * 1000,
+            "max_ms": max(self.latencies, default=0.0) * 1000,
+            "calls_per_second": self.calls_per_second,
+        }
+
+
+def measure_round_trip(
+    call: typing.Callable[[], typing.Any],
+    calls: int = DEFAULT_BENCHMARK_CALLS,
+    warmup: int = DEFAULT_BENCHMARK_WARMUP,
+) -> RoundTripStats:
+    """Time `calls` sequential invocations of `call`.
+
+    The first `warmup` invocations are not timed, so that connection setup and
+    caches do not skew the percentiles.
+
+    Examples
+    --------
+    >>> stats = measure_round_trip(lambda: None, calls=10, warmup=0)
+    >>> len(stats.latencies)
+    10
+    """
+    for _ in range(warmup):
+        call()
+    stats = RoundTripStats()
+    start = time.perf_counter()
+    for _ in range(calls):
+        call_start = time.perf_counter()
+        call()
+        stats.latencies.append(time.perf_counter() - call_start)
+    stats.wall_time = time.perf_counter() - start
+    return stats
+
+
+def benchmark_round_trip(
+    client,
+    calls: int = DEFAULT_BENCHMARK_CALLS,
+    warmup: int = DEFAULT_BENCHMARK_WARMUP,
+    script: str = "1",
+) -> RoundTripStats:
+    """Measure the round-trip time of trivial scripts run by a server.
+
+    Parameters
+    ----------
+    client : Client or Mechanical
+        Connection to the server. Any object with a ``run_python_script`` method works,
+        so the same benchmark compares the embedded server to a gRPC session.
+    calls : int, optional
+        Number of timed calls. The default is ``1000``.
+    warmup : int, optional
+        Number of calls made before timing starts. The default is ``20``.
+    script : str, optional
+        Script that each call runs. The default is ``"1"``.
+
+    Returns
+    -------
+    RoundTripStats
+        Round-trip times of the timed calls.
+    """
+    return measure_round_trip(lambda: client.run_python_script(script), calls, warmup)
@@ -0,0 +1,293 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Local cache of downloaded files, keyed by the checksum of their content.
+
+The cache stores one copy of each downloaded file in a directory, indexed by a
+SQLite database. Before a download, the client asks the server for the SHA-256
+checksum of the file in a single script. If the cache holds a file with this
+checksum, it is hard-linked to the target instead of being transferred. The
+cache keeps its total size under a limit by evicting the least recently used
+files, and records its hits and misses.
+"""
+
+import dataclasses
+import os
+from pathlib import Path
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+
+import appdirs
+
+from ansys.mechanical.core.transfer import local_sha256
+
+DEFAULT_CACHE_SIZE = 10 * 1024**3
+"""Default maximum size in bytes of the download cache."""
+
+DEFAULT_CACHE_PATH = (
+    Path(appdirs.user_cache_dir(appname="ansys_mechanical_core", appauthor="Ansys")) / "downloads"
+)
+"""Default directory of the download cache."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO counters (name, value) VALUES ('hits', 0), ('misses', 0), ('evictions', 0);
+"""
+
+
+@dataclasses.dataclass
+class CacheStats:
+    """Statistics of a download cache.
+
+    Attributes
+    ----------
+    hits : int
+        Number of downloads served by the cache.
+    misses : int
+        Number of downloads that the cache could not serve.
+    evictions : int
+        Number of files removed to keep the cache under its size limit.
+    entries : int
+        Number of files in the cache.
+    size : int
+        Total size in bytes of the files in the cache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of the lookups served by the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class DownloadCache:
+    """Directory of downloaded files indexed by the SHA-256 checksum of their content.
+
+    Several processes can share the same cache directory.
+
+    Parameters
+    ----------
+    directory : str or pathlib.Path, optional
+        Directory of the cache. The default is ``None``, in which case a
+        ``downloads`` directory in the user cache directory is used.
+    max_size : int, optional
+        Maximum total size in bytes of the cached files. The least recently used
+        files are removed when it is exceeded. The default is 10 GB.
+
+    Examples
+    --------
+    Download the results of finished runs only once.
+
+    >>> from ansys.mechanical.core.cache import DownloadCache
+    >>> mechanical.cache = DownloadCache("~/.mechanical_cache", max_size=50 * 1024**3)
+    >>> mechanical.download("file.rst", target_dir="run1")
+    >>> mechanical.cache.stats().hit_ratio
+    0.5
+
+    Notes
+    -----
+    The files served by the cache are hard links to the cached copy, when the file
+    system allows it. Replace such a file rather than modify it in place, or the
+    cached copy changes as well.
+    """
+
+    def __init__(self, directory=None, max_size: int = DEFAULT_CACHE_SIZE):
+        """Open or create the cache."""
+        self.directory = Path(directory or DEFAULT_CACHE_PATH).expanduser()
+        self.max_size = max_size
+        (self.directory / "objects").mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.directory / "index.sqlite", timeout=30, check_same_thread=False
+        )
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def __repr__(self):
+        """Get the representation of the cache."""
+        return f"DownloadCache('{self.directory}', max_size={self.max_size})"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.directory / "objects" / digest[:2] / digest
+
+    def _count(self, name: str, value: int = 1) -> None:
+        self._connection.execute(
+            "UPDATE counters SET value = value + ? WHERE name = ?", (value, name)
+        )
+
+    def fetch(self, digest: str, target) -> bool:
+        """Place the cached file with a checksum at a path, if the cache holds it.
+
+        Parameters
+        ----------
+        digest : str
+            SHA-256 checksum of the file.
+        target : str or pathlib.Path
+            Path of the file to create. An existing file is replaced.
+
+        Returns
+        -------
+        bool
+            Whether the cache held the file.
+
+        Examples
+        --------
+        >>> cache.fetch(digest, "results/file.rst")
+        True
+        """
+        path = self._object_path(digest)
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT size FROM entries WHERE digest = ?", (digest,)
+            ).fetchone()
+            found = row is not None and path.is_file() and path.stat().st_size == row[0]
+            if found:
+                _place(path, Path(target))
+                self._connection.execute(
+                    "UPDATE entries SET last_access = ? WHERE digest = ?", (time.time(), digest)
+                )
+            elif row is not None:
+                # The cached copy was removed or modified outside of the cache
+                self._connection.execute("DELETE FROM entries WHERE digest = ?", (digest,))
+            self._count("hits" if found else "misses")
+        return found
+
+    def add(self, digest: str, source) -> bool:
+        """Add a downloaded file to the cache.
+
+        The file is added only if its content matches the checksum, so that a file
+        that changed on the server during its download is not cached.
+
+        Parameters
+        ----------
+        digest : str
+            SHA-256 checksum of the file on the server.
+        source : str or pathlib.Path
+            Path of the downloaded file.
+
+        Returns
+        -------
+        bool
+            Whether the file was added.
+
+        Examples
+        --------
+        >>> cache.add(digest, "results/file.rst")
+        True
+        """
+        source = Path(source)
+        size = source.stat().st_size
+        if size > self.max_size or local_sha256(source) != digest:
+            return False
+        path = self._object_path(digest)
+        path.parent.mkdir(exist_ok=True)
+        _place(source, path)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries (digest, size, last_access) VALUES (?, ?, ?)",
+                (digest, size, time.time()),
+            )
+            self._evict()
+        return True
+
+    def _evict(self) -> None:
+        """Remove the least recently used files until the cache fits in its limit."""
+        total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_size:
+            return
+        rows = self._connection.execute(
+            "SELECT digest, size FROM entries ORDER BY last_access"
+        ).fetchall()
+        for digest, size in rows:
+            if total <= self.max_size:
+                break
+            self._object_path(digest).unlink(missing_ok=True)
+            self._connection.execute("DELETE FROM entries WHERE digest = ?", (digest,))
+            self._count("evictions")
+            total -= size
+
+    def stats(self) -> CacheStats:
+        """Get the statistics of the cache.
+
+        Examples
+        --------
+        >>> cache.stats().hit_ratio
+        0.75
+        """
+        with self._lock:
+            counters = dict(self._connection.execute("SELECT name, value FROM counters"))
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return CacheStats(
+            hits=counters["hits"],
+            misses=counters["misses"],
+            evictions=counters["evictions"],
+            entries=entries,
+            size=size,
+        )
+
+    def clear(self) -> None:
+        """Remove all the files of the cache and reset its statistics.
+
+        Examples
+        --------
+        >>> cache.clear()
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM entries")
+            self._connection.execute("UPDATE counters SET value = 0")
+            shutil.rmtree(self.directory / "objects", ignore_errors=True)
+            (self.directory / "objects").mkdir()
+
+    def close(self) -> None:
+        """Close the index of the cache."""
+        with self._lock:
+            self._connection.close()
+
+
+def _place(source: Path, target: Path) -> None:
+    """Hard-link a file to a path, or copy it if the file system does not allow it."""
+    temporary = target.with_name(f"{target.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        os.link(source, temporary)
+    except OSError:
+        shutil.copyfile(source, temporary)
+    temporary.replace(target)
@@ -0,0 +1,248 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Process-wide cache of gRPC channels shared between Mechanical clients."""
+
+from collections.abc import Callable, Hashable
+import os
+import threading
+import time
+
+import grpc
+
+from ansys.mechanical.core import LOG
+
+DEFAULT_IDLE_TIMEOUT = float(os.environ.get("PYMECHANICAL_CHANNEL_IDLE_TIMEOUT", 60.0))
+"""Default time in seconds that an unused channel stays open in the cache."""
+
+
+class _CachedChannel:
+    """Holds a channel together with its reference count."""
+
+    def __init__(self, key: Hashable, channel: grpc.Channel):
+        self.key = key
+        self.channel = channel
+        self.refcount = 0
+        self.idle_since: float | None = None
+
+
+class ChannelCache:
+    """Shares gRPC channels between clients that connect to the same server.
+
+    Opening a channel in the ``mtls`` transport mode costs a TLS handshake. The cache
+    keys channels by host, port, transport mode, certificates, and channel options,
+    so that short-lived sessions to the same server reuse an open connection. Each
+    channel is reference counted. When the last client releases it, the channel stays
+    open for ``idle_timeout`` seconds so that a new session can pick it up, and is
+    then closed by a background thread.
+
+    Parameters
+    ----------
+    idle_timeout : float, optional
+        Time in seconds that a channel without any client stays open. The default
+        is ``60``, which you can override with the ``PYMECHANICAL_CHANNEL_IDLE_TIMEOUT``
+        environment variable. Use ``0`` to close channels as soon as they are released.
+
+    Examples
+    --------
+    Share a channel between two clients connected to the same server.
+
+    >>> from ansys.mechanical.core.channels import CHANNEL_CACHE
+    >>> channel = CHANNEL_CACHE.acquire(("127.0.0.1", 10000), create_channel)
+    >>> CHANNEL_CACHE.acquire(("127.0.0.1", 10000), create_channel) is channel
+    True
+    >>> CHANNEL_CACHE.release(channel)
+    >>> CHANNEL_CACHE.release(channel)
+    """
+
+    def __init__(self, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        """Initialize the channel cache."""
+        self._idle_timeout = float(idle_timeout)
+        self._condition = threading.Condition()
+        self._entries: dict[Hashable, list[_CachedChannel]] = {}
+        self._by_channel: dict[int, _CachedChannel] = {}
+        self._reaper: threading.Thread | None = None
+
+    @property
+    def idle_timeout(self) -> float:
+        """Time in seconds that a channel without any client stays open.
+
+        Examples
+        --------
+        >>> CHANNEL_CACHE.idle_timeout = 5.0
+        """
+        return self._idle_timeout
+
+    @idle_timeout.setter
+    def idle_timeout(self, value: float):
+        """Set the idle timeout."""
+        with self._condition:
+            self._idle_timeout = float(value)
+            self._condition.notify_all()
+
+    def __len__(self) -> int:
+        """Get the number of open channels in the cache."""
+        with self._condition:
+            return len(self._by_channel)
+
+    def stats(self) -> dict[str, int]:
+        """Get the number of open, in-use, and idle channels.
+
+        Examples
+        --------
+        >>> CHANNEL_CACHE.stats()
+        {'open': 1, 'in_use': 1, 'idle': 0}
+        """
+        with self._condition:
+            in_use = sum(1 for each in self._by_channel.values() if each.refcount)
+            return {
+                "open": len(self._by_channel),
+                "in_use": in_use,
+                "idle": len(self._by_channel) - in_use,
+            }
+
+    def acquire(
+        self,
+        key: Hashable,
+        factory: Callable[[int], grpc.Channel],
+        subchannels: int = 1,
+    ) -> grpc.Channel:
+        """Get a channel for a key, creating it if needed.
+
+        Parameters
+        ----------
+        key : Hashable
+            Key identifying the server and the connection settings.
+        factory : Callable
+            Function that creates a new channel. It receives the index of the
+            subchannel to create.
+        subchannels : int, optional
+            Number of separate channels to open for this key. Clients are spread
+            over these channels, using the least used one first. The default is ``1``.
+
+        Returns
+        -------
+        grpc.Channel
+            Shared channel. Call :meth:`release` when you no longer need it.
+
+        Examples
+        --------
+        >>> channel = CHANNEL_CACHE.acquire(key, create_channel, subchannels=2)
+        """
+        if subchannels < 1:
+            raise ValueError("The 'subchannels' parameter must be at least 1.")
+
+        with self._condition:
+            entries = self._entries.setdefault(key, [])
+            if len(entries) < subchannels and all(each.refcount for each in entries):
+                entry = _CachedChannel(key, factory(len(entries)))
+                entries.append(entry)
+                self._by_channel[id(entry.channel)] = entry
+                LOG.debug(f"Opened shared channel {len(entries)} of {subchannels} for {key}.")
+            else:
+                entry = min(entries[:subchannels], key=lambda each: each.refcount)
+            entry.refcount += 1
+            entry.idle_since = None
+            return entry.channel
+
+    def release(self, channel: grpc.Channel) -> None:
+        """Release a channel obtained with :meth:`acquire`.
+
+        Parameters
+        ----------
+        channel : grpc.Channel
+            Channel to release. Channels that are not in the cache are ignored.
+
+        Examples
+        --------
+        >>> CHANNEL_CACHE.release(channel)
+        """
+        with self._condition:
+            entry = self._by_channel.get(id(channel))
+            if entry is None or entry.refcount == 0:
+                return
+            entry.refcount -= 1
+            if entry.refcount:
+                return
+            entry.idle_since = time.monotonic()
+            if self._idle_timeout <= 0:
+                self._close_entry(entry)
+                return
+            self._start_reaper()
+            self._condition.notify_all()
+
+    def close_all(self) -> None:
+        """Close every channel in the cache, including the ones that are in use.
+
+        Examples
+        --------
+        >>> CHANNEL_CACHE.close_all()
+        """
+        with self._condition:
+            for entry in list(self._by_channel.values()):
+                self._close_entry(entry)
+            self._condition.notify_all()
+
+    def _close_entry(self, entry: _CachedChannel) -> None:
+        """Close a channel and drop it from the cache. The lock must be held."""
+        self._by_channel.pop(id(entry.channel), None)
+        entries = self._entries.get(entry.key, [])
+        if entry in entries:
+            entries.remove(entry)
+        if not entries:
+            self._entries.pop(entry.key, None)
+        try:
+            entry.channel.close()
+        except Exception as e:  # pragma: no cover
+            LOG.debug(f"Error while closing shared channel for {entry.key}: {e}")
+
+    def _start_reaper(self) -> None:
+        """Start the thread that closes idle channels. The lock must be held."""
+        if self._reaper is not None and self._reaper.is_alive():
+            return
+        self._reaper = threading.Thread(
+            target=self._reap, name="PyMechanical channel cache", daemon=True
+        )
+        self._reaper.start()
+
+    def _reap(self) -> None:
+        """Close channels that stayed idle for longer than the idle timeout."""
+        with self._condition:
+            while True:
+                idle = [each for each in self._by_channel.values() if each.idle_since is not None]
+                if not idle:
+                    return
+                now = time.monotonic()
+                next_deadline = None
+                for entry in idle:
+                    deadline = entry.idle_since + self._idle_timeout
+                    if deadline <= now:
+                        LOG.debug(f"Closing idle shared channel for {entry.key}.")
+                        self._close_entry(entry)
+                    elif next_deadline is None or deadline < next_deadline:
+                        next_deadline = deadline
+                if next_deadline is not None:
+                    self._condition.wait(timeout=next_deadline - now)
+
+
+CHANNEL_CACHE = ChannelCache()
+"""Process-wide channel cache used by :func:`connect_to_mechanical`."""
@@ -0,0 +1,218 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Concurrency control for the calls made on a single Mechanical instance."""
+
+from contextlib import contextmanager
+import heapq
+import itertools
+import threading
+
+DEFAULT_MAX_CONCURRENT_TRANSFERS = 4
+"""Default number of file transfers that can run concurrently on one instance."""
+
+
+class CallScheduler:
+    """Orders and limits the concurrent calls made on one Mechanical instance.
+
+    Script executions are serialized through a FIFO queue. Callers can pass a
+    priority to move ahead of other queued scripts; lower values run first and
+    scripts with the same priority run in submission order. A script that is
+    started from the thread that already holds the script slot runs immediately,
+    which keeps nested calls such as version checks from deadlocking.
+
+    File transfers are read-only from the point of view of the Mechanical session,
+    so they run concurrently with scripts and with each other, up to
+    ``max_concurrent_transfers`` at a time.
+
+    Parameters
+    ----------
+    max_concurrent_transfers : int, optional
+        Maximum number of transfers that can run at the same time. The default
+        is ``4``.
+    max_pending_scripts : int, optional
+        Maximum number of scripts that can wait in the queue. When the queue is
+        full, new callers block until a slot frees up. The default is ``None``,
+        in which case the queue is unbounded.
+
+    Examples
+    --------
+    Serialize two script executions and run a transfer next to them.
+
+    >>> from ansys.mechanical.core.concurrency import CallScheduler
+    >>> scheduler = CallScheduler(max_concurrent_transfers=2)
+    >>> with scheduler.script(priority=0):
+    ...     pass
+    >>> with scheduler.transfer():
+    ...     pass
+    >>> scheduler.busy
+    False
+    """
+
+    def __init__(
+        self,
+        max_concurrent_transfers: int = DEFAULT_MAX_CONCURRENT_TRANSFERS,
+        max_pending_scripts: int | None = None,
+    ):
+        """Initialize the scheduler."""
+        if max_concurrent_transfers < 1:
+            raise ValueError("The 'max_concurrent_transfers' parameter must be at least 1.")
+        if max_pending_scripts is not None and max_pending_scripts < 1:
+            raise ValueError("The 'max_pending_scripts' parameter must be at least 1.")
+
+        self._max_concurrent_transfers = max_concurrent_transfers
+        self._max_pending_scripts = max_pending_scripts
+        self._condition = threading.Condition()
+        self._sequence = itertools.count()
+        self._queue: list[tuple[int, int]] = []
+        self._script_owner: int | None = None
+        self._script_depth = 0
+        self._in_flight = {"script": 0, "transfer": 0, "control": 0}
+
+    @property
+    def in_flight(self) -> dict[str, int]:
+        """Number of calls currently running, grouped by call kind.
+
+        Examples
+        --------
+        >>> scheduler.in_flight
+        {'script': 0, 'transfer': 0, 'control': 0}
+        """
+        with self._condition:
+            return dict(self._in_flight)
+
+    @property
+    def pending_scripts(self) -> int:
+        """Number of scripts waiting in the queue.
+
+        Examples
+        --------
+        >>> scheduler.pending_scripts
+        0
+        """
+        with self._condition:
+            return len(self._queue)
+
+    @property
+    def busy(self) -> bool:
+        """Whether any call is running or waiting in the queue.
+
+        Examples
+        --------
+        >>> scheduler.busy
+        False
+        """
+        with self._condition:
+            return bool(self._queue) or any(self._in_flight.values())
+
+    @contextmanager
+    def script(self, priority: int = 0):
+        """Hold the script slot for the duration of the ``with`` block.
+
+        Parameters
+        ----------
+        priority : int, optional
+            Priority of the script in the queue. Lower values run first. The
+            default is ``0``.
+
+        Examples
+        --------
+        >>> with scheduler.script(priority=-1):
+        ...     pass
+        """
+        thread_id = threading.get_ident()
+        with self._condition:
+            if self._script_owner == thread_id:
+                # nested call from the thread that already runs a script
+                self._script_depth += 1
+                nested = True
+            else:
+                nested = False
+                while (
+                    self._max_pending_scripts is not None
+                    and len(self._queue) >= self._max_pending_scripts
+                ):
+                    self._condition.wait()
+                ticket = (priority, next(self._sequence))
+                heapq.heappush(self._queue, ticket)
+                self._condition.notify_all()
+                try:
+                    while self._script_owner is not None or self._queue[0] != ticket:
+                        self._condition.wait()
+                except BaseException:
+                    # An interrupted caller must not block the scripts queued after it
+                    self._queue.remove(ticket)
+                    heapq.heapify(self._queue)
+                    self._condition.notify_all()
+                    raise
+                heapq.heappop(self._queue)
+                self._script_owner = thread_id
+                self._script_depth = 1
+                self._in_flight["script"] += 1
+                self._condition.notify_all()
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._script_depth -= 1
+                if not nested:
+                    self._script_owner = None
+                    self._in_flight["script"] -= 1
+                    self._condition.notify_all()
+
+    @contextmanager
+    def transfer(self):
+        """Hold one of the transfer slots for the duration of the ``with`` block.
+
+        Examples
+        --------
+        >>> with scheduler.transfer():
+        ...     pass
+        """
+        with self._condition:
+            while self._in_flight["transfer"] >= self._max_concurrent_transfers:
+                self._condition.wait()
+            self._in_flight["transfer"] += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight["transfer"] -= 1
+                self._condition.notify_all()
+
+    @contextmanager
+    def control(self):
+        """Track a control call, such as a shutdown request, without queuing it.
+
+        Examples
+        --------
+        >>> with scheduler.control():
+        ...     pass
+        """
+        with self._condition:
+            self._in_flight["control"] += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight["control"] -= 1
+                self._condition.notify_all()
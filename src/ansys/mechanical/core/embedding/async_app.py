@@ -0,0 +1,161 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Run embedded Mechanical work from asyncio code."""
+
+import asyncio
+import functools
+import typing
+
+import ansys.mechanical.core as mech
+from ansys.mechanical.core.embedding.background import BackgroundApp
+
+
+class AsyncApp:
+    """Asyncio facade over a :class:`BackgroundApp`.
+
+    The work is queued on the background app thread with
+    :meth:`BackgroundApp.post_async`, and its completion is signalled to the event
+    loop with ``call_soon_threadsafe``, so awaiting it never blocks the loop.
+    Cancelling a task that awaits work that has not started removes the work from
+    the queue. Work that already started runs to its end.
+
+    Parameters
+    ----------
+    background_app : BackgroundApp, optional
+        Background app that runs the work. The default is ``None``, in which case
+        one is created with the keyword arguments.
+    **kwargs : dict, optional
+        Keyword arguments of the :class:`BackgroundApp` to create, such as ``version``.
+
+    Examples
+    --------
+    >>> from ansys.mechanical.core.embedding.async_app import AsyncApp
+    >>> app = AsyncApp(version=261)
+    >>> await app.open("model.mechdb")
+    >>> name = await app.run(lambda: app.app.DataModel.Project.Name)
+    """
+
+    def __init__(self, background_app: BackgroundApp | None = None, **kwargs):
+        """Construct an instance of AsyncApp."""
+        if background_app is None:
+            background_app = BackgroundApp(**kwargs)
+        self._background_app = background_app
+
+    @property
+    def background_app(self) -> BackgroundApp:
+        """Get the background app that runs the work."""
+        return self._background_app
+
+    @property
+    def app(self) -> mech.App:
+        """Get the App instance of the background thread.
+
+        Only use it inside the callables passed to :meth:`run`.
+        """
+        return self._background_app.app
+
+    async def run(self, callable: typing.Callable, *args, **kwargs) -> typing.Any:
+        """Run a callable on the background app thread and wait for its result.
+
+        Parameters
+        ----------
+        callable : Callable
+            Function to run with the positional and keyword arguments.
+
+        Returns
+        -------
+        Any
+            Result of the callable. The exception raised by the callable is raised
+            to the caller.
+
+        Examples
+        --------
+        >>> def count_bodies():
+        ...     return len(app.app.DataModel.GetObjectsByType(DataModelObjectCategory.Body))
+        >>> await app.run(count_bodies)
+        3
+        """
+        future = self._background_app.post_async(functools.partial(callable, *args, **kwargs))
+        return await asyncio.wrap_future(future)
+
+    async def open(self, db_file, remove_lock: bool = False) -> None:
+        """Open a Mechanical database file.
+
+        Parameters
+        ----------
+        db_file : str
+            Path to a Mechanical database file (.mechdat or .mechdb).
+        remove_lock : bool, optional
+            Whether to remove the lock file if it exists before opening the project file.
+        """
+        await self.run(self.app.open, db_file, remove_lock=remove_lock)
+
+    async def save(self, path=None) -> None:
+        """Save the project.
+
+        Parameters
+        ----------
+        path : str, optional
+            Path of the file. The default is ``None``, in which case the current file
+            is saved.
+        """
+        await self.run(self.app.save, path)
+
+    async def save_as(self, path: str, overwrite: bool = False, remove_lock: bool = False) -> None:
+        """Save the project as a new file.
+
+        Parameters
+        ----------
+        path : str
+            The path where the file needs to be saved.
+        overwrite : bool, optional
+            Whether the file should be overwritten if it already exists. The default
+            is ``False``.
+        remove_lock : bool, optional
+            Whether to remove the lock file if it exists before saving the project file.
+        """
+        await self.run(self.app.save_as, path, overwrite=overwrite, remove_lock=remove_lock)
+
+    async def new(self) -> None:
+        """Clear to a new application."""
+        await self.run(self.app.new)
+
+    async def execute_script(self, script: str) -> typing.Any:
+        """Execute a script with the internal IronPython engine.
+
+        Parameters
+        ----------
+        script : str
+            Script to execute.
+
+        Returns
+        -------
+        Any
+            Result of the last line of the script.
+
+        Examples
+        --------
+        >>> await app.execute_script("2 + 3")
+        5
+        """
+        return await self.run(self.app.execute_script, script)
@@ -23,8 +23,9 @@
 """Class for running Mechanical on a background thread."""
 
 import atexit
+import concurrent.futures
+import queue
 import threading
-import time
 import typing
 
 import ansys.mechanical.core as mech
@@ -32,6 +33,12 @@ from ansys.mechanical.core.embedding import initializer
 from ansys.mechanical.core.embedding.poster import Poster
 import ansys.mechanical.core.embedding.utils as utils
 
+PUMP_MIN_INTERVAL = 1
+"""Time in milliseconds that the background thread pumps Mechanical right after running work."""
+
+PUMP_MAX_INTERVAL = 40
+"""Time in milliseconds that the background thread pumps Mechanical when it is idle."""
+
 
 def _exit(background_app: "BackgroundApp"):
     """Stop the thread serving the Background App."""
@@ -43,9 +50,13 @@ class BackgroundApp:
 
     __app: mech.App | None = None
     __app_thread: threading.Thread | None = None
-    __stopped: bool = False
-    __stop_signaled: bool = False
+    __started = threading.Event()
+    __startup_error: BaseException | None = None
+    __stop_signaled = threading.Event()
+    __stopped = threading.Event()
     __poster: Poster | None = None
+    __work: queue.SimpleQueue = queue.SimpleQueue()
+    __work_lock = threading.Lock()
 
     def __init__(self, **kwargs):
         """Construct an instance of BackgroundApp."""
@@ -55,12 +66,13 @@ class BackgroundApp:
                 target=self._start_app, kwargs=kwargs, daemon=True
             )
             BackgroundApp.__app_thread.start()
-
-            while BackgroundApp.__poster is None:
-                time.sleep(0.05)
-                continue
+            BackgroundApp.__started.wait()
+            if BackgroundApp.__startup_error is not None:
+                raise RuntimeError(
+                    "BackgroundApp failed to start."
+                ) from BackgroundApp.__startup_error
         else:
-            if BackgroundApp.__stopped:
+            if BackgroundApp.__stop_signaled.is_set():
                 raise RuntimeError("Cannot initialize a BackgroundApp once it has been stopped!")
 
             def new():
@@ -76,11 +88,14 @@ class BackgroundApp:
         """
         return BackgroundApp.__app
 
-    def _post(self, callable: typing.Callable, try_post: bool = False):
-        if BackgroundApp.__stopped:
+    def _check_running(self):
+        if BackgroundApp.__stop_signaled.is_set():
             raise RuntimeError("Cannot use BackgroundApp after stopping it.")
         if BackgroundApp.__poster is None:
             raise RuntimeError("BackgroundApp poster not initialized.")
+
+    def _post(self, callable: typing.Callable, try_post: bool = False):
+        self._check_running()
         if try_post:
             return BackgroundApp.__poster.try_post(callable)
         return BackgroundApp.__poster.post(callable)
@@ -93,25 +108,90 @@ class BackgroundApp:
         """Try post callable method to the background app thread."""
         return self._post(callable, try_post=True)
 
+    def post_async(self, callable: typing.Callable) -> concurrent.futures.Future:
+        """Queue a callable on the background app thread without waiting for it.
+
+        The queued callables run in order on the background app thread, between two
+        pumps of Mechanical's messages. Cancelling the future before the callable
+        starts removes it from the queue. When the app stops, the callables that did
+        not start are cancelled.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future that holds the result of `callable`, or the exception it raised.
+
+        Examples
+        --------
+        >>> future = background_app.post_async(lambda: background_app.app.DataModel.Project.Name)
+        >>> future.result()
+        'Project'
+        """
+        future = concurrent.futures.Future()
+        with BackgroundApp.__work_lock:
+            self._check_running()
+            BackgroundApp.__work.put((future, callable))
+        return future
+
     def stop(self) -> None:
-        """Stop the background app thread."""
-        if BackgroundApp.__stopped:
+        """Stop the background app thread.
+
+        It returns once the background app thread finished its current pump.
+        """
+        if BackgroundApp.__stopped.is_set():
             return
-        BackgroundApp.__stop_signaled = True
+        BackgroundApp.__stop_signaled.set()
+        BackgroundApp.__stopped.wait()
+
+    @staticmethod
+    def _run_work() -> bool:
+        """Run the queued callables and tell whether there were any."""
+        ran = False
         while True:
-            time.sleep(0.05)
-            if BackgroundApp.__stopped:
-                break
+            try:
+                future, callable = BackgroundApp.__work.get_nowait()
+            except queue.Empty:
+                return ran
+            ran = True
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = callable()
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
 
     def _start_app(self, **kwargs) -> None:
-        BackgroundApp.__app = mech.App(**kwargs)
-        BackgroundApp.__poster = BackgroundApp.__app.poster
+        try:
+            BackgroundApp.__app = mech.App(**kwargs)
+            BackgroundApp.__poster = BackgroundApp.__app.poster
+        except BaseException as e:
+            BackgroundApp.__startup_error = e
+            BackgroundApp.__stop_signaled.set()
+            BackgroundApp.__stopped.set()
+            return
+        finally:
+            BackgroundApp.__started.set()
         atexit.register(_exit, self)
-        while True:
-            if BackgroundApp.__stop_signaled:
-                break
-            try:
-                utils.sleep(40)
-            except Exception as e:  # pragma: no cover
-                raise RuntimeError("BackgroundApp cannot sleep.") from e  # pragma: no cover
-        BackgroundApp.__stopped = True
+        interval = PUMP_MIN_INTERVAL
+        try:
+            while not BackgroundApp.__stop_signaled.is_set():
+                # Pump briefly while work arrives and back off when idle
+                if self._run_work():
+                    interval = PUMP_MIN_INTERVAL
+                else:
+                    interval = min(interval * 2, PUMP_MAX_INTERVAL)
+                try:
+                    utils.sleep(interval)
+                except Exception as e:  # pragma: no cover
+                    raise RuntimeError("BackgroundApp cannot sleep.") from e  # pragma: no cover
+        finally:
+            with BackgroundApp.__work_lock:
+                while True:
+                    try:
+                        future, _ = BackgroundApp.__work.get_nowait()
+                    except queue.Empty:
+                        break
+                    future.cancel()
+                BackgroundApp.__stopped.set()
@@ -22,8 +22,18 @@
 
 """Use the Poster class to post functions to Mechanical's main thread."""
 
+import concurrent.futures
+import queue
+import threading
+import time
 import typing
 
+DEFAULT_COALESCE_WINDOW = 0.001
+"""Default time in seconds during which a coalescing poster gathers calls into a batch."""
+
+DEFAULT_MAX_BATCH = 256
+"""Default maximum number of calls that a coalescing poster runs in one batch."""
+
 
 class PosterError(Exception):
     """Class which holds errors from the background thread posting system."""
@@ -83,3 +93,116 @@ class Poster:
 
         func = System.Func[System.Object](callable)
         return self._poster.Get[System.Object](func)
+
+    def post_many(self, callables: typing.Iterable[typing.Callable]) -> list:
+        """Post several callables to Mechanical's main thread at once.
+
+        The callables run in order in a single hop to the main thread, which is
+        much cheaper than posting each of them.
+
+        Returns a list with the result of each callable, or a `PosterError`
+        holding the exception that it raised.
+        """
+        callables = list(callables)
+        results = [None] * len(callables)
+
+        def run_all():
+            for index, callable in enumerate(callables):
+                try:
+                    results[index] = callable()
+                except Exception as e:
+                    results[index] = PosterError(e)
+
+        if callables:
+            self.post(run_all)
+        return results
+
+
+class CoalescingPoster:
+    """Poster that gathers the calls of several threads into batches.
+
+    Calls made within `window` seconds of each other, or while the previous batch
+    runs, are posted to Mechanical's main thread together with `Poster.post_many`.
+    It has the same `post` and `try_post` methods as `Poster`, so that servers
+    receiving many small calls from several clients can use it instead.
+
+    Do not post from Mechanical's main thread or from a posted callable, since the
+    call would wait for a batch that cannot run.
+    """
+
+    def __init__(
+        self,
+        poster: Poster,
+        window: float = DEFAULT_COALESCE_WINDOW,
+        max_batch: int = DEFAULT_MAX_BATCH,
+    ):
+        """Create a new instance of CoalescingPoster that posts with `poster`."""
+        self._poster = poster
+        self._window = window
+        self._max_batch = max_batch
+        self._queue = queue.SimpleQueue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._dispatch, daemon=True)
+        self._thread.start()
+
+    def submit(self, callable: typing.Callable) -> concurrent.futures.Future:
+        """Queue the callable for the next batch and return its future."""
+        future = concurrent.futures.Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot post to a closed CoalescingPoster.")
+            self._queue.put((future, callable))
+        return future
+
+    def try_post(self, callable: typing.Callable) -> typing.Any:
+        """Post the callable and return its result, raising its exception if any."""
+        return self.submit(callable).result()
+
+    def post(self, callable: typing.Callable) -> typing.Any:
+        """Post the callable and return its result, raising its exception if any."""
+        return self.try_post(callable)
+
+    def close(self) -> None:
+        """Run the calls that are already queued and stop the dispatching thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+
+    def _next_batch(self) -> tuple[list, bool]:
+        """Wait for a call and gather the calls that follow it within the window."""
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self._window
+        while batch[-1] is not None and len(batch) < self._max_batch:
+            try:
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch[-1] is None:
+            return batch[:-1], True
+        return batch, False
+
+    def _dispatch(self) -> None:
+        """Post the batches until the poster is closed."""
+        closed = False
+        while not closed:
+            batch, closed = self._next_batch()
+            batch = [item for item in batch if item[0].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            try:
+                results = self._poster.post_many([callable for _, callable in batch])
+            except Exception as e:
+                results = [PosterError(e)] * len(batch)
+            for (future, _), result in zip(batch, results):
+                if isinstance(result, PosterError):
+                    future.set_exception(result.error)
+                else:
+                    future.set_result(result)
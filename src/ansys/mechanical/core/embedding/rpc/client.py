@@ -29,11 +29,19 @@ import rpyc
 
 from ansys.mechanical.core.embedding.rpc.utils import PYMECHANICAL_DEFAULT_RPC_PORT
 from ansys.mechanical.core.mechanical import DEFAULT_CHUNK_SIZE
+from ansys.mechanical.core.progress import (
+    ProgressCallback,
+    TransferMonitor,
+    as_monitor,
+    start_transfer,
+)
 
 
 class Client:
     """Client for connecting to Mechanical services."""
 
+    _progress = None
+
     def __init__(
         self, host: str, port: int, timeout: float = 120.0, cleanup_on_exit=True, process=None
     ):
@@ -69,6 +77,23 @@ class Client:
         self._error_type = Exception
         self._has_exited = False
 
+    @property
+    def progress(self) -> TransferMonitor | None:
+        """Monitor that receives the progress of the file transfers of this client.
+
+        Each file is sent in a single call, so its progress is reported when the
+        call starts and when it ends.
+
+        Examples
+        --------
+        >>> client.progress = TransferMonitor(lambda progress: print(progress.rate))
+        """
+        return self._progress
+
+    @progress.setter
+    def progress(self, progress: TransferMonitor | ProgressCallback | None):
+        self._progress = as_monitor(progress)
+
     def _get_python_script_api_version(self) -> int:
         """Get the python api version."""
         return 1
@@ -147,9 +172,22 @@ class Client:
         file_base_name = file_path.name
         remote_path = Path(file_location_destination) / file_base_name
 
-        with file_path.open("rb") as f:
-            file_data = f.read()
-            self.service_upload(str(remote_path), file_data)
+        transfer = start_transfer(
+            self._progress,
+            f"{file_base_name} to {self.host}:{self.port}:{file_location_destination}",
+            file_path.stat().st_size,
+            "upload",
+            progress_bar,
+        )
+        try:
+            with file_path.open("rb") as f:
+                file_data = f.read()
+                self.service_upload(str(remote_path), file_data)
+            if transfer is not None:
+                transfer.update(len(file_data))
+        finally:
+            if transfer is not None:
+                transfer.finish()
 
         print(f"File {file_name} uploaded to {file_location_destination}")
 
@@ -177,28 +215,53 @@ class Client:
                 local_file_dir.mkdir(parents=True, exist_ok=True)
 
                 out_file_path = self._download_file(
-                    str(full_remote_path), str(local_file_path), chunk_size, overwrite=True
+                    str(full_remote_path),
+                    str(local_file_path),
+                    chunk_size,
+                    overwrite=True,
+                    progress_bar=progress_bar,
                 )
         else:
             files_path = Path(files)
             local_file_path = target_path / files_path.name
             out_file_path = self._download_file(
-                files, str(local_file_path), chunk_size, overwrite=True
+                files, str(local_file_path), chunk_size, overwrite=True, progress_bar=progress_bar
             )
         out_files.append(out_file_path)
 
         return out_files
 
-    def _download_file(self, remote_file_path, local_file_path, chunk_size=1024, overwrite=False):
+    def _download_file(
+        self,
+        remote_file_path,
+        local_file_path,
+        chunk_size=1024,
+        overwrite=False,
+        progress_bar=False,
+    ):
         local_path = Path(local_file_path)
         if local_path.exists() and not overwrite:
             print(f"File {local_file_path} already exists locally. Skipping download.")
             return
 
-        response = self.service_download(remote_file_path)
-        if isinstance(response, dict):
-            raise ValueError("Expected a file download, but got a directory response.")
-        file_data = response
+        transfer = start_transfer(
+            self._progress,
+            f"{self.host}:{self.port}:{remote_file_path} to {local_file_path}",
+            None,
+            "download",
+            progress_bar,
+        )
+        try:
+            response = self.service_download(remote_file_path)
+            if isinstance(response, dict):
+                raise ValueError("Expected a file download, but got a directory response.")
+            file_data = response
+            if transfer is not None:
+                transfer.total = len(file_data)
+                transfer.update(len(file_data))
+        finally:
+            if transfer is not None:
+                transfer.finish()
 
         # Write the file data to the local path
         with local_path.open("wb") as f:
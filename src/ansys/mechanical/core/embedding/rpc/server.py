@@ -24,7 +24,6 @@
 
 from pathlib import Path
 import threading
-import time
 import typing
 
 import rpyc
@@ -32,7 +31,12 @@ from rpyc.utils.server import ThreadedServer
 import toolz
 
 from ansys.mechanical.core.embedding.app import App
-from ansys.mechanical.core.embedding.background import BackgroundApp
+from ansys.mechanical.core.embedding.background import (
+    PUMP_MAX_INTERVAL,
+    PUMP_MIN_INTERVAL,
+    BackgroundApp,
+)
+from ansys.mechanical.core.embedding.poster import CoalescingPoster
 import ansys.mechanical.core.embedding.utils
 
 from .utils import MethodType, get_free_port, get_remote_methods
@@ -43,14 +47,47 @@ from .utils import MethodType, get_free_port, get_remote_methods
 class ForegroundAppBackend:
     """Backend for the python server where mechanical uses the main thread."""
 
-    def __init__(self, app: App):
-        """Create a new instance of ForegroundAppBackend."""
+    def __init__(self, app: App, coalesce_window: float | None = None):
+        """Create a new instance of ForegroundAppBackend.
+
+        If `coalesce_window` is set, the calls of the clients that arrive within
+        this number of seconds are posted to the main thread in one batch, once
+        `start` is called.
+        """
         self._app = app
         self._poster = app.poster
+        self._coalesce_window = coalesce_window
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls waiting for or running on the main thread."""
+        return self._in_flight
+
+    def start(self) -> None:
+        """Start posting the calls in batches if a coalesce window is set.
+
+        Call it from the main thread right before it starts pumping, since the
+        calls posted in batches cannot run on the main thread before.
+        """
+        if self._coalesce_window is not None and not isinstance(self._poster, CoalescingPoster):
+            self._poster = CoalescingPoster(self._app.poster, window=self._coalesce_window)
+
+    def close(self) -> None:
+        """Stop posting the calls in batches."""
+        if isinstance(self._poster, CoalescingPoster):
+            self._poster.close()
 
     def try_post(self, callable: typing.Callable) -> typing.Any:
         """Try to post to mechanical's main thread."""
-        return self._poster.try_post(callable)
+        with self._in_flight_lock:
+            self._in_flight += 1
+        try:
+            return self._poster.try_post(callable)
+        finally:
+            with self._in_flight_lock:
+                self._in_flight -= 1
 
     def get_app(self) -> App:
         """Get the app object."""
@@ -80,6 +117,8 @@ class MechanicalService(rpyc.Service):
         """Initialize the service."""
         super().__init__()
         self._backend = backend
+        self._connections = 0
+        self._connections_changed = threading.Condition()
         self._install_functions(functions)
         self._install_classes(impl)
 
@@ -91,12 +130,25 @@ class MechanicalService(rpyc.Service):
 
     def on_connect(self, conn):
         """Handle client connection."""
+        with self._connections_changed:
+            self._connections += 1
         print("Client connected")
 
     def on_disconnect(self, conn):
         """Handle client disconnection."""
+        with self._connections_changed:
+            self._connections -= 1
+            self._connections_changed.notify_all()
         print("Client disconnected")
 
+    def wait_disconnected(self, timeout: float | None = None) -> bool:
+        """Wait until no client is connected.
+
+        Returns ``False`` if clients are still connected after `timeout` seconds.
+        """
+        with self._connections_changed:
+            return self._connections_changed.wait_for(lambda: self._connections == 0, timeout)
+
     def _install_functions(self, methods):
         """Install the given list of methods."""
         if not methods:
@@ -267,9 +319,20 @@ class MechanicalEmbeddedServer:
         version: int | None = None,
         methods: list[typing.Callable] = [],
         impl: list = [],
+        coalesce_window: float | None = None,
+        pump_interval: int = PUMP_MAX_INTERVAL,
     ):
-        """Initialize the server."""
+        """Initialize the server.
+
+        Set `coalesce_window` to a number of seconds to post the calls of the
+        clients that arrive within this window to Mechanical in one batch.
+
+        When Mechanical runs on the main thread, the main thread pumps it for
+        `pump_interval` milliseconds at most while no call is in flight, and for
+        `PUMP_MIN_INTERVAL` milliseconds while calls are waiting or running.
+        """
         self._exited = False
+        self._pump_interval = max(pump_interval, PUMP_MIN_INTERVAL)
         use_background_app = False
         self._backend: BackgroundAppBackend | ForegroundAppBackend
         if use_background_app:
@@ -277,11 +340,12 @@ class MechanicalEmbeddedServer:
             self._backend = BackgroundAppBackend(self._app_instance)
         else:
             self._app_instance = App(version=version)
-            self._backend = ForegroundAppBackend(self._app_instance)
+            self._backend = ForegroundAppBackend(self._app_instance, coalesce_window)
         self._port = get_free_port(port)
         self._install_methods(methods)
         self._install_classes(impl)
-        self._server = ThreadedServer(self._create_service(), port=self._port)
+        self._service = self._create_service()
+        self._server = ThreadedServer(self._service, port=self._port)
 
     def _create_service(self):
         service = MechanicalService(self._backend, self._methods, self._impl)
@@ -317,9 +381,8 @@ class MechanicalEmbeddedServer:
         thread will wait until the server has stopped.
         """
 
-        def stop_f():  # wait for all connections to close
-            while len(self._server.clients) > 0:
-                time.sleep(0.005)
+        def stop_f():
+            self._service.wait_disconnected()
             self._app_instance.stop()
             self._app_instance = None
             self._backend = None
@@ -331,6 +394,7 @@ class MechanicalEmbeddedServer:
 
     def _start_foreground_app(self):
         self._server_stopped = False
+        self._backend.start()
 
         def start_f():
             print("Server started!")
@@ -339,16 +403,23 @@ class MechanicalEmbeddedServer:
 
         self._server_thread = threading.Thread(target=start_f)
         self._server_thread.start()
+        interval = PUMP_MIN_INTERVAL
         while True:
             if self._server_stopped:
                 break
+            # Pump briefly while calls are in flight and back off when idle
+            if self._backend.in_flight:
+                interval = PUMP_MIN_INTERVAL
             try:
-                ansys.mechanical.core.embedding.utils.sleep(40)
+                ansys.mechanical.core.embedding.utils.sleep(interval)
             except Exception as e:
                 print(f"An error occurred: {e}")
+            interval = min(interval * 2, self._pump_interval)
         self._server_thread.join()
 
     def _stop_foreground_app(self):
+        # The main thread must keep pumping until the last batch ran
+        self._backend.close()
         self._server_stopped = True
         self._server.close()
         # self._server_thread.join()
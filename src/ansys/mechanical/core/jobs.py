@@ -0,0 +1,353 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Non-blocking jobs that run scripts on a Mechanical instance."""
+
+from concurrent.futures import CancelledError, Future, as_completed as futures_as_completed
+from enum import Enum
+import itertools
+import threading
+import time
+
+import grpc
+
+from ansys.mechanical.core.tracing import current_span
+
+_JOB_IDS = itertools.count(1)
+
+# Script run after a cancelled job, which the server starts once the job script ends
+_BARRIER_SCRIPT = "None"
+
+
+class JobStatus(Enum):
+    """Status of a remote job."""
+
+    PENDING = "pending"
+    """The job waits for the scripts submitted before it."""
+    RUNNING = "running"
+    """The script runs on the server."""
+    DONE = "done"
+    """The script finished and its result is available."""
+    FAILED = "failed"
+    """The script raised an error."""
+    CANCELLED = "cancelled"
+    """The job was cancelled."""
+
+
+class RemoteJob:
+    """Script that runs on a Mechanical instance without blocking the caller.
+
+    The script is streamed on a background thread, which keeps the log messages
+    sent by the server and the result. Jobs are created by
+    :meth:`Mechanical.submit_script <ansys.mechanical.core.mechanical.Mechanical.submit_script>`.
+
+    Examples
+    --------
+    Start a solve and follow its progress.
+
+    >>> job = mechanical.submit_script("Model.Analyses[0].Solve(True)")
+    >>> for message in job.logs():
+    ...     print(message)
+    >>> job.result()
+    ''
+    """
+
+    def __init__(
+        self,
+        mechanical,
+        script: str,
+        log_level: str = "INFO",
+        progress_interval: int = 2000,
+        python_api_version: int = -1,
+        priority: int = 0,
+    ):
+        """Start the job on a background thread."""
+        self.id = next(_JOB_IDS)
+        self.script = script
+        self._mechanical = mechanical
+        self._log_level = log_level
+        self._progress_interval = progress_interval
+        self._python_api_version = python_api_version
+        self._priority = priority
+        self._future = Future()
+        self._future.set_running_or_notify_cancel()
+        self._condition = threading.Condition()
+        self._logs: list[str] = []
+        self._status = JobStatus.PENDING
+        self._call = None
+        self._cancel_requested = False
+        self._start = None
+        self._duration = None
+        self._thread = threading.Thread(target=self._run, name=f"RemoteJob-{self.id}", daemon=True)
+        self._thread.start()
+
+    def __repr__(self):
+        """Get the representation of the job."""
+        return (
+            f"RemoteJob(id={self.id}, instance={self._mechanical.name!r}, "
+            f"status={self._status.value!r})"
+        )
+
+    def _set_status(self, status: JobStatus) -> None:
+        """Set the status and wake up the log readers."""
+        with self._condition:
+            self._status = status
+            self._condition.notify_all()
+
+    def _run(self):
+        """Stream the script and store its log messages and result."""
+        mechanical = self._mechanical
+        try:
+            with mechanical._track("submit_script") as record:
+                with mechanical._scheduler.script(self._priority):
+                    with self._condition:
+                        if self._cancel_requested:
+                            raise CancelledError()
+                        span = current_span()
+                        request = mechanical._script_request(
+                            self.script,
+                            True,
+                            self._log_level,
+                            self._progress_interval,
+                            self._python_api_version,
+                            span.correlation_id if span is not None else None,
+                        )
+                        record.bytes_sent = len(request.script_code.encode())
+                        self._start = time.time()
+                        began = time.perf_counter()
+                        self._call = mechanical._stub.RunPythonScript(
+                            request, **mechanical._call_options(len(request.script_code))
+                        )
+                        self._status = JobStatus.RUNNING
+                        self._condition.notify_all()
+                    try:
+                        result = self._consume(record)
+                    except grpc.RpcError as error:
+                        if self._cancel_requested and error.code() == grpc.StatusCode.CANCELLED:
+                            # The server can still run the script, so keep the instance
+                            self._finish(JobStatus.CANCELLED)
+                            self._wait_for_server()
+                        raise
+                    self._duration = time.perf_counter() - began
+                record.bytes_received = len(result.encode())
+        except CancelledError:
+            self._finish(JobStatus.CANCELLED)
+            return
+        except grpc.RpcError as error:
+            if self._cancel_requested and error.code() == grpc.StatusCode.CANCELLED:
+                self._finish(JobStatus.CANCELLED)
+            else:
+                self._finish(JobStatus.FAILED, error=error)
+            return
+        except Exception as error:
+            self._finish(JobStatus.FAILED, error=error)
+            return
+        mechanical._log_mechanical_script(self.script, self._start, self._duration)
+        self._finish(JobStatus.DONE, result=result)
+
+    def _consume(self, record) -> str:
+        """Read the stream until the server sends the result."""
+        try:
+            for response in self._call:
+                record.chunks_received += 1
+                if response.log_info == "__done__":
+                    return response.script_result
+                with self._condition:
+                    self._logs.append(response.log_info)
+                    self._condition.notify_all()
+                self._mechanical._server_logs.put(self._log_level, response.log_info)
+        except grpc.RpcError as error:
+            if self._mechanical._is_result_conversion_error(error):
+                return ""
+            raise
+        return ""
+
+    def _wait_for_server(self):
+        """Wait until the server finishes the script of the cancelled call."""
+        mechanical = self._mechanical
+        request = mechanical._script_request(
+            _BARRIER_SCRIPT,
+            False,
+            self._log_level,
+            self._progress_interval,
+            self._python_api_version,
+        )
+        try:
+            for response in mechanical._stub.RunPythonScript(
+                request, **mechanical._call_options(len(request.script_code))
+            ):
+                if response.log_info == "__done__":
+                    return
+        except grpc.RpcError:
+            # Such as a lost connection, after which there is nothing to wait for
+            return
+
+    def _finish(self, status, result=None, error=None):
+        """Complete the future of the job and wake up the log readers."""
+        with self._condition:
+            if self._future.done():
+                return
+            self._complete(status, result, error)
+
+    def _complete(self, status, result, error):
+        """Complete the future of the job while holding the condition."""
+        if status == JobStatus.CANCELLED:
+            self._future.set_exception(CancelledError(f"Job {self.id} was cancelled."))
+        elif error is not None:
+            self._future.set_exception(error)
+        else:
+            self._future.set_result(result)
+        self._set_status(status)
+
+    def status(self) -> JobStatus:
+        """Get the status of the job.
+
+        Examples
+        --------
+        >>> job.status()
+        <JobStatus.RUNNING: 'running'>
+        """
+        return self._status
+
+    def done(self) -> bool:
+        """Whether the job finished, failed, or was cancelled."""
+        return self._future.done()
+
+    def logs(self, timeout: float | None = None):
+        """Iterate over the log messages of the job as they arrive.
+
+        The iterator starts with the first message of the job and ends when the job
+        is finished.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time in seconds to wait for each message. The default is ``None``,
+            in which case the iterator waits until the job is finished.
+
+        Raises
+        ------
+        TimeoutError
+            If no message arrives within the timeout.
+
+        Examples
+        --------
+        >>> for message in job.logs():
+        ...     print(message)
+        """
+        index = 0
+        while True:
+            with self._condition:
+                if index >= len(self._logs) and not self._future.done():
+                    if not self._condition.wait_for(
+                        lambda: index < len(self._logs) or self._future.done(), timeout
+                    ):
+                        raise TimeoutError(f"No log message from job {self.id} in {timeout} s.")
+                messages = self._logs[index:]
+                finished = self._future.done()
+            yield from messages
+            index += len(messages)
+            if finished and not messages:
+                return
+
+    def result(self, timeout: float | None = None) -> str:
+        """Wait for the result of the script.
+
+        Parameters
+        ----------
+        timeout : float, optional
+            Maximum time in seconds to wait. The default is ``None``, in which
+            case there is no limit.
+
+        Returns
+        -------
+        str
+            Script result, as returned by :meth:`Mechanical.run_python_script`.
+
+        Raises
+        ------
+        TimeoutError
+            If the job does not finish within the timeout.
+        concurrent.futures.CancelledError
+            If the job was cancelled.
+        grpc.RpcError
+            If the script raised an error on the server.
+
+        Examples
+        --------
+        >>> job.result(timeout=3600)
+        '5'
+        """
+        return self._future.result(timeout)
+
+    def cancel(self) -> bool:
+        """Cancel the job.
+
+        A pending job never starts. For a running job, the gRPC call is cancelled.
+        Whether the script stops on the server depends on the server. It might run
+        until the end, so the instance stays reserved until an empty script sent
+        after it returns. The job is cancelled without waiting for the server.
+
+        Returns
+        -------
+        bool
+            ``True`` if the job was pending or running, ``False`` if it was already finished.
+
+        Examples
+        --------
+        >>> job.cancel()
+        True
+        """
+        with self._condition:
+            if self._future.done():
+                return False
+            self._cancel_requested = True
+            call = self._call
+            if call is None:
+                self._complete(JobStatus.CANCELLED, None, None)
+        if call is not None:
+            call.cancel()
+        return True
+
+
+def as_completed(jobs, timeout: float | None = None):
+    """Iterate over the jobs as they finish.
+
+    Parameters
+    ----------
+    jobs : iterable of RemoteJob
+        Jobs to wait for, possibly on several instances.
+    timeout : float, optional
+        Maximum time in seconds to wait for all the jobs. The default is ``None``.
+
+    Examples
+    --------
+    Solve on every instance of a pool and collect the results as they arrive.
+
+    >>> from ansys.mechanical.core.jobs import as_completed
+    >>> jobs = [instance.submit_script(solve_script) for instance in pool]
+    >>> for job in as_completed(jobs):
+    ...     print(job, job.result())
+    """
+    by_future = {job._future: job for job in jobs}
+    for future in futures_as_completed(by_future, timeout):
+        yield by_future[future]
@@ -0,0 +1,282 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Journal of the scripts sent to Mechanical.
+
+The journal is the file set by the ``log_mechanical`` argument of the
+:class:`Mechanical <ansys.mechanical.core.mechanical.Mechanical>` class. Each entry is
+the script, preceded by a comment with its sequence number, start time, and duration:
+
+.. code:: python
+
+    # pymechanical: {"seq": 1, "start": 1760000000.25, "duration": 0.012}
+    ExtAPI.DataModel.Project.Name
+
+Because the header is a comment, the journal still runs as a script inside Mechanical.
+The timing makes it usable as a trace for the ``ansys-mechanical-replay`` benchmark.
+Journals whose name ends with ``.gz`` are compressed with gzip.
+"""
+
+import atexit
+import dataclasses
+import gzip
+import json
+import os
+from pathlib import Path
+import queue
+import threading
+
+HEADER_PREFIX = "# pymechanical: "
+"""Prefix of the comment line that starts each journal entry."""
+
+DEFAULT_FLUSH_INTERVAL = 1.0
+"""Default time in seconds between two flushes of the journal file."""
+
+_CLOSE = object()
+
+
+@dataclasses.dataclass
+class JournalEntry:
+    """Script of a journal with its timing."""
+
+    seq: int
+    """Sequence number of the script in the journal."""
+    script: str
+    """Script sent to Mechanical."""
+    start: float | None = None
+    """Time when the script was sent, in seconds since the epoch."""
+    duration: float | None = None
+    """Time the script took, in seconds."""
+
+
+class ScriptJournal:
+    """Writes the scripts sent to Mechanical to a journal file on a background thread.
+
+    The scripts are queued in memory and written by a background thread, which
+    flushes the file periodically. Closing the journal, which also happens when
+    Python exits, writes the queued scripts and syncs the file to the disk.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Path of the journal file. Scripts are appended to an existing file.
+    compress : bool, optional
+        Whether to compress the journal with gzip. The default is ``None``, in
+        which case the journal is compressed when the file name ends with ``.gz``.
+    flush_interval : float, optional
+        Time in seconds between two flushes of the file. The default is
+        ``DEFAULT_FLUSH_INTERVAL``.
+
+    Examples
+    --------
+    >>> from ansys.mechanical.core.journal import ScriptJournal
+    >>> journal = ScriptJournal("pymechanical_log.txt")
+    >>> journal.write("2+3", start=time.time(), duration=0.01)
+    >>> journal.close()
+    """
+
+    def __init__(
+        self, path, compress: bool | None = None, flush_interval: float = DEFAULT_FLUSH_INTERVAL
+    ):
+        """Open the journal file and start the writer thread."""
+        self.path = Path(path)
+        if compress is None:
+            compress = self.path.suffix == ".gz"
+        self.compress = compress
+        self.flush_interval = flush_interval
+        self._raw = self.path.open("ab")
+        self._stream = gzip.GzipFile(fileobj=self._raw, mode="ab") if compress else self._raw
+        self._queue = queue.SimpleQueue()
+        self._seq = 0
+        self._seq_lock = threading.Lock()
+        self._closed = False
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="PyMechanicalJournal", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def write(self, script: str, start: float | None = None, duration: float | None = None):
+        """Queue a script for the journal.
+
+        Parameters
+        ----------
+        script : str
+            Script sent to Mechanical.
+        start : float, optional
+            Time when the script was sent, in seconds since the epoch.
+        duration : float, optional
+            Time the script took, in seconds.
+
+        Raises
+        ------
+        OSError
+            If the writer thread failed to write or flush the file since the last
+            error was raised.
+        """
+        if self._closed:
+            raise ValueError(f"The journal {self.path} is closed.")
+        with self._seq_lock:
+            self._seq += 1
+            seq = self._seq
+        self._queue.put(JournalEntry(seq, script, start, duration))
+        self._raise_error()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until the queued scripts are written and the file is flushed.
+
+        Returns
+        -------
+        bool
+            ``True`` if the file was flushed within the timeout.
+
+        Raises
+        ------
+        OSError
+            If the writer thread failed to write or flush the file since the last
+            error was raised.
+        """
+        if self._closed:
+            self._raise_error()
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        flushed = done.wait(timeout)
+        self._raise_error()
+        return flushed
+
+    def close(self) -> None:
+        """Write the queued scripts, sync the file to the disk, and close it.
+
+        Raises
+        ------
+        OSError
+            If the writer thread failed to write, flush, or close the file since the
+            last error was raised.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        self._queue.put(_CLOSE)
+        self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self):
+        """Raise the first error of the writer thread since the last one was raised."""
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _keep_error(self, error: OSError):
+        """Keep an error of the writer thread until the next call raises it."""
+        if self._error is None:
+            self._error = error
+
+    def _run(self):
+        """Write the queued entries and flush the file periodically."""
+        dirty = False
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval if dirty else None)
+            except queue.Empty:
+                item = None
+            if item is _CLOSE:
+                break
+            if item is None or isinstance(item, threading.Event):
+                try:
+                    self._stream.flush()
+                except OSError as error:
+                    self._keep_error(error)
+                dirty = False
+                if item is not None:
+                    item.set()
+                continue
+            try:
+                self._stream.write(format_entry(item).encode("utf-8"))
+                dirty = True
+            except OSError as error:
+                self._keep_error(error)
+        try:
+            if self._stream is not self._raw:
+                self._stream.close()
+            self._raw.flush()
+            os.fsync(self._raw.fileno())
+        except OSError as error:
+            self._keep_error(error)
+        finally:
+            self._raw.close()
+
+
+def format_entry(entry: JournalEntry) -> str:
+    """Format a journal entry as its header comment followed by its script."""
+    header = {"seq": entry.seq, "start": entry.start, "duration": entry.duration}
+    script = entry.script if entry.script.endswith("\n") else entry.script + "\n"
+    return f"{HEADER_PREFIX}{json.dumps(header)}\n{script}"
+
+
+def read_journal(path) -> list[JournalEntry]:
+    """Read the entries of a journal file.
+
+    The text before the first header, such as a journal written by an earlier
+    release, is returned as a single entry without timing.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Path of the journal file. Files whose name ends with ``.gz`` are decompressed.
+
+    Examples
+    --------
+    >>> from ansys.mechanical.core.journal import read_journal
+    >>> entries = read_journal("pymechanical_log.txt")
+    >>> entries[0].duration
+    0.012
+    """
+    path = Path(path)
+    opener = gzip.open if path.suffix == ".gz" else open
+    with opener(path, "rt", encoding="utf-8") as file:
+        text = file.read()
+    entries = []
+    header = None
+    lines = []
+
+    def add_entry():
+        script = "".join(lines)
+        if script.endswith("\n"):
+            script = script[:-1]
+        if header is None:
+            if script.strip():
+                entries.append(JournalEntry(0, script))
+            return
+        entries.append(
+            JournalEntry(header["seq"], script, header.get("start"), header.get("duration"))
+        )
+
+    for line in text.splitlines(keepends=True):
+        if line.startswith(HEADER_PREFIX):
+            add_entry()
+            header = json.loads(line[len(HEADER_PREFIX) :])
+            lines = []
+        else:
+            lines.append(line)
+    add_entry()
+    return entries
@@ -106,6 +106,10 @@ ckass is created, a logger is created and stored here:
 * ``LOG._instances``. This field is a ``dict`` where the key is the name of the
   created logger.
 
+The logger of an instance is removed, and its handlers are closed, when the instance
+exits or is garbage collected. The :attr:`Logger.instance_count` property gives the
+number of instance loggers currently registered.
+
 These logger instances inherit the ``pymechanical_global`` output handlers and
 logging level unless otherwise specified. The way this logger works is very
 similar to the global logger. You can add a file handler if you want using the
@@ -130,12 +134,20 @@ you would do in any other script. There are no conflicts between these loggers.
 
 """
 
+from collections import deque
 from copy import copy
 from datetime import datetime
+import json
 import logging
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
+import queue
 import sys
+import threading
+import time
 import weakref
 
+from ansys.mechanical.core.tracing import current_correlation_id
+
 # Default configuration
 LOG_LEVEL = logging.DEBUG
 """Default log level configuration."""
@@ -154,6 +166,11 @@ ERROR = logging.ERROR
 CRITICAL = logging.CRITICAL
 """Constant for logging.CRITICAL."""
 
+DEFAULT_BATCH_SIZE = 100
+"""Default number of records written to a file at once in asynchronous mode."""
+DEFAULT_FLUSH_INTERVAL = 1.0
+"""Default maximum time in seconds that a record waits in a batch in asynchronous mode."""
+
 # Formatting
 STDOUT_MSG_FORMAT = "%(levelname)s - %(instance_name)s -  %(module)s - %(funcName)s - %(message)s"
 """Standard output message format."""
@@ -220,9 +237,11 @@ class PyMechanicalCustomAdapter(logging.LoggerAdapter):
         kwargs["extra"]["instance_name"] = (
             self.extra.name
         )  # Here self.extra is the argument to pass to the log records.
+        kwargs["extra"]["port"] = getattr(self.extra, "_port", None)
+        kwargs["extra"]["call_id"] = current_correlation_id()
         return msg, kwargs
 
-    def log_to_file(self, filename=FILE_NAME, level=LOG_LEVEL):
+    def log_to_file(self, filename=FILE_NAME, level=LOG_LEVEL, max_bytes=0, backup_count=0):
         """Add a file handler to the logger.
 
         Parameters
@@ -233,9 +252,19 @@ class PyMechanicalCustomAdapter(logging.LoggerAdapter):
             Level of logging. The default is ``None``, in which case the ``"DEBUG"``
             level is used. Options are ``"DEBUG"``, ``"INFO"``, ``"WARNING"``,
             and ``"ERROR"``.
+        max_bytes : int, optional
+            Size in bytes at which the file is rotated. The default is ``0``, in which
+            case the file is never rotated.
+        backup_count : int, optional
+            Number of rotated files to keep. The default is ``0``.
         """
         self.logger = addfile_handler(
-            self.logger, filename=filename, level=level, write_headers=True
+            self.logger,
+            filename=filename,
+            level=level,
+            write_headers=True,
+            max_bytes=max_bytes,
+            backup_count=backup_count,
         )
         self.file_handler = self.logger.file_handler
 
@@ -267,7 +296,7 @@ class PyMechanicalCustomAdapter(logging.LoggerAdapter):
         if isinstance(level, str):
             level = string_to_loglevel[level.upper()]
         self.logger.setLevel(level)
-        for each_handler in self.logger.handlers:
+        for each_handler in _all_handlers(self.logger):
             each_handler.setLevel(level)
         self.level = level
 
@@ -344,6 +373,242 @@ class InstanceFilter(logging.Filter):
         return True
 
 
+class JsonFormatter(logging.Formatter):
+    """Formats each record as a JSON line.
+
+    The line holds the time, level, logger name, instance name, port, call ID,
+    module, function, and message of the record.
+
+    Examples
+    --------
+    >>> from ansys.mechanical.core.logging import JsonFormatter
+    >>> LOG.file_handler.setFormatter(JsonFormatter())
+    """
+
+    def format(self, record):
+        """Format the record as a JSON line."""
+        data = {
+            "time": datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "instance_name": getattr(record, "instance_name", ""),
+            "port": getattr(record, "port", None),
+            "call_id": getattr(record, "call_id", None),
+            "module": record.module,
+            "function": record.funcName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exception"] = record.exc_text
+        return json.dumps(data)
+
+
+class BatchingHandler(MemoryHandler):
+    """Buffers records and writes them to a target handler in batches.
+
+    The batch is written when it is full, when an error is logged, and when the
+    listener of the asynchronous mode calls :meth:`flush` periodically.
+    """
+
+    def __init__(self, target, capacity=DEFAULT_BATCH_SIZE):
+        """Initialize the batching handler."""
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target, flushOnClose=True)
+        self.setLevel(target.level)
+
+    def flush(self):
+        """Write the buffered records and flush the target once."""
+        with self.lock:
+            if self.target is None or not self.buffer:
+                return
+            stream_flush = None
+            if isinstance(self.target, logging.StreamHandler):
+                # Write the whole batch before flushing the stream
+                stream_flush, self.target.flush = self.target.flush, lambda: None
+            try:
+                for record in self.buffer:
+                    self.target.handle(record)
+            finally:
+                if stream_flush is not None:
+                    del self.target.flush
+                    self.target.flush()
+                self.buffer.clear()
+
+
+class _RouteQueueHandler(QueueHandler):
+    """Queue handler that tags each record with the logger it was handled by.
+
+    Records propagated from another logger are then written with the handlers of
+    this logger, as in the synchronous mode.
+    """
+
+    def __init__(self, queue, route):
+        super().__init__(queue)
+        self.route = route
+
+    def enqueue(self, record):
+        """Put the record and its route in the queue."""
+        self.queue.put_nowait((self.route, record))
+
+
+class _AsyncListener(QueueListener):
+    """Listener that hands each record to the handlers of its own logger."""
+
+    def __init__(self, async_logging):
+        super().__init__(async_logging.queue)
+        self._async_logging = async_logging
+        # Time by which the oldest buffered record must be written
+        self._deadline = None
+
+    def _flush(self):
+        self._deadline = None
+        self._async_logging.flush()
+
+    def dequeue(self, block):
+        """Wait for a record, flushing the batches when their oldest record is due."""
+        while True:
+            timeout = None
+            if self._deadline is not None:
+                timeout = self._deadline - time.monotonic()
+                if timeout <= 0:
+                    # Records keep coming, but the batch cannot wait longer
+                    self._flush()
+                    continue
+            try:
+                return self.queue.get(block, timeout=timeout)
+            except queue.Empty:
+                self._flush()
+
+    def handle(self, item):
+        """Hand the record to the handlers of the logger that queued it."""
+        route, record = item
+        for handler in self._async_logging.routes.get(route, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        if self._deadline is None:
+            self._deadline = time.monotonic() + self._async_logging.flush_interval
+
+    def stop(self):
+        """Write the queued records, flush the batches, and stop the thread."""
+        super().stop()
+        self._async_logging.flush()
+
+
+class AsyncLogging:
+    """State of the asynchronous logging mode.
+
+    Each routed logger has a single ``QueueHandler``, while its original handlers
+    are kept here and used by the listener thread. Use
+    :meth:`Logger.enable_async` to create it.
+
+    Parameters
+    ----------
+    batch_size : int
+        Number of records written to a file at once.
+    flush_interval : float
+        Maximum time in seconds that a record waits in a batch.
+    json_format : bool
+        Whether to format the file handlers as JSON lines.
+    """
+
+    def __init__(self, batch_size, flush_interval, json_format):
+        """Initialize the asynchronous logging state."""
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.json_format = json_format
+        self.queue = queue.SimpleQueue()
+        self.routes: dict[str, list[logging.Handler]] = {}
+        self.sources: dict[str, list[logging.Handler]] = {}
+        self._formatters = {}
+        self._loggers: dict[str, logging.Logger] = {}
+        self._lock = threading.RLock()
+        self._listener = _AsyncListener(self)
+
+    def start(self):
+        """Start the listener thread."""
+        self._listener.start()
+
+    def attach(self, logger):
+        """Move the handlers of a logger behind the queue."""
+        with self._lock:
+            sources = self.sources.setdefault(logger.name, [])
+            routes = self.routes.setdefault(logger.name, [])
+            for handler in list(logger.handlers):
+                if isinstance(handler, _RouteQueueHandler):
+                    continue
+                logger.removeHandler(handler)
+                sources.append(handler)
+                if isinstance(handler, logging.FileHandler):
+                    if self.json_format:
+                        self._formatters[handler] = handler.formatter
+                        handler.setFormatter(JsonFormatter())
+                    handler = BatchingHandler(handler, self.batch_size)
+                routes.append(handler)
+            if not any(isinstance(handler, _RouteQueueHandler) for handler in logger.handlers):
+                logger.addHandler(_RouteQueueHandler(self.queue, logger.name))
+            self._loggers[logger.name] = logger
+
+    def detach(self, logger):
+        """Stop routing a logger and give it back its handlers."""
+        with self._lock:
+            for handler in self.routes.pop(logger.name, ()):
+                handler.flush()
+            for handler in list(logger.handlers):
+                if isinstance(handler, _RouteQueueHandler):
+                    logger.removeHandler(handler)
+            for handler in self.sources.pop(logger.name, ()):
+                if handler in self._formatters:
+                    handler.setFormatter(self._formatters.pop(handler))
+                logger.addHandler(handler)
+            self._loggers.pop(logger.name, None)
+
+    def handlers(self, logger):
+        """Get the handlers of a logger, including the ones behind the queue."""
+        with self._lock:
+            return list(self.sources.get(logger.name, ())) + list(self.routes.get(logger.name, ()))
+
+    def flush(self):
+        """Write the pending batches."""
+        for routes in list(self.routes.values()):
+            for handler in routes:
+                handler.flush()
+
+    def stop(self):
+        """Stop the listener and give the loggers back their handlers."""
+        self._listener.stop()
+        with self._lock:
+            for name, logger in self._loggers.items():
+                for handler in list(logger.handlers):
+                    if isinstance(handler, _RouteQueueHandler):
+                        logger.removeHandler(handler)
+                for handler in self.sources.get(name, ()):
+                    if handler in self._formatters:
+                        handler.setFormatter(self._formatters.pop(handler))
+                    logger.addHandler(handler)
+            self.routes.clear()
+            self.sources.clear()
+            self._loggers.clear()
+
+
+_ASYNC_LOGGING: AsyncLogging | None = None
+
+
+def _all_handlers(logger):
+    """Get the handlers of a logger, including the ones behind the asynchronous queue."""
+    handlers = list(logger.handlers)
+    if _ASYNC_LOGGING is not None:
+        handlers.extend(_ASYNC_LOGGING.handlers(logger))
+    return handlers
+
+
+def _source_handlers(logger):
+    """Get the original handlers of a logger, to copy them to a new logger."""
+    if _ASYNC_LOGGING is not None and logger.name in _ASYNC_LOGGING.sources:
+        return list(_ASYNC_LOGGING.sources[logger.name])
+    return list(logger.handlers)
+
+
 class Logger:
     """Provides for adding handlers to the logger for each Mechanical session.
 
@@ -386,6 +651,7 @@ class Logger:
     std_out_handler = None
     _level = logging.DEBUG
     _instances: dict[str, "PyMechanicalCustomAdapter"] = {}
+    _name_counters: dict[str, int] = {}
 
     def __init__(self, level=logging.DEBUG, to_file=False, to_stdout=True, filename=FILE_NAME):
         """Customize the logger for PyMechanical.
@@ -427,7 +693,7 @@ class Logger:
         # Use logger to record unhandled exceptions.
         self.add_handling_uncaught_exceptions(self.logger)
 
-    def log_to_file(self, filename=FILE_NAME, level=LOG_LEVEL):
+    def log_to_file(self, filename=FILE_NAME, level=LOG_LEVEL, max_bytes=0, backup_count=0):
         """Add a file handler to the logger.
 
         Parameters
@@ -439,6 +705,11 @@ class Logger:
             Level of logging. The default is ``10``, in which case the ``"DEBUG"``
             level is used. Options are ``"DEBUG"``, ``"INFO"``,
             ``"WARNING"`` and ``"ERROR"``.
+        max_bytes : int, optional
+            Size in bytes at which the file is rotated. The default is ``0``, in which
+            case the file is never rotated.
+        backup_count : int, optional
+            Number of rotated files to keep. The default is ``0``.
 
         Examples
         --------
@@ -450,7 +721,14 @@ class Logger:
         >>> LOG.log_to_file(file_path)
 
         """
-        addfile_handler(self, filename=filename, level=level, write_headers=True)
+        addfile_handler(
+            self,
+            filename=filename,
+            level=level,
+            write_headers=True,
+            max_bytes=max_bytes,
+            backup_count=backup_count,
+        )
 
     def log_to_stdout(self, level=LOG_LEVEL):
         """Add a standard output handler to the logger.
@@ -473,10 +751,64 @@ class Logger:
         if isinstance(level, str):
             level = string_to_loglevel[level.upper()]
         self.logger.setLevel(level)
-        for each_handler in self.logger.handlers:
+        for each_handler in _all_handlers(self.logger):
             each_handler.setLevel(level)
         self.level = level
 
+    def enable_async(
+        self,
+        batch_size=DEFAULT_BATCH_SIZE,
+        flush_interval=DEFAULT_FLUSH_INTERVAL,
+        json_format=False,
+    ):
+        """Route the global and instance loggers through a queue to a background thread.
+
+        Logging calls only put the record in a queue. A single listener thread formats
+        the records and writes them with the handlers of each logger. Records for files
+        are written in batches, which are flushed when they are full, when an error is
+        logged, and periodically. Handlers added later are routed through the queue too.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            Number of records written to a file at once. The default is ``100``.
+        flush_interval : float, optional
+            Maximum time in seconds that a record waits in a batch. The default is ``1.0``.
+        json_format : bool, optional
+            Whether to write the files as JSON lines with the instance name, port,
+            and call ID of each record. The default is ``False``.
+
+        Examples
+        --------
+        Write the debug messages of all instances to a rotating file without slowing
+        down the calls.
+
+        >>> from ansys.mechanical.core import LOG
+        >>> LOG.log_to_file("pymechanical.log", max_bytes=10_000_000, backup_count=3)
+        >>> LOG.enable_async(json_format=True)
+        """
+        global _ASYNC_LOGGING
+        if _ASYNC_LOGGING is not None:
+            raise RuntimeError("Asynchronous logging is already enabled.")
+        _ASYNC_LOGGING = AsyncLogging(batch_size, flush_interval, json_format)
+        _ASYNC_LOGGING.attach(self.logger)
+        for instance_logger in self._instances.values():
+            _ASYNC_LOGGING.attach(getattr(instance_logger, "logger", instance_logger))
+        _ASYNC_LOGGING.start()
+
+    def disable_async(self):
+        """Write the queued records and restore synchronous logging.
+
+        Examples
+        --------
+        >>> LOG.disable_async()
+        """
+        global _ASYNC_LOGGING
+        if _ASYNC_LOGGING is None:
+            return
+        async_logging, _ASYNC_LOGGING = _ASYNC_LOGGING, None
+        async_logging.stop()
+
     def _make_child_logger(self, suffix, level):
         """Create a child logger.
 
@@ -495,8 +827,10 @@ class Logger:
         logger.file_handler = None
 
         if self.logger.hasHandlers:
-            for each_handler in self.logger.handlers:
+            for each_handler in _source_handlers(self.logger):
                 new_handler = copy(each_handler)
+                # The copy shares the stream of the global handler, so it must not close it
+                new_handler._pymechanical_shared = True
 
                 if each_handler == self.file_handler:
                     logger.file_handler = new_handler
@@ -521,6 +855,8 @@ class Logger:
             logger.setLevel(self.logger.level)
 
         logger.propagate = True
+        if _ASYNC_LOGGING is not None:
+            _ASYNC_LOGGING.attach(logger)
         return logger
 
     def add_child_logger(self, suffix, level=None):
@@ -595,37 +931,82 @@ class Logger:
         Exception
             You can only input strings as ``name`` to this method.
         """
-        count_ = 0
-        new_name = name
-        while new_name in logging.root.manager.__dict__.keys():
-            count_ += 1
-            new_name = name + "_" + str(count_)
-
-        self._instances[new_name] = self._add_mechanical_instance_logger(
-            new_name, mechanical_instance, level
-        )
+        new_name = self._unique_name(name)
+        instance_logger = self._add_mechanical_instance_logger(new_name, mechanical_instance, level)
+        self._instances[new_name] = instance_logger
+        if mechanical_instance is not None:
+            # Remove the logger when the instance is garbage collected without exiting
+            finalizer = weakref.finalize(mechanical_instance, self._release_logger, new_name)
+            finalizer.atexit = False
+            instance_logger._finalizer = finalizer
 
         if name != new_name:
             print(
                 f"name:{name} already exists. Creating a unique name:{new_name} before adding it."
             )
 
-        return self._instances[new_name]
+        return instance_logger
+
+    def _unique_name(self, name):
+        """Get a name that no instance logger uses, counting the loggers with the same name."""
+        if name is None:
+            name = "NO_NAMED_YET"
+        elif not isinstance(name, str):
+            raise ValueError("You can only input 'str' classes to this method.")
+        if name not in self._instances:
+            return name
+        count_ = self._name_counters.get(name, 0) + 1
+        while f"{name}_{count_}" in self._instances:
+            count_ += 1
+        self._name_counters[name] = count_
+        return f"{name}_{count_}"
+
+    @property
+    def instance_count(self):
+        """Number of instance loggers currently registered.
+
+        Examples
+        --------
+        >>> from ansys.mechanical.core import LOG
+        >>> LOG.instance_count
+        0
+        """
+        return len(self._instances)
 
     def remove_instance_logger(self, name):
         """Remove a logger for a Mechanical instance.
 
+        The handlers that the logger does not share with the global logger are
+        closed, and the logger is removed from the ``logging`` module.
+
         Parameters
         ----------
         name : str
             Name of the instance logger to be removed.
         """
         if name in self._instances.keys():
-            self._instances[name].info(f"Removed instance logger: {name}")
-            del self._instances[name]
+            self.logger.debug(f"Removed instance logger: {name}")
+            self._release_logger(name)
         else:
             self.logger.warning(f"Instance logger '{name}' does not exist")
 
+    def _release_logger(self, name):
+        """Close the handlers of an instance logger and forget it."""
+        instance_logger = self._instances.pop(name, None)
+        if instance_logger is None:
+            return
+        finalizer = getattr(instance_logger, "_finalizer", None)
+        if finalizer is not None:
+            finalizer.detach()
+        logger = getattr(instance_logger, "logger", instance_logger)
+        if _ASYNC_LOGGING is not None:
+            _ASYNC_LOGGING.detach(logger)
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            if not getattr(handler, "_pymechanical_shared", False):
+                handler.close()
+        logging.root.manager.loggerDict.pop(logger.name, None)
+
     def __getitem__(self, key):
         """Get the instance logger based on a key.
 
@@ -660,7 +1041,9 @@ class Logger:
         sys.excepthook = handle_exception
 
 
-def addfile_handler(logger, filename=FILE_NAME, level=LOG_LEVEL, write_headers=False):
+def addfile_handler(
+    logger, filename=FILE_NAME, level=LOG_LEVEL, write_headers=False, max_bytes=0, backup_count=0
+):
     """Add a file handler to the input.
 
     Parameters
@@ -674,27 +1057,39 @@ def addfile_handler(logger, filename=FILE_NAME, level=LOG_LEVEL, write_headers=F
         ``"WARNING"`` and ``"ERROR"``.
     write_headers : bool, optional
         Whether to write headers to the file. The default is ``False``.
+    max_bytes : int, optional
+        Size in bytes at which the file is rotated. The default is ``0``, in which
+        case the file is never rotated.
+    backup_count : int, optional
+        Number of rotated files to keep. The default is ``0``.
 
     Returns
     -------
     logger
         Logger object.
     """
-    file_handler = logging.FileHandler(filename)
+    if max_bytes:
+        file_handler = RotatingFileHandler(filename, maxBytes=max_bytes, backupCount=backup_count)
+    else:
+        file_handler = logging.FileHandler(filename)
     file_handler.setLevel(level)
     file_handler.setFormatter(logging.Formatter(FILE_MSG_FORMAT))
 
+    if write_headers:
+        file_handler.stream.write(NEW_SESSION_HEADER)
+        file_handler.stream.write(DEFAULT_FILE_HEADER)
+
     if isinstance(logger, Logger):
         logger.file_handler = file_handler
         logger.logger.addHandler(file_handler)
+        if _ASYNC_LOGGING is not None:
+            _ASYNC_LOGGING.attach(logger.logger)
 
     elif isinstance(logger, logging.Logger):
         logger.file_handler = file_handler
         logger.addHandler(file_handler)
-
-    if write_headers:
-        file_handler.stream.write(NEW_SESSION_HEADER)
-        file_handler.stream.write(DEFAULT_FILE_HEADER)
+        if _ASYNC_LOGGING is not None:
+            _ASYNC_LOGGING.attach(logger)
 
     return logger
 
@@ -724,11 +1119,225 @@ def add_stdout_handler(logger, level=LOG_LEVEL, write_headers=False):
     if isinstance(logger, Logger):
         logger.std_out_handler = std_out_handler
         logger.logger.addHandler(std_out_handler)
+        if _ASYNC_LOGGING is not None:
+            _ASYNC_LOGGING.attach(logger.logger)
 
     elif isinstance(logger, logging.Logger):
         logger.addHandler(std_out_handler)
+        if _ASYNC_LOGGING is not None:
+            _ASYNC_LOGGING.attach(logger)
 
     if write_headers:
         std_out_handler.stream.write(DEFAULT_STDOUT_HEADER)
 
     return logger
+
+
+DEFAULT_SERVER_LOG_BUFFER_SIZE = 10000
+"""Default number of streamed server log messages kept in memory."""
+
+_DRAIN_IDLE_TIMEOUT = 1.0
+
+
+class ServerLogBuffer:
+    """Bounded ring buffer for the log messages streamed from a Mechanical server.
+
+    Messages are appended by the thread that reads the gRPC stream and handed to the
+    logging handlers by a background thread, so formatting and writing the messages
+    does not slow the stream down. When the handlers fall behind, the oldest
+    messages that are not handled yet are dropped. Rate limits and sampling per level
+    reduce the messages that reach the handlers, while the recent tail keeps all of them.
+
+    Parameters
+    ----------
+    emit : callable or weakref.WeakMethod
+        Function that handles a message. It receives the level and the message.
+        With a weak method, the buffer does not keep its object alive, and the
+        messages are dropped once the object is garbage collected.
+    capacity : int, optional
+        Maximum number of messages waiting for the handlers, and number of messages
+        in the recent tail. The default is ``DEFAULT_SERVER_LOG_BUFFER_SIZE``.
+    rate_limits : dict, optional
+        Maximum number of messages per second handed to the handlers, by level.
+        The default is ``None``, in which case the messages are not rate limited.
+    sample_rates : dict, optional
+        Fraction of the messages handed to the handlers, by level. The default is
+        ``None``, in which case all the messages are handled.
+
+    Examples
+    --------
+    Keep one debug message out of ten and at most 20 info messages per second.
+
+    >>> mechanical.server_logs.set_sample_rate("DEBUG", 0.1)
+    >>> mechanical.server_logs.set_rate_limit("INFO", 20)
+    """
+
+    def __init__(
+        self,
+        emit,
+        capacity: int = DEFAULT_SERVER_LOG_BUFFER_SIZE,
+        rate_limits: dict | None = None,
+        sample_rates: dict | None = None,
+    ):
+        """Initialize the buffer."""
+        self._emit = emit
+        self._pending = deque(maxlen=capacity)
+        self._recent = deque(maxlen=capacity)
+        self._condition = threading.Condition()
+        self._rate_limits = {}
+        self._sample_rates = {}
+        self._buckets = {}
+        self._sample_credit = {}
+        self._thread = None
+        self._closed = False
+        self._draining = False
+        self.stats = {"received": 0, "emitted": 0, "overflow": 0, "rate_limited": 0, "sampled": 0}
+        for level, per_second in (rate_limits or {}).items():
+            self.set_rate_limit(level, per_second)
+        for level, rate in (sample_rates or {}).items():
+            self.set_sample_rate(level, rate)
+
+    def set_rate_limit(self, level: str, per_second: float | None) -> None:
+        """Limit the number of messages per second of a level handed to the handlers.
+
+        Bursts up to one second of messages are allowed.
+
+        Parameters
+        ----------
+        level : str
+            Level of the messages, such as ``"INFO"``.
+        per_second : float or None
+            Maximum number of messages per second, or ``None`` to remove the limit.
+        """
+        with self._condition:
+            if per_second is None:
+                self._rate_limits.pop(level, None)
+                self._buckets.pop(level, None)
+            else:
+                self._rate_limits[level] = float(per_second)
+                self._buckets[level] = [float(per_second), time.monotonic()]
+
+    def set_sample_rate(self, level: str, rate: float | None) -> None:
+        """Hand only a fraction of the messages of a level to the handlers.
+
+        Parameters
+        ----------
+        level : str
+            Level of the messages, such as ``"DEBUG"``.
+        rate : float or None
+            Fraction of the messages to keep, between ``0`` and ``1``, or ``None`` to
+            keep all of them.
+        """
+        if rate is not None and not 0 <= rate <= 1:
+            raise ValueError("The sample rate must be between 0 and 1.")
+        with self._condition:
+            if rate is None:
+                self._sample_rates.pop(level, None)
+            else:
+                self._sample_rates[level] = rate
+            self._sample_credit[level] = 0.0
+
+    def put(self, level: str, message: str) -> None:
+        """Add a streamed message to the buffer."""
+        with self._condition:
+            if self._closed:
+                return
+            entry = (level, message)
+            self._recent.append(entry)
+            if len(self._pending) == self._pending.maxlen:
+                self.stats["overflow"] += 1
+            self._pending.append(entry)
+            self.stats["received"] += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._drain, name="PyMechanicalServerLogs", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def recent(self, n: int | None = None) -> list[str]:
+        """Get the most recent messages, oldest first.
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of messages. The default is ``None``, in which case all the
+            messages in the buffer are returned.
+        """
+        with self._condition:
+            entries = list(self._recent)
+        if n is not None:
+            entries = entries[-n:] if n > 0 else []
+        return [message for _, message in entries]
+
+    def _accept(self, level: str, timestamp: float) -> bool:
+        """Apply the sampling and rate limit of the level to a message."""
+        rate = self._sample_rates.get(level)
+        if rate is not None:
+            credit = self._sample_credit[level] + rate
+            if credit < 1:
+                self._sample_credit[level] = credit
+                self.stats["sampled"] += 1
+                return False
+            self._sample_credit[level] = credit - 1
+        bucket = self._buckets.get(level)
+        if bucket is not None:
+            limit = self._rate_limits[level]
+            tokens = min(limit, bucket[0] + (timestamp - bucket[1]) * limit)
+            bucket[1] = timestamp
+            if tokens < 1:
+                bucket[0] = tokens
+                self.stats["rate_limited"] += 1
+                return False
+            bucket[0] = tokens - 1
+        return True
+
+    def _drain(self):
+        """Hand the pending messages to the handlers until the buffer is closed."""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed, _DRAIN_IDLE_TIMEOUT)
+                if not self._pending:
+                    # Stop when closed or idle; the next message starts a new thread
+                    self._thread = None
+                    return
+                batch = []
+                while self._pending:
+                    level, message = self._pending.popleft()
+                    if self._accept(level, time.monotonic()):
+                        batch.append((level, message))
+                self._draining = True
+            emit = self._emit() if isinstance(self._emit, weakref.WeakMethod) else self._emit
+            try:
+                for level, message in batch:
+                    if emit is not None:
+                        emit(level, message)
+            finally:
+                # Do not keep the object of a weak method alive while idle
+                emit = None
+                with self._condition:
+                    self.stats["emitted"] += len(batch)
+                    self._draining = False
+                    self._condition.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until the pending messages are handed to the handlers.
+
+        Returns
+        -------
+        bool
+            ``True`` if all the messages were handled within the timeout.
+        """
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._draining, timeout
+            )
+
+    def close(self, timeout: float | None = 5) -> None:
+        """Hand the pending messages to the handlers and stop the background thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
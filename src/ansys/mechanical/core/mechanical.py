@@ -23,17 +23,19 @@
 """Connect to Mechanical gRPC server and issues commands."""
 
 import atexit
-from contextlib import closing
+from contextlib import closing, contextmanager, nullcontext
 import datetime
-import fnmatch
 from functools import wraps
 import glob
+import io
+import json
 import os
 import pathlib
 from pathlib import Path
 import socket
 import subprocess  # nosec: B404
 import sys
+import tempfile
 import threading
 import time
 import typing
@@ -49,13 +51,20 @@ import grpc
 
 import ansys.mechanical.core as pymechanical
 from ansys.mechanical.core import LOG
+from ansys.mechanical.core.cache import DownloadCache
+from ansys.mechanical.core.channels import CHANNEL_CACHE
+from ansys.mechanical.core.concurrency import DEFAULT_MAX_CONCURRENT_TRANSFERS, CallScheduler
 from ansys.mechanical.core.errors import (
     MechanicalExitedError,
     MechanicalRuntimeError,
     VersionError,
     protect_grpc,
 )
+from ansys.mechanical.core.jobs import RemoteJob
+from ansys.mechanical.core.journal import ScriptJournal
 from ansys.mechanical.core.launcher import MechanicalLauncher
+from ansys.mechanical.core.logging import ServerLogBuffer
+from ansys.mechanical.core.metrics import CallRecord, ClientMetrics
 from ansys.mechanical.core.misc import (
     check_valid_port,
     check_valid_start_instance,
@@ -63,6 +72,66 @@ from ansys.mechanical.core.misc import (
     resolve_certs_dir,
     threaded,
 )
+from ansys.mechanical.core.profiling import (
+    ProfileResult,
+    build_profile_script,
+    fetch_profile_script,
+    parse_profile,
+)
+from ansys.mechanical.core.progress import (
+    _HAS_TQDM,
+    ProgressCallback,
+    TransferMonitor,
+    as_monitor,
+    start_transfer,
+)
+from ansys.mechanical.core.remote_fs import RemoteFileSystem
+from ansys.mechanical.core.tail import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_TAIL_CHUNK_SIZE,
+    RemoteTail,
+)
+from ansys.mechanical.core.tracing import (
+    TRACER,
+    add_correlation_preamble,
+    current_span,
+    traced,
+)
+from ansys.mechanical.core.transfer import (
+    DEFAULT_DELTA_BLOCK_SIZE,
+    DEFAULT_MIN_COMPRESS_SIZE,
+    DEFAULT_READ_AHEAD,
+    DEFAULT_SEGMENT_SIZE,
+    DELTA_LITERAL_FRACTION,
+    DELTA_SUFFIX,
+    GZIP_SUFFIX,
+    PART_SUFFIX,
+    SEGMENT_SUFFIX,
+    ChunkReader,
+    ReadAhead,
+    StreamCall,
+    append_file_script,
+    apply_delta_script,
+    archive_files_script,
+    block_checksums_script,
+    check_compression,
+    compress_file_script,
+    compute_delta,
+    copy_tail_script,
+    decompress_file_script,
+    dedupe_lookup_script,
+    dedupe_store_script,
+    extract_archive,
+    file_info_script,
+    gunzip_responses,
+    gzip_chunks,
+    local_sha256,
+    part_path,
+    remove_file_script,
+    rename_file_script,
+    should_compress,
+)
 
 # Check if PyPIM is installed
 try:
@@ -74,16 +143,6 @@ except ImportError:
     _HAS_ANSYS_PIM = False
 
 
-# Checking if tqdm is installed.
-# If it is, the default value for progress_bar is true.
-try:
-    from tqdm import tqdm
-
-    _HAS_TQDM = True
-    """Whether or not tqdm is installed."""
-except ModuleNotFoundError:  # pragma: no cover
-    _HAS_TQDM = False
-
 # Default 256 MB message length
 MAX_MESSAGE_LENGTH = int(os.environ.get("PYMECHANICAL_MAX_MESSAGE_LENGTH", 256 * 1024**2))
 """Default message length."""
@@ -94,6 +153,9 @@ DEFAULT_CHUNK_SIZE = 256 * 1024  # 256 kB
 DEFAULT_FILE_CHUNK_SIZE = 1024 * 1024  # 1MB
 """Default file chunk size."""
 
+SERVER_LOG_FLUSH_TIMEOUT = 5.0
+"""Maximum time in seconds to wait for the server log messages of a script to be handled."""
+
 
 def setup_logger(loglevel="INFO", log_file=True, mechanical_instance=None):
     """Initialize the logger for the given mechanical instance."""
@@ -132,6 +194,14 @@ def suppress_logging(func):
     return wrapper
 
 
+def _count_sent(requests, record):
+    """Count the bytes and chunks of the upload requests as they are sent."""
+    for request in requests:
+        record.bytes_sent += len(request.chunk.payload)
+        record.chunks_sent += 1
+        yield request
+
+
 LOCALHOST = "127.0.0.1"
 """Localhost address."""
 
@@ -316,6 +386,12 @@ class Mechanical:
     # Required by `_name` method to be defined before __init__ be
     _ip = None
     _port = None
+    _compression = None
+    _fs = None
+    _progress = None
+    _cache = None
+    # Guards the lazy creation of the journal by concurrent script calls
+    _journal_lock = threading.Lock()
 
     def __init__(
         self,
@@ -332,6 +408,12 @@ class Mechanical:
         transport_mode=None,
         certs_dir=None,
         grpc_options=None,
+        max_concurrent_transfers=DEFAULT_MAX_CONCURRENT_TRANSFERS,
+        max_pending_scripts=None,
+        reuse_channel=False,
+        subchannels=1,
+        enable_metrics=False,
+        compression=None,
         **kwargs,
     ):
         """Initialize the member variable based on the arguments.
@@ -363,7 +445,10 @@ class Mechanical:
             command to. The default is ``None``. However, you might set
             ``"log_mechanical='pymechanical_log.txt"`` to write all commands that are
             sent to Mechanical via PyMechanical in this file so that you can use them
-            to run a script within Mechanical without PyMechanical.
+            to run a script within Mechanical without PyMechanical. Each command is
+            preceded by a comment with its start time and duration, and the file is
+            written on a background thread. A file name ending with ``.gz`` is
+            compressed with gzip.
         cleanup_on_exit : bool, optional
             Whether to exit Mechanical when Python exits. The default is ``False``,
             in which case Mechanical is not exited when the garbage for this Mechanical
@@ -397,6 +482,31 @@ class Mechanical:
             For example: ``[("grpc.default_authority", "localhost")]``.
             See gRPC documentation for available options. The default is ``None``.
             Note: ``grpc.max_receive_message_length`` is always set and cannot be overridden.
+        max_concurrent_transfers : int, optional
+            Maximum number of uploads and downloads that can run at the same time on
+            this instance. Transfers run concurrently with script executions. The
+            default is ``4``.
+        max_pending_scripts : int, optional
+            Maximum number of script executions that can wait for their turn. Scripts
+            run one at a time in submission order, and callers block when the queue is
+            full. The default is ``None``, in which case the queue is unbounded.
+        reuse_channel : bool, optional
+            Whether to take the gRPC channel from the process-wide
+            :data:`~ansys.mechanical.core.channels.CHANNEL_CACHE`. Instances that
+            connect to the same server with the same settings then share one
+            connection, which avoids a new TLS handshake for each session. The
+            default is ``False``.
+        subchannels : int, optional
+            Number of separate channels to spread the shared sessions over when
+            ``reuse_channel=True``. The default is ``1``.
+        enable_metrics : bool, optional
+            Whether to record per-call metrics, such as latencies and transferred
+            bytes, in :attr:`metrics`. The default is ``False``.
+        compression : str, optional
+            Compression of the scripts and file transfers of this instance. The
+            default is ``None``, in which case nothing is compressed. Options are
+            ``"auto"``, ``"gzip"``, and ``"grpc"``. For more information, see
+            :attr:`compression`.
 
         Examples
         --------
@@ -434,6 +544,13 @@ class Mechanical:
         # Resolve certs_dir using environment variable if needed for mTLS
         self._certs_dir = resolve_certs_dir(transport_mode, certs_dir)
         self._grpc_options = grpc_options or []
+        self._reuse_channel = reuse_channel
+        self._subchannels = subchannels
+        self._shared_channel = None
+        self._metrics = None
+        self._server_logs = ServerLogBuffer(weakref.WeakMethod(self.log_message))
+        self._journal = None
+        self._compression = check_compression(compression)
 
         # Generate unique instance ID for this client
         self._instance_id = str(uuid.uuid4())[:8]
@@ -467,7 +584,11 @@ class Mechanical:
         self._start_param["certs_dir"] = certs_dir
 
         self._cleanup_on_exit = cleanup_on_exit
-        self._busy = False  # used to check if running a command on the server
+        # orders the calls made on this instance from multiple threads
+        self._scheduler = CallScheduler(
+            max_concurrent_transfers=max_concurrent_transfers,
+            max_pending_scripts=max_pending_scripts,
+        )
 
         self._local = ip_temp in ["127.0.0.1", "127.0.1.1", "localhost"]
         if "local" in kwargs:  # pragma: no cover  # allow this to be overridden
@@ -519,6 +640,9 @@ class Mechanical:
         # Now that channel is created, initialize the instance logger with proper name
         self._log = LOG.add_instance_logger(self.name, self, level=loglevel)
 
+        if enable_metrics:
+            self.enable_metrics()
+
         # adding a file handler to the logger
         if log_file:
             if not isinstance(log_file, str):
@@ -557,14 +681,23 @@ class Mechanical:
                 # grpc.RpcError is not a valid exception type in newer gRPC versions
                 pass
 
+        # Give the shared channel back to the cache
+        if hasattr(self, "_shared_channel"):
+            self._release_channel()
+
         # Remove the instance logger to avoid memory leaks
-        if hasattr(self, "_log") and self._log is not None:
+        if getattr(self, "_log", None) is not None:
             try:
-                LOG.remove_instance_logger(self.name)
+                self._remove_logger()
             except Exception:  # nosec B110 - intentional in destructor
                 # Silently ignore errors during logger cleanup
                 pass
 
+    def _remove_logger(self):
+        """Close the handlers of the instance logger and remove it from the registry."""
+        instance_log, self._log = self._log, None
+        LOG.remove_instance_logger(instance_log.logger.name)
+
     # def _set_log_level(self, level):
     #     """Set an alias for the log level."""
     #     self.set_log_level(level)
@@ -579,6 +712,194 @@ class Mechanical:
         """Return the backend type."""
         return "mechanical"
 
+    @property
+    def metrics(self) -> ClientMetrics | None:
+        """Per-call metrics of this instance, or ``None`` when they are not enabled.
+
+        Examples
+        --------
+        Read the number of scripts that ran on this instance.
+
+        >>> mechanical.enable_metrics()
+        >>> mechanical.run_python_script("2+3")
+        '5'
+        >>> mechanical.metrics.as_dict()["run_python_script"]["calls"]
+        1
+
+        Export the metrics in the Prometheus text format.
+
+        >>> print(mechanical.metrics.to_prometheus())
+        """
+        return self._metrics
+
+    def enable_metrics(self) -> ClientMetrics:
+        """Start recording per-call metrics for this instance.
+
+        The latency, transferred bytes, chunk count, and errors of the
+        :meth:`run_python_script`, :meth:`upload`, :meth:`download`,
+        :meth:`list_files`, and :meth:`exit` calls are recorded.
+
+        Returns
+        -------
+        ansys.mechanical.core.metrics.ClientMetrics
+            Metrics of this instance.
+
+        Examples
+        --------
+        >>> metrics = mechanical.enable_metrics()
+        """
+        if self._metrics is None:
+            self._metrics = ClientMetrics(labels={"instance": self.name})
+        return self._metrics
+
+    @contextmanager
+    def _track(self, operation):
+        """Trace the ``with`` block and record it in the metrics when they are enabled."""
+        span = (
+            TRACER.span(f"mechanical.{operation}", instance=self.name)
+            if TRACER.enabled
+            else nullcontext()
+        )
+        with span:
+            if self._metrics is None:
+                yield CallRecord(operation)
+                return
+            with self._metrics.track(operation) as record:
+                yield record
+
+    @property
+    def compression(self) -> str | None:
+        """Compression of the scripts and file transfers of this instance.
+
+        * ``None``: Nothing is compressed.
+        * ``"gzip"``: Uploaded files are sent as gzip streams that a script
+          decompresses on the server, and downloaded files are compressed by a
+          script before they are sent.
+        * ``"grpc"``: The scripts and uploads are compressed by gRPC, which the
+          server decompresses transparently.
+        * ``"auto"``: Files are compressed as with ``"gzip"`` unless they are smaller
+          than 64 kB or already in a compressed format, such as ZIP or PNG. Scripts
+          of at least 64 kB are compressed by gRPC.
+
+        The ``compression`` argument of the transfer methods overrides this setting
+        for one call. The ``compression_ratio`` of the metrics reports the achieved
+        ratio.
+
+        Examples
+        --------
+        >>> mechanical.compression = "auto"
+        >>> mechanical.download("file.rst")
+        """
+        return self._compression
+
+    @compression.setter
+    def compression(self, compression: str | None):
+        self._compression = check_compression(compression)
+
+    @property
+    def cache(self) -> DownloadCache | None:
+        """Local cache of the files downloaded by this instance.
+
+        When a cache is set, each download first asks the server for the SHA-256
+        checksum of the file. If the cache holds a file with this checksum, it is
+        linked to the target instead of being transferred. Set this property to a
+        :class:`~ansys.mechanical.core.cache.DownloadCache` instance, which can be
+        shared between instances, to ``True`` for a cache in the default directory,
+        or to ``None`` to disable the cache.
+
+        Examples
+        --------
+        Post-process the results of a finished run twice, downloading them once.
+
+        >>> mechanical.cache = True
+        >>> mechanical.download("file.rst", target_dir="first")
+        >>> mechanical.download("file.rst", target_dir="second")
+        >>> mechanical.cache.stats().hits
+        1
+        """
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache: DownloadCache | bool | None):
+        if cache is True:
+            cache = DownloadCache()
+        self._cache = cache or None
+
+    @property
+    def progress(self) -> TransferMonitor | None:
+        """Monitor that receives the progress of the file transfers of this instance.
+
+        Set it to a :class:`~ansys.mechanical.core.progress.TransferMonitor`, which
+        can be shared between instances to aggregate their transfers, or to a
+        function that takes a :class:`~ansys.mechanical.core.progress.TransferProgress`.
+        The ``progress_bar`` argument of the transfer methods still shows ``tqdm``
+        progress bars.
+
+        Examples
+        --------
+        Report the throughput of the downloads to a service.
+
+        >>> mechanical.progress = lambda progress: service.report(progress.rate)
+        >>> mechanical.download("file.rst", progress_bar=False)
+        """
+        return self._progress
+
+    @progress.setter
+    def progress(self, progress: TransferMonitor | ProgressCallback | None):
+        self._progress = as_monitor(progress)
+
+    def _compression_mode(self, compression=None):
+        """Get the compression of a call, where ``False`` disables the instance setting."""
+        if compression is None:
+            return self._compression
+        return check_compression(compression or None)
+
+    def _call_options(self, payload_size, compression=None):
+        """Get the keyword arguments that compress a gRPC call carrying a payload."""
+        mode = self._compression_mode(compression)
+        if mode == "grpc" or (mode == "auto" and payload_size >= DEFAULT_MIN_COMPRESS_SIZE):
+            return {"compression": grpc.Compression.Gzip}
+        return {}
+
+    @property
+    def server_logs(self) -> ServerLogBuffer:
+        """Buffer of the log messages streamed by the scripts of this instance.
+
+        The messages streamed when ``enable_logging=True`` are handed to the instance
+        logger by a background thread. Use this buffer to rate limit or sample them
+        by level.
+
+        Examples
+        --------
+        Keep at most 10 info messages per second in the log files.
+
+        >>> mechanical.server_logs.set_rate_limit("INFO", 10)
+        """
+        return self._server_logs
+
+    def recent_logs(self, n: int = 100) -> list[str]:
+        """Get the most recent log messages streamed by the scripts of this instance.
+
+        The tail includes the messages dropped by the rate limits and the sampling of
+        :attr:`server_logs`.
+
+        Parameters
+        ----------
+        n : int, optional
+            Number of messages. The default is ``100``.
+
+        Returns
+        -------
+        list[str]
+            Messages, oldest first.
+
+        Examples
+        --------
+        >>> mechanical.run_python_script(script, enable_logging=True, log_level="INFO")
+        >>> mechanical.recent_logs(5)
+        """
+        return self._server_logs.recent(n)
+
     @property
     def version(self) -> str:
         """Get the Mechanical version based on the instance.
@@ -620,8 +941,12 @@ class Mechanical:
 
     @property
     def busy(self):
-        """Return True when the Mechanical gRPC server is executing a command."""
-        return self._busy
+        """Return True when the Mechanical gRPC server is executing a command.
+
+        The value is derived from the number of calls that are running or queued
+        on this instance, so it is accurate when several threads share it.
+        """
+        return self._scheduler.busy
 
     @property
     def locked(self):
@@ -833,15 +1158,40 @@ class Mechanical:
         # Add user-provided options
         _channel_options.extend(self._grpc_options)
 
-        channel = create_channel(
-            transport_mode=self._transport_mode,
-            host=ip_to_use,
-            port=self._port,
-            certs_dir=self._certs_dir,
-            grpc_options=_channel_options,
+        def _open_channel(subchannel_index=0):
+            options = list(_channel_options)
+            if self._reuse_channel and self._subchannels > 1:
+                # each subchannel keeps its own connection to the server
+                options.append(("grpc.use_local_subchannel_pool", 1))
+            return create_channel(
+                transport_mode=self._transport_mode,
+                host=ip_to_use,
+                port=self._port,
+                certs_dir=self._certs_dir,
+                grpc_options=options,
+            )
+
+        if not self._reuse_channel:
+            return _open_channel()
+
+        self._release_channel()
+        key = (
+            ip_to_use,
+            self._port,
+            self._transport_mode.lower(),
+            str(self._certs_dir),
+            repr(_channel_options),
+        )
+        self._shared_channel = CHANNEL_CACHE.acquire(
+            key, _open_channel, subchannels=self._subchannels
         )
+        return self._shared_channel
 
-        return channel
+    def _release_channel(self):
+        """Give the shared channel back to the channel cache."""
+        if self._shared_channel is not None:
+            CHANNEL_CACHE.release(self._shared_channel)
+            self._shared_channel = None
 
     @property
     def is_alive(self) -> bool:
@@ -849,7 +1199,7 @@ class Mechanical:
         if self._exited:
             return False
 
-        if self._busy:  # pragma: no cover
+        if self.busy:  # pragma: no cover
             return True
 
         try:  # pragma: no cover
@@ -1065,6 +1415,8 @@ class Mechanical:
         log_level="WARNING",
         progress_interval=2000,
         python_api_version=-1,
+        priority=0,
+        profile=False,
     ):
         """Run a Python script block inside Mechanical.
 
@@ -1083,11 +1435,20 @@ class Mechanical:
         progress_interval: int, optional
             Frequency in milliseconds for getting log messages from the server.
             The default is ``2000``.
+        priority: int, optional
+            Priority of the script when several threads share this instance. Scripts
+            run one at a time, and lower values run first. Scripts with the same
+            priority run in submission order. The default is ``0``.
+        profile: bool, optional
+            Whether to profile the script on the server. Each top-level statement is
+            timed, and the functions that it calls are profiled with ``cProfile``
+            when Mechanical runs CPython. The script must parse as Python 3 on the
+            client to return its result. The default is ``False``.
 
         Returns
         -------
-        str
-            Script result.
+        str or ansys.mechanical.core.profiling.ProfileResult
+            Script result, or the result and its profile when ``profile=True``.
 
         Examples
         --------
@@ -1130,6 +1491,13 @@ class Mechanical:
         >>> mechanical.run_python_script(script)
         '8'
 
+        Find the slowest calls of a script.
+
+        >>> profile = mechanical.run_python_script(script, profile=True)
+        >>> profile.result
+        '8'
+        >>> print(profile.table(10))
+
         Handle an error scenario.
 
         >>> script = "hello_world()"
@@ -1144,10 +1512,111 @@ class Mechanical:
         self.verify_valid_connection()
         if python_api_version == -1:
             python_api_version = self._get_python_script_api_version()
-        result_as_string = self.__call_run_python_script(
-            script_block, enable_logging, log_level, progress_interval, python_api_version
+        server_script = None
+        if profile:
+            profile_key = uuid.uuid4().hex
+            server_script = build_profile_script(script_block, profile_key)
+        with self._track("run_python_script") as record:
+            record.bytes_sent = len((server_script or script_block).encode())
+            span = current_span()
+            result_as_string = self.__call_run_python_script(
+                script_block,
+                enable_logging,
+                log_level,
+                progress_interval,
+                python_api_version,
+                priority=priority,
+                call_record=record,
+                correlation_id=span.correlation_id if span is not None else None,
+                server_script=server_script,
+            )
+            record.bytes_received = len(result_as_string.encode())
+        if not profile:
+            return result_as_string
+        return self._fetch_profile(
+            profile_key, script_block, result_as_string, python_api_version, priority
+        )
+
+    def _fetch_profile(
+        self, key, script_block, result, python_api_version, priority
+    ) -> ProfileResult:
+        """Fetch the profile that the server kept under a key."""
+        with self._track("fetch_profile") as record:
+            payload = self.__call_run_python_script(
+                fetch_profile_script(key),
+                False,
+                "WARNING",
+                2000,
+                python_api_version,
+                priority=priority,
+                call_record=record,
+                journal=False,
+            )
+            record.bytes_received = len(payload.encode())
+        return parse_profile(result, script_block, payload)
+
+    def submit_script(
+        self,
+        script_block: str,
+        log_level="INFO",
+        progress_interval=2000,
+        python_api_version=-1,
+        priority=0,
+    ) -> RemoteJob:
+        """Start a Python script block inside Mechanical without waiting for it.
+
+        The script runs like with :meth:`run_python_script`, but the call returns
+        immediately. The log messages and the result are read from the returned job.
+
+        Parameters
+        ----------
+        script_block : str
+            Script block (one or more lines) to run.
+        log_level: str, optional
+            Level of the log messages sent by the server. The default is ``"INFO"``.
+            Options are ``"DEBUG"``, ``"INFO"``, ``"WARNING"``, and ``"ERROR"``.
+        progress_interval: int, optional
+            Frequency in milliseconds for getting log messages from the server.
+            The default is ``2000``.
+        priority: int, optional
+            Priority of the script when several threads share this instance. The
+            default is ``0``.
+
+        Returns
+        -------
+        ansys.mechanical.core.jobs.RemoteJob
+            Job that runs the script.
+
+        Examples
+        --------
+        Start solves on several instances and wait for them from a single loop.
+
+        >>> from ansys.mechanical.core.jobs import as_completed
+        >>> jobs = [instance.submit_script(solve_script) for instance in pool]
+        >>> for job in as_completed(jobs):
+        ...     print(job.result())
+
+        Follow the progress of a job, and cancel it.
+
+        >>> job = mechanical.submit_script(solve_script)
+        >>> job.status()
+        <JobStatus.RUNNING: 'running'>
+        >>> for message in job.logs(timeout=60):
+        ...     print(message)
+        >>> job.cancel()
+        True
+        """
+        self.verify_valid_connection()
+        if python_api_version == -1:
+            python_api_version = self._get_python_script_api_version()
+        return RemoteJob(
+            self,
+            script_block,
+            log_level=log_level,
+            progress_interval=progress_interval,
+            python_api_version=python_api_version,
+            priority=priority,
         )
-        return result_as_string
 
     def run_python_script_from_file(
         self, file_path, enable_logging=False, log_level="WARNING", progress_interval=2000
@@ -1242,16 +1711,21 @@ class Mechanical:
         request = mechanical_pb2.ShutdownRequest(force_exit=force)
         self.log_debug("Shutting down...")
 
-        self._busy = True
-        try:
-            self._stub.Shutdown(request)
-        except grpc._channel._InactiveRpcError:
-            self.log_warning("Mechanical exit failed: {str(error}.")
-        finally:
-            self._busy = False
+        with self._scheduler.control(), self._track("exit"):
+            try:
+                self._stub.Shutdown(request)
+            except grpc._channel._InactiveRpcError:
+                self.log_warning("Mechanical exit failed: {str(error}.")
 
         self._exited = True
         self._stub = None
+        self._release_channel()
+        self._server_logs.close()
+        if self._journal is not None:
+            try:
+                self._journal.close()
+            except OSError as e:  # pragma: no cover
+                self.log_warning(f"I/O error({e.errno}): {e.strerror}")
 
         if self._remote_instance is not None:  # pragma: no cover
             self.log_debug("PyPIM delete has started.")
@@ -1271,6 +1745,8 @@ class Mechanical:
             local_ports.remove(self._port)
 
         self.log_info("Shutdown has finished.")
+        if self._log is not None:
+            self._remove_logger()
 
     @protect_grpc
     def upload(
@@ -1279,6 +1755,12 @@ class Mechanical:
         file_location_destination=None,
         chunk_size=DEFAULT_FILE_CHUNK_SIZE,
         progress_bar=True,
+        resume=False,
+        segment_size=DEFAULT_SEGMENT_SIZE,
+        compression=None,
+        dedupe=False,
+        delta=False,
+        block_size=DEFAULT_DELTA_BLOCK_SIZE,
     ):
         """Upload a file to the Mechanical instance.
 
@@ -1296,17 +1778,64 @@ class Mechanical:
         progress_bar : bool, optional
             Whether to show a progress bar using ``tqdm``. The default is ``True``.
             A progress bar is helpful for viewing upload progress.
+        resume : bool, optional
+            Whether to upload the file in pieces that can be resumed. The default is
+            ``False``. The pieces are appended to a remote file with the ``.part``
+            suffix. If this file exists, only the missing bytes are sent. The
+            checksum of the complete file is verified before it is renamed.
+        segment_size : int, optional
+            Number of bytes in each piece of a resumable upload. The default is
+            64 MB.
+        compression : str or bool, optional
+            Compression of this upload. The default is ``None``, in which case the
+            :attr:`compression` setting of the instance is used. Use ``False`` to
+            send the file as is. Resumable uploads are not sent as gzip streams.
+        dedupe : bool, optional
+            Whether to skip sending a file that was already uploaded to the server.
+            The default is ``False``. The server keeps a copy of the files uploaded
+            with this option in a content store in the cache directory of its user,
+            and removes the least recently used ones beyond 4 GB. If the store holds
+            a file with the same SHA-256 checksum and size, it is linked or copied
+            into place on the server in a single call.
+        delta : bool, optional
+            Whether to send only the blocks that changed when the server already has
+            a version of the file at the destination. The default is ``False``. The
+            server computes checksums of the blocks of its copy, the client finds
+            them in the local file with a rolling checksum and sends the other bytes,
+            and the server rebuilds the file. If the server has no copy, or if more
+            than half of the file is not found in it, the file is uploaded as usual.
+        block_size : int, optional
+            Size in bytes of the blocks compared by a delta upload. The default is
+            1 MB.
 
         Returns
         -------
         str
             Base name of the uploaded file.
 
+        Raises
+        ------
+        OSError
+            If the checksum of the uploaded file does not match the local file.
+
         Examples
         --------
         Upload the ``hsec.x_t`` file  with the progress bar not shown.
 
         >>> mechanical.upload("hsec.x_t", progress_bar=False)
+
+        Upload a large file over an unreliable connection. If the upload fails,
+        the same call continues from the last piece received.
+
+        >>> mechanical.upload("model.mechdb", resume=True)
+
+        Upload the same material file to each new instance only once per server.
+
+        >>> mechanical.upload("materials.xml", dedupe=True)
+
+        Upload a model again after changing a parameter.
+
+        >>> mechanical.upload("model.mechdb", delta=True)
         """
         file_name = Path(file_name)
         self.verify_valid_connection()
@@ -1314,29 +1843,204 @@ class Mechanical:
         if not file_name.is_file():
             raise FileNotFoundError(f"Unable to locate filename {file_name}.")
 
-        self._log.debug(f"Uploading file '{file_name}' to the Mechanical instance.")
+        self.log_debug(f"Uploading file '{file_name}' to the Mechanical instance.")
 
         if file_location_destination is None:
             file_location_destination = self.project_directory
 
-        self._busy = True
-        try:
+        file_size = file_name.stat().st_size
+        mode = self._compression_mode(compression)
+        digest = None
+        if dedupe and file_size:
+            digest = local_sha256(file_name)
+            info = self._run_transfer_script(
+                "upload_dedupe",
+                dedupe_lookup_script(
+                    digest, file_size, [file_location_destination, file_name.name]
+                ),
+            )
+            if info["found"]:
+                self.log_debug(f"'{file_name}' was copied from the content store of the server.")
+                return str(file_name.name)
+
+        updated = False
+        if delta and file_size:
+            updated = self._upload_delta(
+                file_name, file_location_destination, chunk_size, progress_bar, block_size
+            )
+        if updated:
+            self.log_debug(f"Only the changed blocks of '{file_name}' were sent.")
+        elif resume and file_size:
+            self._upload_resumable(
+                file_name,
+                file_location_destination,
+                chunk_size,
+                progress_bar,
+                segment_size,
+                self._call_options(0, "grpc") if mode == "grpc" else {},
+            )
+        else:
+            self._upload_stream(
+                file_name, file_location_destination, chunk_size, progress_bar, mode
+            )
+
+        if digest is not None:
+            self._run_transfer_script(
+                "upload_dedupe",
+                dedupe_store_script([file_location_destination, file_name.name], digest),
+            )
+        return str(file_name.name)
+
+    def _upload_delta(self, file_name, destination, chunk_size, progress_bar, block_size):
+        """Send the blocks of a file that the server copy does not have.
+
+        Returns whether the server copy was updated.
+        """
+        target = [destination, file_name.name]
+        info = self._run_transfer_script("upload_delta", block_checksums_script(target, block_size))
+        if not info["exists"]:
+            return False
+
+        with tempfile.TemporaryDirectory() as directory:
+            literal_path = Path(directory) / (file_name.name + DELTA_SUFFIX)
+            max_literal = int(file_name.stat().st_size * DELTA_LITERAL_FRACTION)
+            with literal_path.open("wb") as literal_stream:
+                ops = compute_delta(
+                    file_name, info["blocks"], block_size, literal_stream, max_literal
+                )
+            if ops is None:
+                self.log_debug(f"Most of '{file_name}' changed. Sending the whole file.")
+                return False
+            with self._scheduler.transfer(), self._track("upload_delta") as record:
+                response = self._stub.UploadFile(
+                    _count_sent(
+                        self.get_file_chunks(
+                            destination,
+                            str(literal_path),
+                            chunk_size=chunk_size,
+                            progress_bar=progress_bar,
+                        ),
+                        record,
+                    )
+                )
+                record.bytes_uncompressed = file_name.stat().st_size
+        if not response.is_ok:  # pragma: no cover
+            raise OSError("File failed to upload.")
+
+        result = self._run_transfer_script(
+            "upload_delta",
+            apply_delta_script(
+                target, [destination, literal_path.name], ops, local_sha256(file_name)
+            ),
+        )
+        if not result["applied"]:
+            self.log_warning(f"The delta upload of '{file_name}' failed. Sending the whole file.")
+        return result["applied"]
+
+    def _upload_stream(self, file_name, file_location_destination, chunk_size, progress_bar, mode):
+        """Upload a file in a single call, as a gzip stream if the compression requires it."""
+        file_size = file_name.stat().st_size
+        gzip_stream = mode == "gzip" or (mode == "auto" and should_compress(file_name, file_size))
+        remote_name = file_name.name + GZIP_SUFFIX if gzip_stream else None
+        with self._scheduler.transfer(), self._track("upload") as record:
             chunks_generator = self.get_file_chunks(
                 file_location_destination,
                 str(file_name),
                 chunk_size=chunk_size,
                 progress_bar=progress_bar,
+                remote_name=remote_name,
+                compress=gzip_stream,
+            )
+            response = self._stub.UploadFile(
+                _count_sent(chunks_generator, record),
+                **(self._call_options(0, "grpc") if mode == "grpc" else {}),
             )
-            response = self._stub.UploadFile(chunks_generator)
             self.log_debug(f"upload_file response is {response.is_ok}.")
-        finally:
-            self._busy = False
+            record.bytes_uncompressed = file_size
 
         if not response.is_ok:  # pragma: no cover
             raise OSError("File failed to upload.")
-        return str(file_name.name)
+        if gzip_stream:
+            self._run_transfer_script(
+                "upload_decompress",
+                decompress_file_script(
+                    [file_location_destination, remote_name],
+                    [file_location_destination, file_name.name],
+                ),
+            )
+
+    def _upload_resumable(
+        self, file_name, destination, chunk_size, progress_bar, segment_size, call_options
+    ):
+        """Upload a file in pieces appended to a remote partial file."""
+        final = [destination, file_name.name]
+        part = [destination, file_name.name + PART_SUFFIX]
+        segment_name = file_name.name + SEGMENT_SUFFIX
+        local_size = file_name.stat().st_size
+
+        offset = self._run_transfer_script("upload_status", file_info_script(part))["size"]
+        if offset > local_size:
+            # The partial file does not belong to this file
+            self._run_transfer_script("upload_status", remove_file_script(part))
+            offset = 0
+        if offset:
+            self.log_info(f"Resuming the upload of '{file_name}' at byte {offset}.")
+
+        while offset < local_size:
+            length = min(segment_size, local_size - offset)
+            with self._scheduler.transfer(), self._track("upload") as record:
+                chunks_generator = self.get_file_chunks(
+                    destination,
+                    str(file_name),
+                    chunk_size=chunk_size,
+                    progress_bar=progress_bar,
+                    offset=offset,
+                    length=length,
+                    remote_name=segment_name,
+                )
+                response = self._stub.UploadFile(chunks_generator, **call_options)
+                record.bytes_sent = length
+                record.chunks_sent = -(-length // chunk_size)
+            if not response.is_ok:  # pragma: no cover
+                raise OSError("File failed to upload.")
+            info = self._run_transfer_script(
+                "upload_append", append_file_script([destination, segment_name], part)
+            )
+            offset = info["size"]
+
+        info = self._run_transfer_script("upload_verify", file_info_script(part, checksum=True))
+        if info["sha256"] != local_sha256(file_name):
+            self._run_transfer_script("upload_verify", remove_file_script(part))
+            raise OSError(f"The checksum of the uploaded file '{file_name.name}' does not match.")
+        self._run_transfer_script("upload_verify", rename_file_script(part, final))
+
+    def _run_transfer_script(self, operation, script):
+        """Run a helper script of a transfer and decode its JSON result."""
+        with self._track(operation) as record:
+            record.bytes_sent = len(script.encode())
+            result = self.__call_run_python_script(
+                script,
+                False,
+                "WARNING",
+                2000,
+                self._get_python_script_api_version(),
+                call_record=record,
+                journal=False,
+            )
+            record.bytes_received = len(result.encode())
+        return json.loads(result)
 
-    def get_file_chunks(self, file_location, file_name, chunk_size, progress_bar):
+    def get_file_chunks(
+        self,
+        file_location,
+        file_name,
+        chunk_size,
+        progress_bar,
+        offset=0,
+        length=None,
+        remote_name=None,
+        compress=False,
+    ):
         """Construct the file upload request for the server.
 
         Parameters
@@ -1349,43 +2053,48 @@ class Mechanical:
             Chunk size in bytes.
         progress_bar : bool
             Whether to show a progress bar using ``tqdm``.
+        offset : int, optional
+            Byte of the file at which to start. The default is ``0``.
+        length : int, optional
+            Number of bytes to send. The default is ``None``, in which case the
+            file is sent up to its end.
+        remote_name : str, optional
+            Name of the file on the server. The default is ``None``, in which case
+            the name of the local file is used.
+        compress : bool, optional
+            Whether to send the file as a gzip stream. The default is ``False``.
         """
         file_name = Path(file_name)
-        pbar = None
-        if progress_bar:
-            if not _HAS_TQDM:  # pragma: no cover
-                raise ModuleNotFoundError(
-                    "To use the keyword argument 'progress_bar', you must have "
-                    "installed the 'tqdm' package. To avoid this message, you can "
-                    "set 'progress_bar=False'."
-                )
-
-            n_bytes = file_name.stat().st_size
-
-            base_name = file_name.name
-            pbar = tqdm(
-                total=n_bytes,
-                desc=f"Uploading {base_name} to {self._channel_str}:{file_location}.",
-                unit="B",
-                unit_scale=True,
-                unit_divisor=1024,
-            )
-        with file_name.open("rb") as f:
-            while True:
-                piece = f.read(chunk_size)
-                length = len(piece)
-                if length == 0:
-                    if pbar is not None:
-                        pbar.close()
-                    return
-
-                if pbar is not None:
-                    pbar.update(length)
-
-                chunk = mechanical_pb2.Chunk(payload=piece, size=length)
-                yield mechanical_pb2.FileUploadRequest(
-                    file_name=str(file_name.name), file_location=file_location, chunk=chunk
-                )
+        remote_name = remote_name or file_name.name
+        if length is None:
+            length = file_name.stat().st_size - offset
+        transfer = start_transfer(
+            self._progress,
+            f"{file_name.name} to {self._channel_str}:{file_location}",
+            length,
+            "upload",
+            progress_bar,
+        )
+        try:
+            with file_name.open("rb") as f:
+                f.seek(offset)
+                if compress:
+                    pieces = gzip_chunks(f, chunk_size)
+                else:
+                    pieces = iter(lambda: f.read(min(chunk_size, offset + length - f.tell())), b"")
+                position = offset
+                for piece in pieces:
+                    if transfer is not None:
+                        transfer.update(f.tell() - position)
+                    position = f.tell()
+
+                    chunk = mechanical_pb2.Chunk(payload=piece, size=len(piece))
+                    yield mechanical_pb2.FileUploadRequest(
+                        file_name=remote_name, file_location=file_location, chunk=chunk
+                    )
+        finally:
+            if transfer is not None:
+                transfer.finish()
 
     @property
     def project_directory(self):
@@ -1401,9 +2110,93 @@ class Mechanical:
         """
         return self.run_python_script("ExtAPI.DataModel.Project.ProjectDirectory")
 
+    @property
+    def fs(self) -> RemoteFileSystem:
+        """File system of the server, where each operation costs a single call.
+
+        Examples
+        --------
+        Check whether a file exists and remove a scratch directory.
+
+        >>> mechanical.fs.exists("file.rst")
+        True
+        >>> mechanical.fs.remove("scratch", recursive=True)
+        """
+        if self._fs is None:
+            self._fs = RemoteFileSystem(self)
+        return self._fs
+
+    def tail(
+        self,
+        remote_path: str,
+        follow: bool = True,
+        offset: int = 0,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        idle_timeout: float | None = None,
+        chunk_size: int = DEFAULT_TAIL_CHUNK_SIZE,
+    ) -> RemoteTail:
+        """Stream the bytes appended to a file on the server, such as a solver output file.
+
+        Each poll fetches only the bytes written since the previous one. While the
+        file does not grow, the interval between polls doubles up to
+        ``max_poll_interval``. It drops back to ``poll_interval`` when new bytes arrive.
+
+        Parameters
+        ----------
+        remote_path : str
+            Path of the file on the server. A relative path is resolved against the
+            project directory.
+        follow : bool, optional
+            Whether to keep waiting for new bytes after reaching the end of the file.
+            The default is ``True``. If ``False``, the iteration stops at the end of
+            the file and a missing file raises a ``FileNotFoundError``.
+        offset : int, optional
+            Byte at which to start. A negative value counts from the end of the file.
+            The default is ``0``.
+        poll_interval : float, optional
+            Time in seconds between two polls while the file grows. The default is ``0.5``.
+        max_poll_interval : float, optional
+            Maximum time in seconds between two polls. The default is ``10.0``.
+        idle_timeout : float, optional
+            Time in seconds without new bytes after which the iteration stops. The
+            default is ``None``, in which case it stops only when ``stop()`` is called.
+        chunk_size : int, optional
+            Maximum number of bytes fetched by one poll. The default is 1 MB.
+
+        Returns
+        -------
+        RemoteTail
+            Iterator over the new bytes. Its ``lines()`` method yields decoded lines.
+
+        Examples
+        --------
+        Print the solver output while a solve runs in a background job.
+
+        >>> job = mechanical.submit_script("Model.Solve()")
+        >>> output = mechanical.tail("MechanicalSolution/solve.out", idle_timeout=600)
+        >>> for line in output.lines():
+        ...     print(line)
+        ...     if job.done():
+        ...         output.stop()
+        """
+        return RemoteTail(
+            self,
+            remote_path,
+            follow=follow,
+            offset=offset,
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+            idle_timeout=idle_timeout,
+            chunk_size=chunk_size,
+        )
+
     def list_files(self):
         """List the files in the working directory of Mechanical.
 
+        This method walks the whole project directory. To check a single file or
+        match a pattern, use :attr:`fs` instead.
+
         Returns
         -------
         list[str]
@@ -1437,7 +2230,9 @@ for dirPath, _, fileNames in os.walk(rootDir):
 '\\n'.join(file_list)
 """
 
-        result = self.run_python_script(script)
+        with self._track("list_files") as record:
+            result = self.run_python_script(script)
+            record.bytes_received = len(result.encode())
         if not result:  # pragma: no cover
             self.log_warning("No files listed")
             return []
@@ -1446,8 +2241,6 @@ for dirPath, _, fileNames in os.walk(rootDir):
         return result.split("\n") if result else []
 
     def _get_files(self, files, recursive=False):
-        self_files = self.list_files()
-
         if isinstance(files, str):
             if self._local:  # pragma: no cover
                 # in local mode
@@ -1472,25 +2265,28 @@ for dirPath, _, fileNames in os.walk(rootDir):
                         f"The files parameter ('{files}') does not match any file or pattern."
                     )
             else:  # Remote or looking into Mechanical working directory
-                if files in self_files:
-                    list_files = [files]
-                elif "*" in files:
-                    # try filter on the list_files
-                    if recursive:
-                        self.log_warning(
-                            "Because the 'recursive' keyword argument does not work with "
-                            "remote instances, it is ignored."
-                        )
-                    list_files = fnmatch.filter(self_files, files)
+                if "*" in files:
+                    if recursive and "**" in files:
+                        list_files = self.fs.glob(files, recursive=True, include_dirs=False)
+                    else:
+                        # "*" spans directories, as when filtering the listed files
+                        list_files = self.fs.match(files)
                     if not list_files:
                         raise ValueError(
                             f"The `'files'` parameter ({files}) didn't match any file using "
                             f"glob expressions in the remote server."
                         )
                 else:
-                    raise ValueError(
-                        f"The `'files'` parameter ('{files}') does not match any file or pattern."
-                    )
+                    try:
+                        stat = self.fs.stat(files)
+                    except FileNotFoundError:
+                        stat = None
+                    if stat is None or stat.is_dir:
+                        raise ValueError(
+                            f"The `'files'` parameter ('{files}') does not match any file "
+                            "or pattern."
+                        )
+                    list_files = [stat.path]
 
         elif isinstance(files, (list, tuple)):
             if not all([isinstance(each, str) for each in files]):
@@ -1514,6 +2310,8 @@ for dirPath, _, fileNames in os.walk(rootDir):
         chunk_size=DEFAULT_CHUNK_SIZE,
         progress_bar=None,
         recursive=False,
+        resume=False,
+        compression=None,
     ):  # pragma: no cover
         """Download files from the working directory of the Mechanical instance.
 
@@ -1540,6 +2338,19 @@ for dirPath, _, fileNames in os.walk(rootDir):
             progress.
         recursive : bool, optional
             Whether to use recursion when using a glob pattern search. The default is ``False``.
+            On a remote server, a pattern without ``**`` is matched against the full path of
+            every file of the project, so ``*.rst`` finds the result files in subdirectories
+            whatever the value of this parameter.
+        resume : bool, optional
+            Whether to continue the downloads that stopped before the end. The default is
+            ``False``. The bytes received are always written to a local file with the
+            ``.part`` suffix, which is renamed when the download is complete. When this
+            parameter is ``True``, only the bytes missing from this file are downloaded,
+            and the checksum of the complete file is verified.
+        compression : str or bool, optional
+            Compression of the downloads. The default is ``None``, in which case the
+            :attr:`compression` setting of the instance is used. Use ``False`` to
+            download the files as they are.
 
         Returns
         -------
@@ -1550,11 +2361,15 @@ for dirPath, _, fileNames in os.walk(rootDir):
         -----
         There are some considerations to keep in mind when using the ``download()`` method:
 
-        * The glob pattern search does not search recursively in remote instances.
+        * In a remote instance, relative paths and glob patterns are resolved on the
+          server against the project directory, and ``**`` matches subdirectories
+          when ``recursive=True``.
         * In a remote instance, it is not possible to list or download files in a
           location other than the Mechanical working directory.
         * If you are connected to a local instance and provide a file path, downloading files
           from a different folder is allowed but is not recommended.
+        * When the :attr:`cache` property is set, the files already in the local
+          cache are not transferred.
 
         Examples
         --------
@@ -1570,6 +2385,10 @@ for dirPath, _, fileNames in os.walk(rootDir):
 
         >>> local_file_path_list = mechanical.download("*.*")
 
+        Continue a download that was interrupted.
+
+        >>> local_file_path_list = mechanical.download("file.rst", resume=True)
+
         Alternatively, the recommended method is to use the
         :func:`download_project() <ansys.mechanical.core.mechanical.Mechanical.download_project>`
         method to download all files.
@@ -1602,12 +2421,13 @@ for dirPath, _, fileNames in os.walk(rootDir):
                 # to do `os.path.join(target_dir"os.getcwd()", file_name "full filename path"`
                 # This produces the file structure to flat out, but it is fine,
                 # because recursive does not work in remote.
-                self._busy = True
                 out_file_path = self._download(
                     each_file,
                     out_file_name=str(Path(target_dir) / file_name),
                     chunk_size=chunk_size,
                     progress_bar=progress_bar,
+                    resume=resume,
+                    compression=compression,
                 )
                 out_files.append(out_file_path)
             except FileNotFoundError:
@@ -1618,8 +2438,6 @@ for dirPath, _, fileNames in os.walk(rootDir):
                 # `mechanical.list_files()`, they do exist, so
                 # if there is any error, it means their size is zero.
                 pass  # This is not the best.
-            finally:
-                self._busy = False
 
         return out_files
 
@@ -1630,6 +2448,8 @@ for dirPath, _, fileNames in os.walk(rootDir):
         out_file_name,
         chunk_size=DEFAULT_CHUNK_SIZE,
         progress_bar=None,
+        resume=False,
+        compression=None,
     ):
         """Download a file from the Mechanical instance.
 
@@ -1649,6 +2469,20 @@ for dirPath, _, fileNames in os.walk(rootDir):
             Whether to show a progress bar using  ``tqdm``. The default is ``None``, in
             which case a progress bar is shown. A progress bar is helpful for showing download
             progress.
+        resume : bool, optional
+            Whether to download only the bytes missing from the local file with the
+            ``.part`` suffix and verify the checksum of the complete file. The default
+            is ``False``.
+        compression : str or bool, optional
+            Compression of the download. The default is ``None``, in which case the
+            :attr:`compression` setting of the instance is used. Use ``False`` to
+            download the file as it is. The end of a resumed download is not
+            compressed.
+
+        Raises
+        ------
+        OSError
+            If the checksum of the downloaded file does not match the remote file.
 
         Examples
         --------
@@ -1661,22 +2495,214 @@ for dirPath, _, fileNames in os.walk(rootDir):
         if not progress_bar and _HAS_TQDM:
             progress_bar = True
 
-        request = mechanical_pb2.FileDownloadRequest(file_path=target_name, chunk_size=chunk_size)
-
-        responses = self._stub.DownloadFile(request)
+        digest = None
+        if self._cache is not None:
+            info = self._run_transfer_script(
+                "download_status", file_info_script(target_name, checksum=True)
+            )
+            digest = info["sha256"]
+            if digest is not None and self._cache.fetch(digest, out_file_name):
+                self.log_info(f"{out_file_name} has been taken from the download cache.")
+                return out_file_name
+
+        part = part_path(out_file_name)
+        offset = part.stat().st_size if resume and part.is_file() else 0
+        source = target_name
+        original_size = None
+        mode = self._compression_mode(compression)
+        if offset:
+            remote_size = self._run_transfer_script(
+                "download_status", file_info_script(target_name)
+            )["size"]
+            if offset > remote_size:
+                # The partial file does not belong to this file
+                offset = 0
+            elif offset < remote_size:
+                self.log_info(f"Resuming the download of '{target_name}' at byte {offset}.")
+                source = target_name + SEGMENT_SUFFIX
+                self._run_transfer_script(
+                    "download_status", copy_tail_script(target_name, source, offset)
+                )
+        elif mode == "gzip" or (
+            mode == "auto" and should_compress(target_name, DEFAULT_MIN_COMPRESS_SIZE)
+        ):
+            source = target_name + GZIP_SUFFIX
+            info = self._run_transfer_script(
+                "download_compress",
+                compress_file_script(
+                    target_name, source, DEFAULT_MIN_COMPRESS_SIZE if mode == "auto" else 0
+                ),
+            )
+            if info["compressed"]:
+                original_size = info["original_size"]
+            else:
+                source = target_name
 
-        file_size = self.save_chunks_to_file(
-            responses, out_file_name, progress_bar=progress_bar, target_name=target_name
-        )
+        file_size = 0
+        if not offset or source != target_name:
+            request = mechanical_pb2.FileDownloadRequest(file_path=source, chunk_size=chunk_size)
+            try:
+                with self._scheduler.transfer(), self._track("download") as record:
+                    responses = self._stub.DownloadFile(request)
+                    if original_size is not None:
+                        responses = gunzip_responses(responses, original_size, record)
+
+                    file_size = self.save_chunks_to_file(
+                        responses,
+                        part,
+                        progress_bar=progress_bar,
+                        target_name=target_name,
+                        append=bool(offset),
+                    )
+                    if original_size is None:
+                        record.bytes_received = file_size
+                    else:
+                        record.bytes_uncompressed = file_size
+                    record.chunks_received = -(-record.bytes_received // chunk_size)
+            finally:
+                if source != target_name:
+                    self._run_transfer_script("download_status", remove_file_script(source))
+        file_size += offset
 
         if not file_size:  # pragma: no cover
+            part.unlink(missing_ok=True)
             raise FileNotFoundError(f'File "{out_file_name}" is empty or does not exist')
 
+        if resume:
+            if digest is None:
+                digest = self._run_transfer_script(
+                    "download_verify", file_info_script(target_name, checksum=True)
+                )["sha256"]
+            if digest != local_sha256(part):
+                part.unlink()
+                raise OSError(
+                    f'The checksum of the downloaded file "{out_file_name}" does not match.'
+                )
+        part.replace(out_file_name)
+        if self._cache is not None and digest is not None:
+            self._cache.add(digest, out_file_name)
+
         self.log_info(f"{out_file_name} with size {file_size} has been written.")
 
         return out_file_name
 
-    def save_chunks_to_file(self, responses, filename, progress_bar=False, target_name=""):
+    def _stream_chunks(self, remote_path, chunk_size, call=None):
+        """Download a file chunk by chunk, holding a transfer slot until it is closed.
+
+        The gRPC call is set on ``call``, a :class:`StreamCall`, so that another
+        thread can cancel it.
+        """
+        request = mechanical_pb2.FileDownloadRequest(file_path=remote_path, chunk_size=chunk_size)
+        transfer = start_transfer(
+            self._progress, f"{self._channel_str}:{remote_path}", None, "download"
+        )
+        with self._scheduler.transfer(), self._track("download_stream") as record:
+            responses = self._stub.DownloadFile(request)
+            if call is not None:
+                call.set(responses)
+            try:
+                for response in responses:
+                    payload = response.chunk.payload
+                    record.bytes_received += len(payload)
+                    record.chunks_received += 1
+                    if transfer is not None:
+                        if transfer.total is None:
+                            transfer.total = response.file_size
+                        transfer.update(len(payload))
+                    yield payload
+            finally:
+                if transfer is not None:
+                    transfer.finish()
+                cancel = getattr(responses, "cancel", None)
+                if cancel is not None:
+                    # Release the stream of a consumer that stopped early
+                    cancel()
+
+    def iter_chunks(
+        self,
+        remote_path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+    ) -> ReadAhead:
+        """Iterate over the chunks of a server file without writing it to disk.
+
+        A background thread receives the next chunks while the current one is
+        processed. At most ``read_ahead`` chunks are held in memory.
+
+        Parameters
+        ----------
+        remote_path : str
+            Path of the file on the server.
+        chunk_size : int, optional
+            Chunk size in bytes. The default is ``"DEFAULT_CHUNK_SIZE"``, in which case
+            256 kB is used. The value must be less than 4 MB.
+        read_ahead : int, optional
+            Maximum number of chunks received before they are consumed. The default
+            is ``4``.
+
+        Returns
+        -------
+        ReadAhead
+            Iterator over the chunks as ``bytes``. Call its ``close()`` method, or use
+            it as a context manager, to stop the download early. The download also
+            stops when the iterator is garbage collected.
+
+        Examples
+        --------
+        Compute the checksum of a result file while it is downloaded.
+
+        >>> import hashlib
+        >>> digest = hashlib.sha256()
+        >>> with mechanical.iter_chunks("file.rst") as chunks:
+        ...     for chunk in chunks:
+        ...         digest.update(chunk)
+        """
+        self.verify_valid_connection()
+        call = StreamCall()
+        chunks = self._stream_chunks(remote_path, chunk_size, call=call)
+        return ReadAhead(chunks, depth=read_ahead, call=call)
+
+    def open_remote(
+        self,
+        remote_path: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+    ) -> io.BufferedReader:
+        """Open a server file as a readable binary stream without writing it to disk.
+
+        The stream reads the file as it is downloaded, as with :meth:`iter_chunks`,
+        so it can only be read forward.
+
+        Parameters
+        ----------
+        remote_path : str
+            Path of the file on the server.
+        chunk_size : int, optional
+            Chunk size in bytes. The default is ``"DEFAULT_CHUNK_SIZE"``, in which case
+            256 kB is used. The value must be less than 4 MB.
+        read_ahead : int, optional
+            Maximum number of chunks received before they are read. The default is ``4``.
+
+        Returns
+        -------
+        io.BufferedReader
+            Binary stream of the file. Closing it stops the download.
+
+        Examples
+        --------
+        Read the lines of the solver output without saving it locally.
+
+        >>> import io
+        >>> with mechanical.open_remote("solve.out") as stream:
+        ...     for line in io.TextIOWrapper(stream, encoding="utf-8"):
+        ...         print(line, end="")
+        """
+        chunks = self.iter_chunks(remote_path, chunk_size=chunk_size, read_ahead=read_ahead)
+        return io.BufferedReader(ChunkReader(chunks), buffer_size=chunk_size)
+
+    def save_chunks_to_file(
+        self, responses, filename, progress_bar=False, target_name="", append=False
+    ):
         """Save chunks to a local file.
 
         Parameters
@@ -1690,50 +2716,52 @@ for dirPath, _, fileNames in os.walk(rootDir):
             Name of the target file on the server. The default is ``""``. The file
             must be in the same directory as the Mechanical instance. You can use the
             ``mechanical.list_files()`` function to list current files.
+        append : bool, optional
+            Whether to append the chunks to the file instead of overwriting it. The
+            default is ``False``.
 
         Returns
         -------
         file_size : int
             File size saved in bytes.  If ``0`` is returned, no file was written.
         """
-        pbar = None
-        if progress_bar:
-            if not _HAS_TQDM:  # pragma: no cover
-                raise ModuleNotFoundError(
-                    "To use the keyword argument 'progress_bar', you need to have installed "
-                    "the 'tqdm' package.To avoid this message you can set 'progress_bar=False'."
-                )
-
         file_size = 0
         filename = Path(filename)
-        with filename.open("wb") as f:
-            for response in responses:
-                f.write(response.chunk.payload)
-                payload_size = len(response.chunk.payload)
-                file_size += payload_size
-                if pbar is None:
-                    pbar = tqdm(
-                        total=response.file_size,
-                        desc=f"Downloading {self._channel_str}:{target_name} to {filename}",
-                        unit="B",
-                        unit_scale=True,
-                        unit_divisor=1024,
-                    )
-                    pbar.update(payload_size)
-                else:
-                    pbar.update(payload_size)
-
-        if pbar is not None:
-            pbar.close()
+        transfer = start_transfer(
+            self._progress,
+            f"{self._channel_str}:{target_name} to {filename}",
+            None,
+            "download",
+            progress_bar,
+        )
+        try:
+            with filename.open("ab" if append else "wb") as f:
+                for response in responses:
+                    f.write(response.chunk.payload)
+                    payload_size = len(response.chunk.payload)
+                    file_size += payload_size
+                    if transfer is not None:
+                        if transfer.total is None:
+                            transfer.total = response.file_size
+                        transfer.update(payload_size)
+        finally:
+            if transfer is not None:
+                transfer.finish()
 
         return file_size
 
-    def download_project(self, extensions=None, target_dir=None, progress_bar=False):
+    def download_project(
+        self, extensions=None, target_dir=None, progress_bar=False, archive=False, compression=None
+    ):
         """Download all project files in the working directory of the Mechanical instance.
 
         It downloads them from the working directory to the target directory. It returns the list
         of local file paths for the downloaded files.
 
+        By default, each file is downloaded by a separate call. For projects with many
+        small files, use ``archive=True``, with which the server packs the files into
+        one tar archive that is unpacked as it arrives.
+
         Parameters
         ----------
         extensions : list[str], tuple[str], optional
@@ -1744,6 +2772,14 @@ for dirPath, _, fileNames in os.walk(rootDir):
         progress_bar : bool, optional
             Whether to show a progress bar using ``tqdm``. The default is ``False``.
             A progress bar is helpful for viewing download progress.
+        archive : bool, optional
+            Whether to download the files as a single tar archive. The default is ``False``.
+        compression : str or bool, optional
+            Compression of the archive. The default is ``None``, in which case the
+            :attr:`compression` setting of the instance is used. The archive is
+            compressed with gzip for the ``"auto"`` and ``"gzip"`` settings. Use
+            ``False`` to download it as it is. This argument is ignored without
+            ``archive=True``.
 
         Returns
         -------
@@ -1755,6 +2791,12 @@ for dirPath, _, fileNames in os.walk(rootDir):
         Download all the files in the project.
 
         >>> local_file_path_list = mechanical.download_project()
+
+        Download the result and log files of a project as one compressed archive.
+
+        >>> mechanical.download_project(
+        ...     extensions=["rst", "log"], target_dir="results", archive=True, compression="gzip"
+        ... )
         """
         destination_directory = target_dir.rstrip("\\/")
 
@@ -1806,10 +2848,19 @@ for dirPath, _, fileNames in os.walk(rootDir):
                     else:
                         list_files = list_files_expanded
                 else:
-                    list_files = self._get_files(file_temp, recursive=False)
+                    list_files = self._get_files(file_temp, recursive=True)
+                    if "mechdb" == each_extension.lower():
+                        # keep only the mechdb of the current project
+                        current_mechdb = self.run_python_script("ExtAPI.DataModel.Project.FilePath")
+                        list_files = [each for each in list_files if each == current_mechdb]
 
                 files.extend(list_files)
 
+        if archive:
+            return self._download_archive(
+                files, parent_directory, destination_directory, progress_bar, compression
+            )
+
         for file in files:
             # create similar hierarchy locally
             new_path = file.replace(parent_directory, destination_directory)
@@ -1821,6 +2872,39 @@ for dirPath, _, fileNames in os.walk(rootDir):
 
         return list_of_files
 
+    def _download_archive(self, files, root, target_dir, progress_bar, compression):
+        """Download server files as one tar archive and unpack it while it arrives."""
+        if not files:
+            return []
+        compress = self._compression_mode(compression) in ("auto", "gzip")
+        info = self._run_transfer_script(
+            "download_status", archive_files_script(root, files, compress=compress)
+        )
+        transfer = start_transfer(
+            self._progress,
+            f"{info['files']} files from {self._channel_str} to {target_dir}",
+            info["size"],
+            "download",
+            progress_bar,
+        )
+        request = mechanical_pb2.FileDownloadRequest(
+            file_path=info["path"], chunk_size=DEFAULT_CHUNK_SIZE
+        )
+        try:
+            with self._scheduler.transfer(), self._track("download_archive") as record:
+                reader = ChunkReader(
+                    (response.chunk.payload for response in self._stub.DownloadFile(request)),
+                    record,
+                    callback=transfer.update if transfer is not None else None,
+                )
+                paths = extract_archive(reader, target_dir)
+                record.bytes_uncompressed = info["original_size"]
+        finally:
+            if transfer is not None:
+                transfer.finish()
+            self._run_transfer_script("download_status", remove_file_script(info["path"]))
+        return [str(path) for path in paths]
+
     def clear(self):
         """Clear the database.
 
@@ -1871,6 +2955,11 @@ for dirPath, _, fileNames in os.walk(rootDir):
         log_level,
         progress_interval,
         run_python_api_version: int,
+        priority: int = 0,
+        call_record: CallRecord | None = None,
+        correlation_id: str | None = None,
+        server_script: str | None = None,
+        journal: bool = True,
     ):
         """Run the Python script block on the server.
 
@@ -1885,6 +2974,17 @@ for dirPath, _, fileNames in os.walk(rootDir):
             and ``"ERROR"``.
         timeout: int, optional
             Frequency in milliseconds for getting log messages from the server.
+        priority: int, optional
+            Priority of the script in the queue of this instance. Lower values run first.
+        call_record: CallRecord, optional
+            Record that counts the messages received from the server.
+        correlation_id: str, optional
+            ID defined in the script preamble and added to the server log messages.
+        server_script: str, optional
+            Script sent to the server in place of the script block, such as the
+            profiling wrapper of the script block.
+        journal: bool, optional
+            Whether to write the script block to the Mechanical log file.
 
         Returns
         -------
@@ -1892,45 +2992,82 @@ for dirPath, _, fileNames in os.walk(rootDir):
             Script result.
 
         """
-        log_level_server = self.convert_to_server_log_level(log_level)
-        request = mechanical_pb2.RunScriptRequest()
-        request.script_code = script_code
-        request.enable_logging = enable_logging
-        request.logger_severity = log_level_server
-        request.progress_interval = progress_interval
-        request.python_behavior = run_python_api_version
+        request = self._script_request(
+            server_script or script_code,
+            enable_logging,
+            log_level,
+            progress_interval,
+            run_python_api_version,
+            correlation_id,
+        )
 
         result = ""
-        self._busy = True
 
-        try:
-            for runscript_response in self._stub.RunPythonScript(request):
-                if runscript_response.log_info == "__done__":
-                    result = runscript_response.script_result
-                    break
-                else:
+        with self._scheduler.script(priority):
+            start = time.time()
+            began = time.perf_counter()
+            try:
+                for runscript_response in self._stub.RunPythonScript(
+                    request, **self._call_options(len(request.script_code))
+                ):
+                    if call_record is not None:
+                        call_record.chunks_received += 1
+                    if runscript_response.log_info == "__done__":
+                        result = runscript_response.script_result
+                        break
+                    else:
+                        if enable_logging:
+                            message = runscript_response.log_info
+                            if correlation_id is not None:
+                                message = f"[{correlation_id}] {message}"
+                            self._server_logs.put(log_level, message)
+            except grpc.RpcError as error:
+                # For the given script, return value cannot be converted to string.
+                if self._is_result_conversion_error(error):
                     if enable_logging:
-                        self.log_message(log_level, runscript_response.log_info)
-        except grpc.RpcError as error:
-            error_info = error.details()
-            error_info_lower = error_info.lower()
-            # For the given script, return value cannot be converted to string.
-            if (
-                "the expected result" in error_info_lower
-                and "cannot be return via this API." in error_info
-            ):
-                if enable_logging:
-                    self.log_debug(f"Ignoring the conversion error.{error_info}")
-                result = ""
-            else:
-                raise
-        finally:
-            self._busy = False
+                        self.log_debug(f"Ignoring the conversion error.{error.details()}")
+                    result = ""
+                else:
+                    raise
+            duration = time.perf_counter() - began
 
-        self._log_mechanical_script(script_code)
+        if enable_logging:
+            # Hand the messages of the script to the handlers before returning its result
+            self._server_logs.flush(SERVER_LOG_FLUSH_TIMEOUT)
+        if journal:
+            self._log_mechanical_script(script_code, start, duration)
 
         return result
 
+    def _script_request(
+        self,
+        script_code,
+        enable_logging,
+        log_level,
+        progress_interval,
+        run_python_api_version,
+        correlation_id=None,
+    ):
+        """Build the request that runs a script on the server."""
+        request = mechanical_pb2.RunScriptRequest()
+        request.script_code = script_code
+        if correlation_id is not None:
+            request.script_code = add_correlation_preamble(script_code, correlation_id)
+        request.enable_logging = enable_logging
+        request.logger_severity = self.convert_to_server_log_level(log_level)
+        request.progress_interval = progress_interval
+        request.python_behavior = run_python_api_version
+        return request
+
+    @staticmethod
+    def _is_result_conversion_error(error):
+        """Whether the server failed to convert the script result to a string."""
+        error_info = error.details() or ""
+        return (
+            "the expected result" in error_info.lower()
+            and "cannot be return via this API." in error_info
+        )
+
     def log_message(self, log_level, message):
         """Log the message using the given log level.
 
@@ -2001,16 +3138,18 @@ for dirPath, _, fileNames in os.walk(rootDir):
         """Whether Mechanical already exited."""
         return self._exited
 
-    def _log_mechanical_script(self, script_code):
+    def _log_mechanical_script(self, script_code, start=None, duration=None):
+        """Queue a script for the journal set by ``log_mechanical``."""
         if self._disable_logging:
             return
 
         if self._log_file_mechanical:
-            log_file_path = Path(self._log_file_mechanical)
             try:
-                with log_file_path.open("a", encoding="utf-8") as file:
-                    file.write(script_code)
-                    file.write("\n")
+                if self._journal is None:
+                    with self._journal_lock:
+                        if self._journal is None:
+                            self._journal = ScriptJournal(self._log_file_mechanical)
+                self._journal.write(script_code, start, duration)
             except OSError as e:  # pragma: no cover
                 self.log_warning(f"I/O error({e.errno}): {e.strerror}")
             except Exception as e:  # pragma: no cover
@@ -2267,6 +3406,7 @@ def launch_remote_mechanical(
     return channel, instance
 
 
+@traced("launch_mechanical")
 def launch_mechanical(
     allow_input=True,
     exec_file=None,
@@ -2292,6 +3432,8 @@ def launch_mechanical(
     grpc_options=None,
     start_license=None,
     read_only=False,
+    reuse_channel=False,
+    subchannels=1,
 ) -> Mechanical:
     """Start Mechanical locally.
 
@@ -2388,6 +3530,12 @@ def launch_mechanical(
         This parameter is only used when ``start_instance`` is ``True``.
     read_only : bool, optional
         Whether to start Mechanical in read-only mode. The default is ``False``.
+    reuse_channel : bool, optional
+        Whether to reuse a gRPC channel from the process-wide channel cache when
+        ``start_instance`` is ``False``. The default is ``False``.
+    subchannels : int, optional
+        Number of channels to spread sessions over when ``reuse_channel=True``.
+        The default is ``1``.
 
     Returns
     -------
@@ -2529,6 +3677,8 @@ def launch_mechanical(
             transport_mode=transport_mode,
             certs_dir=certs_dir,
             grpc_options=grpc_options,
+            reuse_channel=reuse_channel,
+            subchannels=subchannels,
             local=False,
         )
         if clear_on_connect:
@@ -2645,6 +3795,8 @@ def connect_to_mechanical(
     transport_mode=None,
     certs_dir=None,
     grpc_options=None,
+    reuse_channel=True,
+    subchannels=1,
 ) -> Mechanical:
     """Connect to an existing Mechanical server instance.
 
@@ -2704,6 +3856,13 @@ def connect_to_mechanical(
         Additional gRPC channel options to pass when creating the channel.
         For example: ``[("grpc.default_authority", "localhost")]``.
         See gRPC documentation for available options. The default is ``None``.
+    reuse_channel : bool, optional
+        Whether to reuse an open gRPC channel to the same server from the process-wide
+        :data:`~ansys.mechanical.core.channels.CHANNEL_CACHE`. Reusing a channel avoids
+        a new connection and TLS handshake for each session. The default is ``True``.
+    subchannels : int, optional
+        Number of channels to spread the sessions to the same server over. The
+        default is ``1``.
 
     Returns
     -------
@@ -2736,4 +3895,6 @@ def connect_to_mechanical(
         transport_mode=transport_mode,
         certs_dir=certs_dir,
         grpc_options=grpc_options,
+        reuse_channel=reuse_channel,
+        subchannels=subchannels,
     )
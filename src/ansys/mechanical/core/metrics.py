@@ -0,0 +1,558 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Client-side metrics for the calls made to Mechanical."""
+
+from bisect import bisect_left
+from contextlib import contextmanager
+import threading
+import time
+
+LATENCY_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+    1800.0,
+)
+"""Upper bounds in seconds of the latency histogram buckets."""
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    """Format labels in the Prometheus text format."""
+    if not labels:
+        return ""
+    items = []
+    for name, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        items.append(f'{name}="{value}"')
+    return "{" + ",".join(items) + "}"
+
+
+class Histogram:
+    """Counts observations in cumulative buckets, like a Prometheus histogram.
+
+    Parameters
+    ----------
+    buckets : tuple[float], optional
+        Upper bounds of the buckets. The default is ``LATENCY_BUCKETS``.
+
+    Examples
+    --------
+    >>> from ansys.mechanical.core.metrics import Histogram
+    >>> histogram = Histogram()
+    >>> histogram.observe(0.2)
+    >>> histogram.count
+    1
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        """Initialize the histogram."""
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add an observation to the histogram.
+
+        Examples
+        --------
+        >>> histogram.observe(0.2)
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def merge(self, other: "Histogram") -> None:
+        """Add the observations of another histogram with the same buckets.
+
+        Examples
+        --------
+        >>> histogram.merge(other_histogram)
+        """
+        if other.buckets != self.buckets:
+            raise ValueError("Cannot merge histograms with different buckets.")
+        self.counts = [mine + theirs for mine, theirs in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile from the buckets.
+
+        The estimate is the upper bound of the bucket that holds the quantile,
+        capped by the largest observation.
+
+        Examples
+        --------
+        >>> histogram.quantile(0.99)
+        0.25
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self) -> dict:
+        """Get the histogram as a dictionary.
+
+        Examples
+        --------
+        >>> histogram.as_dict()["count"]
+        1
+        """
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "buckets": buckets,
+        }
+
+    def to_prometheus(self, name: str, labels: dict[str, str] | None = None) -> list[str]:
+        """Get the histogram samples in the Prometheus text format.
+
+        Examples
+        --------
+        >>> histogram.to_prometheus("pymechanical_call_duration_seconds")
+        """
+        labels = labels or {}
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_format_labels({**labels, 'le': bound})} {cumulative}")
+        lines.append(f"{name}_bucket{_format_labels({**labels, 'le': '+Inf'})} {self.count}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {self.sum}")
+        lines.append(f"{name}_count{_format_labels(labels)} {self.count}")
+        return lines
+
+
+class CallRecord:
+    """Holds the counters of a single call while it runs.
+
+    Instrumented code fills in the transferred bytes and chunks. The record is
+    added to the metrics when the call finishes. When the payload is compressed,
+    ``bytes_uncompressed`` holds its size before compression. Otherwise, it is left
+    at ``0`` and the transferred bytes are counted instead.
+    """
+
+    __slots__ = (
+        "operation",
+        "bytes_sent",
+        "bytes_received",
+        "bytes_uncompressed",
+        "chunks_sent",
+        "chunks_received",
+    )
+
+    def __init__(self, operation: str):
+        """Initialize the call record."""
+        self.operation = operation
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.bytes_uncompressed = 0
+        self.chunks_sent = 0
+        self.chunks_received = 0
+
+
+class OperationStats:
+    """Aggregates the records of one kind of call."""
+
+    COUNTERS = (
+        "calls",
+        "errors",
+        "bytes_sent",
+        "bytes_received",
+        "bytes_uncompressed",
+        "chunks_sent",
+        "chunks_received",
+    )
+
+    def __init__(self):
+        """Initialize the statistics."""
+        self.latency = Histogram()
+        self.calls = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.bytes_uncompressed = 0
+        self.chunks_sent = 0
+        self.chunks_received = 0
+
+    def add(self, record: CallRecord, duration: float, failed: bool) -> None:
+        """Add a finished call."""
+        self.latency.observe(duration)
+        self.calls += 1
+        self.errors += int(failed)
+        self.bytes_sent += record.bytes_sent
+        self.bytes_received += record.bytes_received
+        self.bytes_uncompressed += record.bytes_uncompressed or (
+            record.bytes_sent + record.bytes_received
+        )
+        self.chunks_sent += record.chunks_sent
+        self.chunks_received += record.chunks_received
+
+    def merge(self, other: "OperationStats") -> None:
+        """Add the statistics of another instance."""
+        self.latency.merge(other.latency)
+        for counter in self.COUNTERS:
+            setattr(self, counter, getattr(self, counter) + getattr(other, counter))
+
+    @property
+    def compression_ratio(self) -> float:
+        """Ratio of the payload size before compression to the transferred bytes."""
+        transferred = self.bytes_sent + self.bytes_received
+        if not transferred:
+            return 1.0
+        return self.bytes_uncompressed / transferred
+
+    def as_dict(self) -> dict:
+        """Get the statistics as a dictionary."""
+        result = {counter: getattr(self, counter) for counter in self.COUNTERS}
+        result["compression_ratio"] = self.compression_ratio
+        result["latency"] = self.latency.as_dict()
+        return result
+
+
+class ClientMetrics:
+    """Collects per-call metrics for a Mechanical client.
+
+    Each instrumented call records its latency, the bytes and chunks that it sends
+    and receives, and whether it failed. The metrics are grouped by operation, such
+    as ``run_python_script`` or ``upload``.
+
+    Parameters
+    ----------
+    labels : dict, optional
+        Labels added to every sample when exporting in the Prometheus text format.
+        The default is ``None``.
+
+    Examples
+    --------
+    Read the metrics of a Mechanical instance.
+
+    >>> mechanical = Mechanical(enable_metrics=True)
+    >>> mechanical.run_python_script("2+3")
+    >>> mechanical.metrics.as_dict()["run_python_script"]["calls"]
+    1
+    """
+
+    def __init__(self, labels: dict[str, str] | None = None):
+        """Initialize the metrics."""
+        self.labels = dict(labels or {})
+        self._lock = threading.Lock()
+        self._operations: dict[str, OperationStats] = {}
+
+    @contextmanager
+    def track(self, operation: str):
+        """Time the ``with`` block and add it to the metrics of an operation.
+
+        Parameters
+        ----------
+        operation : str
+            Name of the operation.
+
+        Yields
+        ------
+        CallRecord
+            Record in which the instrumented code stores the transferred bytes and chunks.
+
+        Examples
+        --------
+        >>> with metrics.track("upload") as record:
+        ...     record.bytes_sent += 1024
+        """
+        record = CallRecord(operation)
+        failed = False
+        start = time.perf_counter()
+        try:
+            yield record
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            duration = time.perf_counter() - start
+            with self._lock:
+                stats = self._operations.setdefault(operation, OperationStats())
+                stats.add(record, duration, failed)
+
+    def operations(self) -> dict[str, OperationStats]:
+        """Get a copy of the statistics of each operation.
+
+        Examples
+        --------
+        >>> metrics.operations()["upload"].calls
+        1
+        """
+        with self._lock:
+            copies = {}
+            for operation, stats in self._operations.items():
+                copies[operation] = OperationStats()
+                copies[operation].merge(stats)
+            return copies
+
+    def reset(self) -> None:
+        """Clear all recorded metrics.
+
+        Examples
+        --------
+        >>> metrics.reset()
+        """
+        with self._lock:
+            self._operations.clear()
+
+    def as_dict(self) -> dict:
+        """Get the metrics as a dictionary keyed by operation.
+
+        Examples
+        --------
+        >>> metrics.as_dict()["upload"]["bytes_sent"]
+        1024
+        """
+        return {operation: stats.as_dict() for operation, stats in self.operations().items()}
+
+    def to_prometheus(self, prefix: str = "pymechanical_client") -> str:
+        """Export the metrics in the Prometheus text exposition format.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            Prefix of the metric names. The default is ``"pymechanical_client"``.
+
+        Examples
+        --------
+        >>> print(mechanical.metrics.to_prometheus())
+        """
+        return "\n".join(prometheus_lines([(self.labels, self.operations())], prefix)) + "\n"
+
+
+def merge_operations(*collections: dict[str, OperationStats]) -> dict[str, OperationStats]:
+    """Merge the per-operation statistics of several clients.
+
+    Examples
+    --------
+    >>> from ansys.mechanical.core.metrics import merge_operations
+    >>> totals = merge_operations(first.operations(), second.operations())
+    """
+    merged: dict[str, OperationStats] = {}
+    for operations in collections:
+        for operation, stats in operations.items():
+            merged.setdefault(operation, OperationStats()).merge(stats)
+    return merged
+
+
+def prometheus_lines(
+    sources: list[tuple[dict[str, str], dict[str, OperationStats]]], prefix: str
+) -> list[str]:
+    """Format the statistics of several labelled sources in the Prometheus text format.
+
+    Examples
+    --------
+    >>> from ansys.mechanical.core.metrics import prometheus_lines
+    >>> lines = prometheus_lines([({"instance": "a"}, metrics.operations())], "pymechanical")
+    """
+    lines = [
+        f"# HELP {prefix}_call_duration_seconds Latency of the client calls.",
+        f"# TYPE {prefix}_call_duration_seconds histogram",
+    ]
+    for labels, operations in sources:
+        for operation, stats in sorted(operations.items()):
+            lines.extend(
+                stats.latency.to_prometheus(
+                    f"{prefix}_call_duration_seconds", {**labels, "operation": operation}
+                )
+            )
+    for counter in OperationStats.COUNTERS:
+        lines.append(f"# TYPE {prefix}_{counter}_total counter")
+        for labels, operations in sources:
+            for operation, stats in sorted(operations.items()):
+                sample_labels = _format_labels({**labels, "operation": operation})
+                lines.append(f"{prefix}_{counter}_total{sample_labels} {getattr(stats, counter)}")
+    return lines
+
+
+class PoolMetrics:
+    """Rolls up the metrics of the instances in a pool.
+
+    On top of the per-instance client metrics, the pool records how long each job
+    waits for an available instance and how long each instance spends running jobs.
+
+    Parameters
+    ----------
+    instances : Callable
+        Function that returns the current ``(index, instance)`` pairs of the pool.
+
+    Examples
+    --------
+    >>> pool = LocalMechanicalPool(2, enable_metrics=True)
+    >>> pool.map(func, inputs)
+    >>> pool.metrics.as_dict()["utilization"]
+    {'0': 0.82, '1': 0.79}
+    """
+
+    def __init__(self, instances):
+        """Initialize the pool metrics."""
+        self._instances = instances
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self.queue_wait = Histogram()
+        self._busy_seconds: dict[str, float] = {}
+        self._jobs: dict[str, int] = {}
+
+    def record_wait(self, seconds: float) -> None:
+        """Record the time a job waited for an available instance.
+
+        Examples
+        --------
+        >>> pool.metrics.record_wait(0.5)
+        """
+        with self._lock:
+            self.queue_wait.observe(seconds)
+
+    @contextmanager
+    def track_job(self, index):
+        """Add the duration of the ``with`` block to the busy time of an instance.
+
+        Examples
+        --------
+        >>> with pool.metrics.track_job(0):
+        ...     pass
+        """
+        key = str(index)
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._busy_seconds[key] = self._busy_seconds.get(key, 0.0) + (
+                    time.monotonic() - start
+                )
+                self._jobs[key] = self._jobs.get(key, 0) + 1
+
+    def _client_sources(self) -> list[tuple[dict[str, str], dict[str, OperationStats]]]:
+        """Get the labelled operations of each instance that records metrics."""
+        sources = []
+        for index, instance in self._instances():
+            metrics = getattr(instance, "metrics", None)
+            if metrics is not None:
+                sources.append(({"index": str(index)}, metrics.operations()))
+        return sources
+
+    def utilization(self) -> dict[str, float]:
+        """Get the fraction of time each instance spent running jobs.
+
+        Examples
+        --------
+        >>> pool.metrics.utilization()
+        {'0': 0.82, '1': 0.79}
+        """
+        elapsed = max(time.monotonic() - self._start, 1e-9)
+        with self._lock:
+            return {key: min(busy / elapsed, 1.0) for key, busy in self._busy_seconds.items()}
+
+    def as_dict(self) -> dict:
+        """Get the pool metrics as a dictionary.
+
+        The dictionary holds the queue wait histogram, the jobs and utilization of
+        each instance, the client metrics of each instance, and their totals.
+
+        Examples
+        --------
+        >>> pool.metrics.as_dict()["queue_wait"]["p99"]
+        0.01
+        """
+        sources = self._client_sources()
+        with self._lock:
+            queue_wait = self.queue_wait.as_dict()
+            jobs = dict(self._jobs)
+        return {
+            "queue_wait": queue_wait,
+            "jobs": jobs,
+            "utilization": self.utilization(),
+            "instances": {
+                labels["index"]: {op: stats.as_dict() for op, stats in operations.items()}
+                for labels, operations in sources
+            },
+            "totals": {
+                op: stats.as_dict()
+                for op, stats in merge_operations(*[ops for _, ops in sources]).items()
+            },
+        }
+
+    def to_prometheus(self, prefix: str = "pymechanical_pool") -> str:
+        """Export the pool metrics in the Prometheus text exposition format.
+
+        Parameters
+        ----------
+        prefix : str, optional
+            Prefix of the metric names. The default is ``"pymechanical_pool"``.
+
+        Examples
+        --------
+        >>> print(pool.metrics.to_prometheus())
+        """
+        with self._lock:
+            lines = [
+                f"# HELP {prefix}_queue_wait_seconds Time jobs wait for an available instance.",
+                f"# TYPE {prefix}_queue_wait_seconds histogram",
+                *self.queue_wait.to_prometheus(f"{prefix}_queue_wait_seconds"),
+                f"# TYPE {prefix}_jobs_total counter",
+                *[
+                    f"{prefix}_jobs_total{_format_labels({'index': key})} {count}"
+                    for key, count in sorted(self._jobs.items())
+                ],
+            ]
+        lines.append(f"# TYPE {prefix}_utilization_ratio gauge")
+        lines.extend(
+            f"{prefix}_utilization_ratio{_format_labels({'index': key})} {value}"
+            for key, value in sorted(self.utilization().items())
+        )
+        lines.extend(prometheus_lines(self._client_sources(), prefix))
+        return "\n".join(lines) + "\n"
@@ -22,6 +22,7 @@
 
 """Module for threaded implementations of the Mechanical interface."""
 
+from contextlib import nullcontext
 from pathlib import Path
 import time
 import warnings
@@ -37,7 +38,10 @@ from ansys.mechanical.core.mechanical import (
     launch_mechanical,
     port_in_use,
 )
+from ansys.mechanical.core.metrics import PoolMetrics
 from ansys.mechanical.core.misc import threaded, threaded_daemon
+from ansys.mechanical.core.progress import ProgressCallback, TransferMonitor, as_monitor
+from ansys.mechanical.core.tracing import TRACER, current_span
 
 if _HAS_TQDM:
     from tqdm import tqdm
@@ -96,6 +100,11 @@ class LocalMechanicalPool:
     restart_failed : bool, optional
         Whether to restart any failed instances in the pool. The default is
         ``True``.
+    enable_metrics : bool, optional
+        Whether to record client metrics on every instance and roll them up with
+        the queue wait times and the utilization of each instance. The metrics are
+        available from the :attr:`LocalMechanicalPool.metrics` property. The default
+        is ``False``.
     **kwargs : dict, optional
         Additional keyword arguments. For a list of all keyword
         arguments, use the :func:`ansys.mechanical.core.launch_mechanical`
@@ -142,6 +151,7 @@ class LocalMechanicalPool:
         port=MECHANICAL_DEFAULT_PORT,
         progress_bar=True,
         restart_failed=True,
+        enable_metrics=False,
         **kwargs,
     ):
         """Initialize several Mechanical instances.
@@ -162,6 +172,9 @@ class LocalMechanicalPool:
             is ``True``, but the progress bar is not shown when ``wait=False``.
         restart_failed : bool, optional
             Whether to restart any failed instances. The default is ``True``.
+        enable_metrics : bool, optional
+            Whether to record client metrics on every instance and roll them up
+            for the pool. The default is ``False``.
         **kwargs : dict, optional
             Additional keyword arguments. For a list of all additional keyword
             arguments, see the :func:`ansys.mechanical.core.launch_mechanical`
@@ -176,6 +189,12 @@ class LocalMechanicalPool:
         self._instances = []
         self._spawn_kwargs = kwargs
         self._remote = False
+        self._progress = None
+        self._metrics = None
+        if enable_metrics:
+            self._metrics = PoolMetrics(
+                lambda: [(i, inst) for i, inst in enumerate(self._instances) if inst]
+            )
 
         # Verify that Mechanical is 2023R2 or newer
         exec_file = None
@@ -355,7 +374,9 @@ class LocalMechanicalPool:
             pbar = tqdm(total=jobs_count, desc="Mechanical Running")
 
         @threaded_daemon
-        def func_wrapper(obj, func, clear_at_start, timeout, args=None, name=""):
+        def func_wrapper(
+            obj, func, clear_at_start, timeout, args=None, name="", index=None, parent_span=None
+        ):
             """Expect obj to be an instance of Mechanical."""
             LOG.debug(name)
             complete = [False]
@@ -364,16 +385,20 @@ class LocalMechanicalPool:
             def run(name_local=""):
                 LOG.debug(name_local)
 
-                if clear_at_start:
-                    obj.clear()
+                with (
+                    TRACER.span("pool.job", parent=parent_span, index=index),
+                    self._track_job(index),
+                ):
+                    if clear_at_start:
+                        obj.clear()
 
-                if args is not None:
-                    if isinstance(args, (tuple, list)):
-                        results.append(func(obj, *args))
+                    if args is not None:
+                        if isinstance(args, (tuple, list)):
+                            results.append(func(obj, *args))
+                        else:
+                            results.append(func(obj, args))
                     else:
-                        results.append(func(obj, args))
-                else:
-                    results.append(func(obj))
+                        results.append(func(obj))
 
                 complete[0] = True
 
@@ -406,19 +431,40 @@ class LocalMechanicalPool:
         if iterable is not None:
             for args in iterable:
                 # grab the next available instance of mechanical
-                instance, i = self.next_available(return_index=True)
-                instance.locked = True
+                wait_start = time.monotonic()
+                with TRACER.span("pool.dispatch") as dispatch_span:
+                    instance, i = self.next_available(return_index=True)
+                    instance.locked = True
+                    if dispatch_span is not None:
+                        dispatch_span.set_attribute("index", i)
+                if self._metrics is not None:
+                    self._metrics.record_wait(time.monotonic() - wait_start)
 
                 threads.append(
                     func_wrapper(
-                        instance, func, clear_at_start, timeout, args, name=f"Map_Thread{i}"
+                        instance,
+                        func,
+                        clear_at_start,
+                        timeout,
+                        args,
+                        name=f"Map_Thread{i}",
+                        index=i,
+                        parent_span=current_span(),
                     )
                 )
         else:  # simply apply to all
-            for instance in self._instances:
+            for i, instance in enumerate(self._instances):
                 if instance:
                     threads.append(
-                        func_wrapper(instance, func, clear_at_start, timeout, name="Map_Thread")
+                        func_wrapper(
+                            instance,
+                            func,
+                            clear_at_start,
+                            timeout,
+                            name="Map_Thread",
+                            index=i,
+                            parent_span=current_span(),
+                        )
                     )
 
         if close_when_finished:  # pragma: no cover
@@ -620,6 +666,50 @@ class LocalMechanicalPool:
             if instance:
                 yield instance
 
+    @property
+    def metrics(self) -> PoolMetrics | None:
+        """Metrics rolled up over the instances of the pool.
+
+        This property is ``None`` unless the pool is created with ``enable_metrics=True``.
+
+        Examples
+        --------
+        >>> pool = LocalMechanicalPool(4, enable_metrics=True)
+        >>> pool.map(function, inputs)
+        >>> pool.metrics.as_dict()["queue_wait"]["p90"]
+        0.25
+        """
+        return self._metrics
+
+    @property
+    def progress(self) -> TransferMonitor | None:
+        """Monitor shared by the instances of the pool for the progress of their transfers.
+
+        Its :meth:`aggregate <ansys.mechanical.core.progress.TransferMonitor.aggregate>`
+        method sums the concurrent transfers of all instances. The instances that
+        are restarted use the same monitor.
+
+        Examples
+        --------
+        >>> pool.progress = TransferMonitor(min_interval=1.0)
+        >>> pool.map(function, inputs)
+        >>> pool.progress.aggregate().rate
+        104857600.0
+        """
+        return self._progress
+
+    @progress.setter
+    def progress(self, progress: TransferMonitor | ProgressCallback | None):
+        self._progress = as_monitor(progress)
+        for instance in self:
+            instance.progress = self._progress
+
+    def _track_job(self, index):
+        """Track the busy time of an instance when metrics are enabled."""
+        if self._metrics is None or index is None:
+            return nullcontext()
+        return self._metrics.track_job(index)
+
     @threaded_daemon
     def _spawn_mechanical(self, index, port=None, pbar=None, name=""):
         """Spawn a Mechanical instance at an index.
@@ -636,7 +726,13 @@ class LocalMechanicalPool:
             Name for the instance. The default is ``""``.
         """
         LOG.debug(name)
-        self._instances[index] = launch_mechanical(port=port, **self._spawn_kwargs)
+        with TRACER.span("pool.spawn", index=index):
+            instance = launch_mechanical(port=port, **self._spawn_kwargs)
+        if self._metrics is not None:
+            instance.enable_metrics()
+        if self._progress is not None:
+            instance.progress = self._progress
+        self._instances[index] = instance
         # LOG.debug("Spawned instance %d. Name '%s'", index, name)
         if pbar is not None:
             pbar.update(1)
@@ -656,7 +752,13 @@ class LocalMechanicalPool:
 
         """
         LOG.debug(name)
-        self._instances[index] = launch_mechanical(**self._spawn_kwargs)
+        with TRACER.span("pool.spawn", index=index):
+            instance = launch_mechanical(**self._spawn_kwargs)
+        if self._metrics is not None:
+            instance.enable_metrics()
+        if self._progress is not None:
+            instance.progress = self._progress
+        self._instances[index] = instance
         # LOG.debug("Spawned instance %d. Name '%s'", index, name)
         if pbar is not None:
             pbar.update(1)
@@ -0,0 +1,304 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Profiling of the scripts that run inside Mechanical.
+
+A profiled script is wrapped in a server-side script that runs each top-level
+statement of the original script, times it, and, when the server runs CPython,
+profiles it with :mod:`cProfile`. The result of the original script is returned
+as usual, and the profile is kept on the server until the client fetches it with a
+second call.
+
+The wrapper and the fetch script are compatible with IronPython 2.7 and CPython.
+"""
+
+import ast
+import dataclasses
+import json
+import textwrap
+
+DEFAULT_MAX_ENTRIES = 50
+"""Default maximum number of profiled functions returned by the server."""
+
+_SCRIPT_FILENAME = "<pymechanical script>"
+
+_MAX_STORED_PROFILES = 16
+
+_PROFILE_WRAPPER = """import json as _pm_json
+import sys as _pm_sys
+import time as _pm_time
+_pm_clock = getattr(_pm_time, "perf_counter", None) or _pm_time.time
+try:
+    import cProfile as _pm_cprofile
+    import pstats as _pm_pstats
+    _pm_profiler = _pm_cprofile.Profile()
+except ImportError:
+    _pm_profiler = None
+_pm_statements = []
+_pm_functions = []
+_pymechanical_result = None
+_pm_start = _pm_clock()
+try:
+    for _pm_line, _pm_mode, _pm_source in _pm_json.loads(%(chunks)s):
+        _pm_code = compile("\\n" * (_pm_line - 1) + _pm_source, %(filename)s, _pm_mode)
+        _pm_began = _pm_clock()
+        if _pm_profiler is not None:
+            _pm_profiler.enable()
+        try:
+            if _pm_mode == "eval":
+                _pymechanical_result = eval(_pm_code, globals())
+            else:
+                exec(_pm_code, globals())
+        finally:
+            if _pm_profiler is not None:
+                _pm_profiler.disable()
+            _pm_statements.append([_pm_line, _pm_clock() - _pm_began])
+finally:
+    _pm_total = _pm_clock() - _pm_start
+    if _pm_profiler is not None:
+        for _pm_func, _pm_stat in _pm_pstats.Stats(_pm_profiler).stats.items():
+            # Skip the exec and eval calls of this wrapper
+            if _pm_func[0] == "~" and _pm_func[2].rstrip(">").split(".")[-1] in ("exec", "eval"):
+                continue
+            _pm_functions.append(list(_pm_func) + list(_pm_stat[:4]))
+        _pm_functions.sort(key=lambda entry: -entry[6])
+        del _pm_functions[%(max_entries)d:]
+    _pm_store = getattr(_pm_sys, "_pymechanical_profiles", None)
+    if _pm_store is None:
+        _pm_store = {}
+        _pm_sys._pymechanical_profiles = _pm_store
+    _pm_store[%(key)s] = _pm_json.dumps({
+        "created": _pm_start,
+        "total_time": _pm_total,
+        "profiler": "cProfile" if _pm_profiler is not None else "statements",
+        "statements": _pm_statements,
+        "functions": _pm_functions,
+    })
+    for _pm_old in sorted(_pm_store, key=lambda k: _pm_json.loads(_pm_store[k])["created"])[
+        :-%(max_stored)d
+    ]:
+        del _pm_store[_pm_old]
+%(result)s
+"""
+
+_FETCH_PROFILE = """import sys
+getattr(sys, "_pymechanical_profiles", {}).pop(%s, "null")
+"""
+
+
+@dataclasses.dataclass
+class StatementTiming:
+    """Time spent in a top-level statement of a profiled script."""
+
+    line: int
+    """Line of the statement in the script."""
+    source: str
+    """First line of the source of the statement."""
+    time: float
+    """Time spent in the statement in seconds."""
+
+
+@dataclasses.dataclass
+class FunctionTiming:
+    """Profile of a function called by a profiled script."""
+
+    function: str
+    """Name of the function."""
+    file: str
+    """File of the function."""
+    line: int
+    """Line of the function in its file."""
+    calls: int
+    """Number of calls, including the recursive ones."""
+    primitive_calls: int
+    """Number of calls that are not recursive."""
+    total_time: float
+    """Time spent in the function itself in seconds."""
+    cumulative_time: float
+    """Time spent in the function and the functions it calls in seconds."""
+
+
+@dataclasses.dataclass
+class ProfileResult:
+    """Result and profile of a script that ran inside Mechanical.
+
+    Examples
+    --------
+    >>> profile = mechanical.run_python_script(script, profile=True)
+    >>> profile.result
+    '12'
+    >>> print(profile.table(10))
+    """
+
+    result: str
+    """Result of the script, as returned by :meth:`Mechanical.run_python_script`."""
+    total_time: float = 0.0
+    """Time spent in the script on the server in seconds."""
+    profiler: str = "statements"
+    """``"cProfile"`` when functions were profiled, ``"statements"`` otherwise."""
+    statements: list[StatementTiming] = dataclasses.field(default_factory=list)
+    """Timing of each top-level statement of the script."""
+    functions: list[FunctionTiming] = dataclasses.field(default_factory=list)
+    """Functions with the largest cumulative time, when the server runs CPython."""
+
+    def top(self, n: int = 20) -> list[FunctionTiming] | list[StatementTiming]:
+        """Get the ``n`` most expensive functions, or statements without cProfile.
+
+        Examples
+        --------
+        >>> profile.top(5)[0].function
+        'Solve'
+        """
+        if self.functions:
+            return sorted(self.functions, key=lambda entry: -entry.cumulative_time)[:n]
+        return sorted(self.statements, key=lambda entry: -entry.time)[:n]
+
+    def table(self, n: int = 20) -> str:
+        """Render the ``n`` most expensive functions or statements as a text table.
+
+        Examples
+        --------
+        >>> print(profile.table(3))
+        """
+        lines = [f"Total time: {self.total_time:.3f} s ({self.profiler})"]
+        if self.functions:
+            lines.append(f"{'calls':>10} {'tottime':>10} {'cumtime':>10}  function")
+            for entry in self.top(n):
+                calls = str(entry.calls)
+                if entry.calls != entry.primitive_calls:
+                    calls = f"{entry.calls}/{entry.primitive_calls}"
+                location = f"{entry.file}:{entry.line}({entry.function})"
+                lines.append(
+                    f"{calls:>10} {entry.total_time:>10.4f} {entry.cumulative_time:>10.4f}  "
+                    f"{location}"
+                )
+        else:
+            lines.append(f"{'line':>6} {'time':>10}  statement")
+            for entry in self.top(n):
+                lines.append(f"{entry.line:>6} {entry.time:>10.4f}  {entry.source}")
+        return "\n".join(lines)
+
+
+def _split_statements(script: str) -> list[list]:
+    """Split a script into its top-level statements.
+
+    Each item is ``[line, mode, source]``, where the mode of the last statement is
+    ``"eval"`` when it is an expression. A script that does not parse on the client,
+    such as an IronPython 2.7 script, runs as a single statement.
+    """
+    try:
+        body = ast.parse(script).body
+    except SyntaxError:
+        return [[1, "exec", script]]
+    if not body:
+        return [[1, "exec", script]]
+    lines = script.splitlines(keepends=True)
+    chunks = []
+    for node in body:
+        source = ast.get_source_segment(script, node)
+        start = node.lineno
+        decorators = getattr(node, "decorator_list", None)
+        if decorators:
+            start = min(decorator.lineno for decorator in decorators)
+            source = "".join(lines[start - 1 : node.lineno - 1]) + source
+        chunks.append([start, "exec", source])
+    if isinstance(body[-1], ast.Expr):
+        chunks[-1][1] = "eval"
+    return chunks
+
+
+def build_profile_script(script: str, key: str, max_entries: int = DEFAULT_MAX_ENTRIES) -> str:
+    """Wrap a script in the server-side profiler.
+
+    Parameters
+    ----------
+    script : str
+        Script to profile.
+    key : str
+        Key under which the server keeps the profile until it is fetched.
+    max_entries : int, optional
+        Maximum number of profiled functions to keep. The default is ``50``.
+
+    Returns
+    -------
+    str
+        Script to run instead of the original one.
+    """
+    script = textwrap.dedent(script)
+    chunks = _split_statements(script)
+    result = "_pymechanical_result" if chunks[-1][1] == "eval" else "_pymechanical_result = None"
+    return _PROFILE_WRAPPER % {
+        "chunks": json.dumps(json.dumps(chunks)),
+        "filename": json.dumps(_SCRIPT_FILENAME),
+        "max_entries": max_entries,
+        "key": json.dumps(key),
+        "max_stored": _MAX_STORED_PROFILES,
+        "result": result,
+    }
+
+
+def fetch_profile_script(key: str) -> str:
+    """Get the script that returns and forgets the profile stored under a key."""
+    return _FETCH_PROFILE % json.dumps(key)
+
+
+def parse_profile(result: str, script: str, payload: str) -> ProfileResult:
+    """Build the profile result from the payload returned by the fetch script.
+
+    Parameters
+    ----------
+    result : str
+        Result of the profiled script.
+    script : str
+        Original script, used to show the source of the statements.
+    payload : str
+        JSON payload returned by the fetch script.
+    """
+    data = json.loads(payload) if payload else None
+    if not data:
+        return ProfileResult(result)
+    chunks = _split_statements(textwrap.dedent(script))
+    statements = [
+        StatementTiming(line, chunk[2].strip().splitlines()[0] if chunk[2].strip() else "", seconds)
+        for (line, seconds), chunk in zip(data["statements"], chunks)
+    ]
+    functions = [
+        FunctionTiming(
+            function=name,
+            file=file,
+            line=line,
+            calls=calls,
+            primitive_calls=primitive_calls,
+            total_time=total_time,
+            cumulative_time=cumulative_time,
+        )
+        for file, line, name, primitive_calls, calls, total_time, cumulative_time in data[
+            "functions"
+        ]
+    ]
+    return ProfileResult(
+        result=result,
+        total_time=data["total_time"],
+        profiler=data["profiler"],
+        statements=statements,
+        functions=functions,
+    )
@@ -0,0 +1,401 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Progress reporting for file transfers.
+
+Each transfer reports the bytes done, the total, and the rate to a
+:class:`TransferMonitor`. A monitor calls its callback at most once per
+``min_interval`` seconds for each transfer, and once when the transfer finishes.
+When several clients share a monitor, or when a monitor has a parent, the monitor
+also aggregates the concurrent transfers, for example for a whole pool.
+"""
+
+from collections.abc import Callable
+import dataclasses
+import itertools
+import threading
+import time
+
+try:
+    from tqdm import tqdm
+
+    _HAS_TQDM = True
+    """Whether or not tqdm is installed."""
+except ModuleNotFoundError:  # pragma: no cover
+    _HAS_TQDM = False
+
+DEFAULT_PROGRESS_INTERVAL = 0.1
+"""Default minimum time in seconds between two reports of the same transfer."""
+
+_TRANSFER_IDS = itertools.count(1)
+
+
+@dataclasses.dataclass(frozen=True)
+class TransferProgress:
+    """State of a file transfer, or of the sum of the active transfers.
+
+    Attributes
+    ----------
+    transfer_id : int
+        Identifier of the transfer. It is ``0`` for an aggregate.
+    name : str
+        Name of the transferred file.
+    direction : str
+        ``"upload"`` or ``"download"``.
+    bytes_done : int
+        Number of bytes transferred so far.
+    total : int or None
+        Total number of bytes, or ``None`` if it is not known.
+    rate : float
+        Average rate in bytes per second since the start of the transfer.
+    elapsed : float
+        Time in seconds since the start of the transfer.
+    finished : bool
+        Whether the transfer finished, successfully or not.
+    """
+
+    transfer_id: int
+    name: str
+    direction: str
+    bytes_done: int
+    total: int | None
+    rate: float
+    elapsed: float
+    finished: bool = False
+
+    @property
+    def fraction(self) -> float | None:
+        """Fraction of the bytes transferred, or ``None`` if the total is not known."""
+        if not self.total:
+            return None
+        return min(self.bytes_done / self.total, 1.0)
+
+    @property
+    def eta(self) -> float | None:
+        """Estimated time in seconds until the end, or ``None`` if it cannot be estimated."""
+        if self.total is None or not self.rate:
+            return None
+        return max(self.total - self.bytes_done, 0) / self.rate
+
+
+ProgressCallback = Callable[[TransferProgress], None]
+"""Function called with the progress of a transfer."""
+
+
+class Transfer:
+    """Handle through which a client reports the progress of one transfer.
+
+    Use the :meth:`TransferMonitor.start` method rather than creating this class.
+    """
+
+    def __init__(self, monitors, name: str, total: int | None, direction: str):
+        """Initialize the transfer."""
+        self.transfer_id = next(_TRANSFER_IDS)
+        self.name = name
+        self.total = total
+        self.direction = direction
+        self.bytes_done = 0
+        self.finished = False
+        self._monitors = monitors
+        self._start = time.monotonic()
+
+    def snapshot(self, now: float | None = None) -> TransferProgress:
+        """Get the current state of the transfer."""
+        elapsed = (time.monotonic() if now is None else now) - self._start
+        return TransferProgress(
+            transfer_id=self.transfer_id,
+            name=self.name,
+            direction=self.direction,
+            bytes_done=self.bytes_done,
+            total=self.total,
+            rate=self.bytes_done / elapsed if elapsed > 0 else 0.0,
+            elapsed=elapsed,
+            finished=self.finished,
+        )
+
+    def update(self, nbytes: int) -> None:
+        """Report bytes transferred since the previous update."""
+        self.bytes_done += nbytes
+        now = time.monotonic()
+        for monitor in self._monitors:
+            monitor._report(self, now)
+
+    def finish(self) -> None:
+        """Report the end of the transfer. Calling it again has no effect."""
+        if self.finished:
+            return
+        self.finished = True
+        for monitor in self._monitors:
+            monitor._finish(self)
+
+    def __enter__(self):
+        """Enter the context."""
+        return self
+
+    def __exit__(self, *args):
+        """Report the end of the transfer."""
+        self.finish()
+
+
+class TransferMonitor:
+    """Collects the progress of file transfers and reports it to a callback.
+
+    A monitor is safe to share between threads and between clients, such as the
+    instances of a pool.
+
+    Parameters
+    ----------
+    callback : callable, optional
+        Function called with a :class:`TransferProgress` when a transfer starts, at
+        most once per ``min_interval`` seconds while it runs, and when it finishes.
+        The default is ``None``, in which case the progress is only collected.
+    min_interval : float, optional
+        Minimum time in seconds between two calls of the callback for the same
+        transfer. The default is ``0.1``.
+    parent : TransferMonitor, optional
+        Monitor that also receives the transfers of this monitor. The default is
+        ``None``.
+
+    Examples
+    --------
+    Send the throughput of all the transfers of a pool to a dashboard.
+
+    >>> monitor = TransferMonitor(lambda progress: print(progress.name, progress.rate))
+    >>> pool.progress = monitor
+    >>> monitor.aggregate().rate
+    52428800.0
+    """
+
+    def __init__(
+        self,
+        callback: ProgressCallback | None = None,
+        min_interval: float = DEFAULT_PROGRESS_INTERVAL,
+        parent: "TransferMonitor | None" = None,
+    ):
+        """Initialize the monitor."""
+        self.callback = callback
+        self.min_interval = min_interval
+        self.parent = parent
+        self.bytes_transferred = 0
+        self.transfers_completed = 0
+        self._active = {}
+        self._last_report = {}
+        self._lock = threading.Lock()
+
+    def start(self, name: str, total: int | None = None, direction: str = "download") -> Transfer:
+        """Start tracking a transfer.
+
+        Parameters
+        ----------
+        name : str
+            Name of the transferred file.
+        total : int, optional
+            Total number of bytes. The default is ``None``, in which case it is not
+            known yet. It can be set later on the ``total`` attribute of the transfer.
+        direction : str, optional
+            ``"upload"`` or ``"download"``. The default is ``"download"``.
+
+        Returns
+        -------
+        Transfer
+            Handle whose ``update()`` method reports the transferred bytes and whose
+            ``finish()`` method reports the end of the transfer.
+
+        Examples
+        --------
+        >>> with monitor.start("file.rst", total=1024) as transfer:
+        ...     transfer.update(1024)
+        """
+        monitors = []
+        monitor = self
+        while monitor is not None:
+            monitors.append(monitor)
+            monitor = monitor.parent
+        transfer = Transfer(monitors, name, total, direction)
+        for monitor in monitors:
+            monitor._add(transfer)
+        return transfer
+
+    def _notify(self, progress: TransferProgress) -> None:
+        if self.callback is not None:
+            self.callback(progress)
+
+    def _add(self, transfer: Transfer) -> None:
+        with self._lock:
+            self._active[transfer.transfer_id] = transfer
+            self._last_report[transfer.transfer_id] = time.monotonic()
+        self._notify(transfer.snapshot())
+
+    def _report(self, transfer: Transfer, now: float) -> None:
+        with self._lock:
+            last = self._last_report.get(transfer.transfer_id)
+            if last is None or now - last < self.min_interval:
+                return
+            self._last_report[transfer.transfer_id] = now
+        self._notify(transfer.snapshot(now))
+
+    def _finish(self, transfer: Transfer) -> None:
+        with self._lock:
+            if self._active.pop(transfer.transfer_id, None) is None:
+                return
+            self._last_report.pop(transfer.transfer_id, None)
+            self.bytes_transferred += transfer.bytes_done
+            self.transfers_completed += 1
+        self._notify(transfer.snapshot())
+
+    def active(self) -> list[TransferProgress]:
+        """Get the state of the transfers that are running.
+
+        Examples
+        --------
+        >>> [progress.name for progress in monitor.active()]
+        ['file.rst', 'file.mechdb']
+        """
+        with self._lock:
+            transfers = list(self._active.values())
+        now = time.monotonic()
+        return [transfer.snapshot(now) for transfer in transfers]
+
+    def aggregate(self) -> TransferProgress:
+        """Get the sum of the transfers that are running.
+
+        The rate is the sum of the rates of the running transfers, and the total is
+        ``None`` if the total of one of them is not known.
+
+        Examples
+        --------
+        >>> progress = monitor.aggregate()
+        >>> print(f"{progress.rate / 1e6:.1f} MB/s, {progress.eta:.0f} s left")
+        52.4 MB/s, 12 s left
+        """
+        active = self.active()
+        totals = [progress.total for progress in active]
+        return TransferProgress(
+            transfer_id=0,
+            name="*",
+            direction="*",
+            bytes_done=sum(progress.bytes_done for progress in active),
+            total=None if None in totals else sum(totals),
+            rate=sum(progress.rate for progress in active),
+            elapsed=max((progress.elapsed for progress in active), default=0.0),
+            finished=not active,
+        )
+
+
+class TqdmProgress:
+    """Progress callback that shows a ``tqdm`` progress bar for each transfer.
+
+    Parameters
+    ----------
+    **kwargs : dict, optional
+        Additional keyword arguments for the ``tqdm`` progress bars.
+
+    Examples
+    --------
+    >>> mechanical.progress = TqdmProgress(leave=False)
+    """
+
+    def __init__(self, **kwargs):
+        """Initialize the callback."""
+        if not _HAS_TQDM:  # pragma: no cover
+            raise ModuleNotFoundError(
+                "To show progress bars, you must have installed the 'tqdm' package. "
+                "To avoid this message, you can set 'progress_bar=False'."
+            )
+        self._kwargs = {"unit": "B", "unit_scale": True, "unit_divisor": 1024, **kwargs}
+        self._bars = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, progress: TransferProgress) -> None:
+        """Update the progress bar of the transfer."""
+        with self._lock:
+            bar = self._bars.get(progress.transfer_id)
+            if bar is None:
+                if progress.finished and not progress.bytes_done:
+                    return
+                verb = "Uploading" if progress.direction == "upload" else "Downloading"
+                bar = tqdm(total=progress.total, desc=f"{verb} {progress.name}", **self._kwargs)
+                self._bars[progress.transfer_id] = bar
+            if progress.total != bar.total:
+                bar.total = progress.total
+            bar.update(progress.bytes_done - bar.n)
+            if progress.finished:
+                bar.close()
+                del self._bars[progress.transfer_id]
+
+
+def as_monitor(progress) -> TransferMonitor | None:
+    """Get a monitor from a monitor, a progress callback, or ``None``.
+
+    Parameters
+    ----------
+    progress : TransferMonitor, callable, or None
+        Monitor, or callback for which a monitor is created.
+
+    Returns
+    -------
+    TransferMonitor or None
+        Monitor of the transfers.
+    """
+    if progress is None or isinstance(progress, TransferMonitor):
+        return progress
+    if not callable(progress):
+        raise TypeError(
+            "The progress must be a TransferMonitor, a callable that takes a "
+            f"TransferProgress, or None, not {type(progress).__name__}."
+        )
+    return TransferMonitor(progress)
+
+
+def start_transfer(
+    monitor: TransferMonitor | None,
+    name: str,
+    total: int | None,
+    direction: str,
+    progress_bar: bool = False,
+) -> Transfer | None:
+    """Start tracking a transfer of a client.
+
+    Parameters
+    ----------
+    monitor : TransferMonitor or None
+        Monitor of the client.
+    name : str
+        Name of the transferred file.
+    total : int or None
+        Total number of bytes, or ``None`` if it is not known yet.
+    direction : str
+        ``"upload"`` or ``"download"``.
+    progress_bar : bool, optional
+        Whether to also show a ``tqdm`` progress bar for this transfer. The default
+        is ``False``.
+
+    Returns
+    -------
+    Transfer or None
+        Handle of the transfer, or ``None`` if nothing tracks it.
+    """
+    if progress_bar:
+        monitor = TransferMonitor(TqdmProgress(), parent=monitor)
+    if monitor is None:
+        return None
+    return monitor.start(name, total, direction)
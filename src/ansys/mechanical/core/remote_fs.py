@@ -0,0 +1,423 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""File system of the server of a Mechanical instance.
+
+Each operation of :class:`RemoteFileSystem` runs one small script on the server
+and returns a structured result, so that checking a single file costs one call
+whatever the size of the project. Relative paths are resolved against the project
+directory of Mechanical. The scripts are compatible with IronPython 2.7 and
+CPython.
+"""
+
+import dataclasses
+import json
+import weakref
+
+_PREAMBLE = """import fnmatch as _pm_fnmatch
+import glob as _pm_glob
+import json as _pm_json
+import os as _pm_os
+import shutil as _pm_shutil
+def _pm_root():
+    try:
+        return ExtAPI.DataModel.Project.ProjectDirectory
+    except NameError:
+        return _pm_os.getcwd()
+def _pm_resolve(path):
+    if _pm_os.path.isabs(path):
+        return _pm_os.path.normpath(path)
+    return _pm_os.path.normpath(_pm_os.path.join(_pm_root(), path))
+def _pm_stat(path):
+    stat = _pm_os.stat(path)
+    return {
+        "path": path,
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "is_dir": _pm_os.path.isdir(path),
+    }
+_pm_given = %(path)s
+_pm_path = _pm_resolve(_pm_given)
+_pm_result = {"error": None}
+"""
+
+_STAT = """if _pm_os.path.exists(_pm_path):
+    _pm_result["stat"] = _pm_stat(_pm_path)
+else:
+    _pm_result["error"] = "not_found"
+_pm_json.dumps(_pm_result)
+"""
+
+_GLOB = """_pm_matches = []
+if %(recursive)s and "**" in _pm_path:
+    _pm_base = _pm_path.split("**")[0].rstrip("\\\\/") or _pm_os.sep
+    _pm_pattern = _pm_path
+    for _pm_marker in ("**" + _pm_os.sep, "**/", "**"):
+        _pm_pattern = _pm_pattern.replace(_pm_marker, "*")
+    for _pm_dir, _pm_dirs, _pm_files in _pm_os.walk(_pm_base):
+        for _pm_name in _pm_dirs + _pm_files:
+            _pm_candidate = _pm_os.path.join(_pm_dir, _pm_name)
+            if _pm_fnmatch.fnmatch(_pm_candidate, _pm_pattern):
+                _pm_matches.append(_pm_candidate)
+else:
+    _pm_matches = _pm_glob.glob(_pm_path)
+if not %(include_dirs)s:
+    _pm_matches = [_pm_match for _pm_match in _pm_matches if _pm_os.path.isfile(_pm_match)]
+_pm_result["paths"] = sorted(_pm_matches)
+_pm_json.dumps(_pm_result)
+"""
+
+_MATCH = """_pm_candidates = []
+try:
+    _pm_project_file = ExtAPI.DataModel.Project.FilePath
+except NameError:
+    _pm_project_file = ""
+if _pm_project_file:
+    _pm_candidates.append(_pm_project_file)
+for _pm_dir, _pm_dirs, _pm_files in _pm_os.walk(_pm_root()):
+    for _pm_name in _pm_files:
+        _pm_candidates.append(_pm_os.path.join(_pm_dir, _pm_name))
+_pm_result["paths"] = sorted(
+    _pm_candidate
+    for _pm_candidate in _pm_candidates
+    if _pm_fnmatch.fnmatch(_pm_candidate, _pm_given) or _pm_fnmatch.fnmatch(_pm_candidate, _pm_path)
+)
+_pm_json.dumps(_pm_result)
+"""
+
+_REMOVE = """if not _pm_os.path.exists(_pm_path):
+    _pm_result["error"] = "not_found"
+elif _pm_os.path.isdir(_pm_path):
+    try:
+        if %(recursive)s:
+            _pm_shutil.rmtree(_pm_path)
+        else:
+            _pm_os.rmdir(_pm_path)
+    except OSError as _pm_error:
+        _pm_result["error"] = str(_pm_error)
+else:
+    try:
+        _pm_os.remove(_pm_path)
+    except OSError as _pm_error:
+        _pm_result["error"] = str(_pm_error)
+_pm_json.dumps(_pm_result)
+"""
+
+_MKDIR = """if _pm_os.path.isdir(_pm_path):
+    if not %(exist_ok)s:
+        _pm_result["error"] = "exists"
+elif _pm_os.path.exists(_pm_path):
+    _pm_result["error"] = "exists"
+else:
+    try:
+        if %(parents)s:
+            _pm_os.makedirs(_pm_path)
+        else:
+            _pm_os.mkdir(_pm_path)
+    except OSError as _pm_error:
+        _pm_result["error"] = str(_pm_error)
+_pm_result["path"] = _pm_path
+_pm_json.dumps(_pm_result)
+"""
+
+_DU = """_pm_result["bytes"] = 0
+_pm_result["files"] = 0
+if not _pm_os.path.exists(_pm_path):
+    _pm_result["error"] = "not_found"
+elif _pm_os.path.isfile(_pm_path):
+    _pm_result["bytes"] = _pm_os.path.getsize(_pm_path)
+    _pm_result["files"] = 1
+else:
+    for _pm_dir, _pm_dirs, _pm_files in _pm_os.walk(_pm_path):
+        for _pm_name in _pm_files:
+            try:
+                _pm_result["bytes"] += _pm_os.path.getsize(_pm_os.path.join(_pm_dir, _pm_name))
+                _pm_result["files"] += 1
+            except OSError:
+                pass
+_pm_json.dumps(_pm_result)
+"""
+
+
+@dataclasses.dataclass
+class RemoteStat:
+    """Status of a path on the server.
+
+    Attributes
+    ----------
+    path : str
+        Absolute path on the server.
+    size : int
+        Size in bytes.
+    mtime : float
+        Time of the last modification, in seconds since the epoch of the server.
+    is_dir : bool
+        Whether the path is a directory.
+    """
+
+    path: str
+    size: int
+    mtime: float
+    is_dir: bool
+
+
+@dataclasses.dataclass
+class DiskUsage:
+    """Disk usage of a path on the server.
+
+    Attributes
+    ----------
+    bytes : int
+        Total size of the files in bytes.
+    files : int
+        Number of files.
+    """
+
+    bytes: int
+    files: int
+
+
+def path_script(template: str, path: str, **values) -> str:
+    """Build the script of an operation on a server path.
+
+    The script resolves the path against the project directory into the ``_pm_path``
+    variable and starts the ``_pm_result`` dictionary, whose ``error`` key is
+    ``None``. The template must end with an expression that dumps the result as JSON.
+
+    Parameters
+    ----------
+    template : str
+        Body of the script, with ``%(name)s`` placeholders for the values.
+    path : str
+        Path on the server.
+    **values
+        Booleans and numbers inserted in the template as Python literals.
+
+    Returns
+    -------
+    str
+        Script to run on the server.
+    """
+    literals = {key: repr(value) for key, value in values.items()}
+    return _PREAMBLE % {"path": json.dumps(str(path))} + template % literals
+
+
+class RemoteFileSystem:
+    """File system of the server of a Mechanical instance.
+
+    Use the :attr:`Mechanical.fs <ansys.mechanical.core.mechanical.Mechanical.fs>`
+    property rather than creating this class. Relative paths are resolved against
+    the project directory.
+
+    Parameters
+    ----------
+    mechanical : ansys.mechanical.core.mechanical.Mechanical
+        Mechanical instance whose server is used.
+
+    Examples
+    --------
+    >>> mechanical.fs.exists("file.rst")
+    True
+    >>> mechanical.fs.glob("*.rst")
+    ['/tmp/ANSYS.username.1/AnsysMech3F97/Project_Mech_Files/file.rst']
+    """
+
+    def __init__(self, mechanical):
+        """Initialize the remote file system."""
+        self._mechanical = weakref.proxy(mechanical)
+
+    def _run(self, operation: str, script: str, path) -> dict:
+        """Run the script of an operation and raise the error that it reports."""
+        result = self._mechanical._run_transfer_script(f"fs_{operation}", script)
+        error = result["error"]
+        if error == "not_found":
+            raise FileNotFoundError(f"'{path}' does not exist on the server.")
+        if error == "exists":
+            raise FileExistsError(f"'{path}' already exists on the server.")
+        if error is not None:
+            raise OSError(error)
+        return result
+
+    def stat(self, path: str) -> RemoteStat:
+        """Get the status of a path.
+
+        Parameters
+        ----------
+        path : str
+            Path on the server.
+
+        Returns
+        -------
+        RemoteStat
+            Status of the path.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the path does not exist.
+
+        Examples
+        --------
+        >>> mechanical.fs.stat("file.rst").size
+        1048576
+        """
+        return RemoteStat(**self._run("stat", path_script(_STAT, path), path)["stat"])
+
+    def exists(self, path: str) -> bool:
+        """Whether a path exists.
+
+        Parameters
+        ----------
+        path : str
+            Path on the server.
+
+        Examples
+        --------
+        >>> mechanical.fs.exists("file.rst")
+        True
+        """
+        try:
+            self.stat(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def glob(self, pattern: str, recursive: bool = False, include_dirs: bool = True) -> list[str]:
+        """Get the paths that match a pattern, evaluated on the server.
+
+        Parameters
+        ----------
+        pattern : str
+            Glob pattern, such as ``"*.rst"``.
+        recursive : bool, optional
+            Whether ``**`` matches any number of directories. The default is ``False``.
+        include_dirs : bool, optional
+            Whether to return the directories that match. The default is ``True``.
+
+        Returns
+        -------
+        list[str]
+            Sorted absolute paths on the server.
+
+        Examples
+        --------
+        >>> mechanical.fs.glob("**/*.rst", recursive=True)
+        """
+        script = path_script(_GLOB, pattern, recursive=recursive, include_dirs=include_dirs)
+        return self._run("glob", script, pattern)["paths"]
+
+    def match(self, pattern: str) -> list[str]:
+        """Get the files of the project that match a pattern, evaluated on the server.
+
+        Unlike :meth:`glob`, the pattern is matched with ``fnmatch`` against the
+        absolute path of each file of the project directory and of the project file,
+        so ``*`` also matches the directory separators. For example, ``"*.rst"``
+        matches the result files of all the analyses.
+
+        Parameters
+        ----------
+        pattern : str
+            Pattern, such as ``"*.rst"``.
+
+        Returns
+        -------
+        list[str]
+            Sorted absolute paths of the matching files on the server.
+
+        Examples
+        --------
+        >>> mechanical.fs.match("*.rst")
+        """
+        return self._run("match", path_script(_MATCH, pattern), pattern)["paths"]
+
+    def remove(self, path: str, recursive: bool = False) -> None:
+        """Remove a file or a directory.
+
+        Parameters
+        ----------
+        path : str
+            Path on the server.
+        recursive : bool, optional
+            Whether to remove a directory that is not empty with all its content.
+            The default is ``False``.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the path does not exist.
+
+        Examples
+        --------
+        >>> mechanical.fs.remove("scratch", recursive=True)
+        """
+        self._run("remove", path_script(_REMOVE, path, recursive=recursive), path)
+
+    def mkdir(self, path: str, parents: bool = True, exist_ok: bool = True) -> str:
+        """Create a directory.
+
+        Parameters
+        ----------
+        path : str
+            Path on the server.
+        parents : bool, optional
+            Whether to create the missing parent directories. The default is ``True``.
+        exist_ok : bool, optional
+            Whether an existing directory is accepted. The default is ``True``.
+
+        Returns
+        -------
+        str
+            Absolute path of the directory on the server.
+
+        Raises
+        ------
+        FileExistsError
+            If the path exists and ``exist_ok`` is ``False`` or the path is a file.
+
+        Examples
+        --------
+        >>> mechanical.fs.mkdir("inputs/materials")
+        """
+        return self._run(
+            "mkdir", path_script(_MKDIR, path, parents=parents, exist_ok=exist_ok), path
+        )["path"]
+
+    def du(self, path: str = ".") -> DiskUsage:
+        """Get the disk usage of a file or a directory.
+
+        Parameters
+        ----------
+        path : str, optional
+            Path on the server. The default is ``"."``, which is the project directory.
+
+        Returns
+        -------
+        DiskUsage
+            Total size and number of the files.
+
+        Examples
+        --------
+        >>> mechanical.fs.du().bytes
+        52428800
+        """
+        result = self._run("du", path_script(_DU, path), path)
+        return DiskUsage(bytes=result["bytes"], files=result["files"])
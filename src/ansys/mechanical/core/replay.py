@@ -0,0 +1,420 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Replay of script journals as a benchmark.
+
+A journal written with the ``log_mechanical`` argument of the
+:class:`Mechanical <ansys.mechanical.core.mechanical.Mechanical>` class records each
+script with its start time and duration. This module sends the scripts of a journal
+again to one or more Mechanical instances and measures their latency, either with
+the original timing or as fast as possible, and compares two runs.
+
+The ``ansys-mechanical-replay`` command exposes the same features:
+
+.. code:: bash
+
+    $ ansys-mechanical-replay run pymechanical_log.txt --port 10000 --output v261.json
+    $ ansys-mechanical-replay compare v252.json v261.json --threshold 1.1
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import dataclasses
+import json
+import math
+from pathlib import Path
+import queue
+import sys
+import time
+
+import click
+
+from ansys.mechanical.core.journal import JournalEntry, read_journal
+from ansys.mechanical.core.mechanical import connect_to_mechanical, launch_mechanical
+from ansys.mechanical.core.pool import LocalMechanicalPool
+
+REPLAY_MODES = ("fast", "timed")
+"""Replay modes: as fast as possible, or with the original start times."""
+
+
+@dataclasses.dataclass
+class ReplayRecord:
+    """Latency of a replayed script."""
+
+    seq: int
+    """Sequence number of the script in the journal."""
+    latency: float
+    """Time the script took during the replay, in seconds."""
+    original_duration: float | None = None
+    """Time the script took when it was journaled, in seconds."""
+    error: str | None = None
+    """Error raised by the script, if any."""
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Get a percentile of values with the nearest-rank method.
+
+    Examples
+    --------
+    >>> percentile([1.0, 2.0, 3.0, 4.0], 0.5)
+    2.0
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(q * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+@dataclasses.dataclass
+class ReplayResult:
+    """Latencies of the scripts of a replayed journal."""
+
+    records: list[ReplayRecord] = dataclasses.field(default_factory=list)
+    """Latency of each script, in journal order."""
+    wall_time: float = 0.0
+    """Duration of the whole replay, in seconds."""
+    mode: str = "fast"
+    """Replay mode."""
+    parallel: int = 1
+    """Number of scripts that ran at the same time."""
+
+    def summary(self) -> dict:
+        """Get the latency distribution of the replayed scripts.
+
+        Examples
+        --------
+        >>> result.summary()["p99"]
+        0.84
+        """
+        latencies = [record.latency for record in self.records if record.error is None]
+        return {
+            "count": len(self.records),
+            "errors": sum(record.error is not None for record in self.records),
+            "wall_time": self.wall_time,
+            "throughput": len(self.records) / self.wall_time if self.wall_time else 0.0,
+            "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+            "p50": percentile(latencies, 0.5),
+            "p90": percentile(latencies, 0.9),
+            "p99": percentile(latencies, 0.99),
+            "max": max(latencies, default=0.0),
+        }
+
+    def save(self, path) -> Path:
+        """Save the result to a JSON file.
+
+        Examples
+        --------
+        >>> result.save("v261.json")
+        """
+        path = Path(path)
+        data = {
+            "mode": self.mode,
+            "parallel": self.parallel,
+            "wall_time": self.wall_time,
+            "records": [dataclasses.asdict(record) for record in self.records],
+        }
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        return path
+
+    @classmethod
+    def load(cls, path) -> "ReplayResult":
+        """Load a result saved with :meth:`save`.
+
+        Examples
+        --------
+        >>> baseline = ReplayResult.load("v252.json")
+        """
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls(
+            records=[ReplayRecord(**record) for record in data["records"]],
+            wall_time=data["wall_time"],
+            mode=data["mode"],
+            parallel=data["parallel"],
+        )
+
+
+def replay(
+    entries: list[JournalEntry],
+    instances,
+    mode: str = "fast",
+    parallel: int = 1,
+    speed: float = 1.0,
+) -> ReplayResult:
+    """Send the scripts of a journal to Mechanical instances and time them.
+
+    Each script runs on the first available instance.
+
+    Parameters
+    ----------
+    entries : list[JournalEntry]
+        Scripts to replay, as read by :func:`read_journal
+        <ansys.mechanical.core.journal.read_journal>`.
+    instances : iterable of Mechanical
+        Instances that run the scripts, such as a list or a
+        :class:`LocalMechanicalPool <ansys.mechanical.core.pool.LocalMechanicalPool>`.
+    mode : str, optional
+        ``"fast"`` to send each script as soon as a worker is free, or ``"timed"``
+        to send each script at its original start time. The default is ``"fast"``.
+    parallel : int, optional
+        Maximum number of scripts that run at the same time. The default is ``1``.
+    speed : float, optional
+        Speed-up factor of the original timing in ``"timed"`` mode. The default is ``1.0``.
+
+    Returns
+    -------
+    ReplayResult
+        Latency of each script.
+
+    Examples
+    --------
+    Replay a journal on a pool, four scripts at a time.
+
+    >>> from ansys.mechanical.core.journal import read_journal
+    >>> from ansys.mechanical.core.replay import replay
+    >>> result = replay(read_journal("pymechanical_log.txt"), pool, parallel=4)
+    >>> result.summary()
+    """
+    if mode not in REPLAY_MODES:
+        raise ValueError(f"The replay mode must be one of {REPLAY_MODES}, not {mode!r}.")
+    if parallel < 1:
+        raise ValueError("At least one script must run at a time.")
+    available = queue.Queue()
+    for instance in instances:
+        available.put(instance)
+    if available.empty():
+        raise ValueError("At least one Mechanical instance is required.")
+
+    def run(entry):
+        instance = available.get()
+        error = None
+        began = time.perf_counter()
+        try:
+            instance.run_python_script(entry.script)
+        except Exception as exc:
+            error = repr(exc)
+        latency = time.perf_counter() - began
+        available.put(instance)
+        return ReplayRecord(entry.seq, latency, entry.duration, error)
+
+    starts = [entry.start for entry in entries if entry.start is not None]
+    origin = min(starts, default=0.0)
+    began = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="Replay") as executor:
+        futures = []
+        for entry in entries:
+            if mode == "timed" and entry.start is not None:
+                delay = (entry.start - origin) / speed - (time.perf_counter() - began)
+                if delay > 0:
+                    time.sleep(delay)
+            futures.append(executor.submit(run, entry))
+        records = [future.result() for future in futures]
+    return ReplayResult(records, time.perf_counter() - began, mode, parallel)
+
+
+def ratio(candidate: float, baseline: float) -> float:
+    """Get the ratio of a candidate statistic to its baseline.
+
+    A zero baseline gives ``1.0`` if the candidate is also zero, and infinity
+    otherwise, so that a regression from zero is never hidden.
+
+    Examples
+    --------
+    >>> ratio(0.2, 0.1)
+    2.0
+    >>> ratio(0.1, 0.0)
+    inf
+    """
+    if baseline:
+        return candidate / baseline
+    return math.inf if candidate > 0 else 1.0
+
+
+def compare(baseline: ReplayResult, candidate: ReplayResult, top: int = 10) -> dict:
+    """Compare the latencies of two replays of the same journal.
+
+    Parameters
+    ----------
+    baseline : ReplayResult
+        Reference replay, such as one on the current Mechanical version.
+    candidate : ReplayResult
+        Replay to compare, such as one on a new Mechanical version.
+    top : int, optional
+        Number of scripts with the largest slowdown to report. The default is ``10``.
+
+    Returns
+    -------
+    dict
+        Summaries of both replays, the ratio of each statistic, and the scripts with
+        the largest slowdown.
+
+    Examples
+    --------
+    >>> comparison = compare(ReplayResult.load("v252.json"), ReplayResult.load("v261.json"))
+    >>> comparison["ratio"]["p90"]
+    1.04
+    """
+    base_summary = baseline.summary()
+    candidate_summary = candidate.summary()
+    ratios = {
+        key: ratio(candidate_summary[key], base_summary[key])
+        for key in ("mean", "p50", "p90", "p99", "max", "wall_time")
+    }
+    base_latency = {r.seq: r.latency for r in baseline.records if r.error is None}
+    slowdowns = []
+    for record in candidate.records:
+        base = base_latency.get(record.seq)
+        if record.error is None and base:
+            slowdowns.append(
+                {
+                    "seq": record.seq,
+                    "baseline": base,
+                    "candidate": record.latency,
+                    "ratio": record.latency / base,
+                }
+            )
+    slowdowns.sort(key=lambda item: -item["ratio"])
+    return {
+        "baseline": base_summary,
+        "candidate": candidate_summary,
+        "ratio": ratios,
+        "slowest": slowdowns[:top],
+    }
+
+
+def format_summary(summary: dict) -> str:
+    """Format a replay summary as text."""
+    return (
+        f"{summary['count']} scripts, {summary['errors']} errors, "
+        f"{summary['wall_time']:.3f} s, {summary['throughput']:.2f} scripts/s\n"
+        f"latency mean {summary['mean']:.4f} s, p50 {summary['p50']:.4f} s, "
+        f"p90 {summary['p90']:.4f} s, p99 {summary['p99']:.4f} s, max {summary['max']:.4f} s"
+    )
+
+
+def format_comparison(comparison: dict) -> str:
+    """Format a comparison of two replays as text."""
+    lines = [f"{'':>10} {'baseline':>10} {'candidate':>10} {'ratio':>8}"]
+    for key, ratio in comparison["ratio"].items():
+        lines.append(
+            f"{key:>10} {comparison['baseline'][key]:>10.4f} "
+            f"{comparison['candidate'][key]:>10.4f} {ratio:>8.3f}"
+        )
+    if comparison["slowest"]:
+        lines.append("Largest slowdowns:")
+        for item in comparison["slowest"]:
+            lines.append(
+                f"  script {item['seq']}: {item['baseline']:.4f} s -> "
+                f"{item['candidate']:.4f} s ({item['ratio']:.2f}x)"
+            )
+    return "\n".join(lines)
+
+
+def _connect(ip: str, ports: tuple[int, ...], launch: int, exec_file: str | None):
+    """Connect to or launch the instances of a replay.
+
+    Returns the instances and the object to exit after the replay, if any.
+    """
+    if ports:
+        return [connect_to_mechanical(ip=ip, port=port) for port in ports], None
+    kwargs = {"exec_file": exec_file} if exec_file else {}
+    if launch > 1:
+        pool = LocalMechanicalPool(launch, **kwargs)
+        return list(pool), pool
+    instance = launch_mechanical(**kwargs)
+    return [instance], instance
+
+
+@click.group()
+@click.help_option("--help", "-h")
+def cli() -> None:
+    """Replay PyMechanical script journals and compare their latencies."""
+
+
+@cli.command("run")
+@click.help_option("--help", "-h")
+@click.argument("journal", type=click.Path(exists=True, dir_okay=False))
+@click.option("--ip", default="localhost", help="IP address of the Mechanical instances.")
+@click.option(
+    "--port",
+    "ports",
+    multiple=True,
+    type=int,
+    help="Port of a running Mechanical instance. Repeat it to replay on several instances.",
+)
+@click.option(
+    "--launch",
+    default=1,
+    type=int,
+    help="Number of Mechanical instances to launch when no port is given.",
+)
+@click.option("--exec-file", default=None, help="Mechanical executable file to launch.")
+@click.option(
+    "--mode",
+    default="fast",
+    type=click.Choice(REPLAY_MODES),
+    help="Send the scripts as fast as possible, or with their original timing.",
+)
+@click.option("--parallel", default=1, type=int, help="Number of scripts that run at a time.")
+@click.option("--speed", default=1.0, type=float, help="Speed-up of the original timing.")
+@click.option("--output", default=None, help="JSON file to save the latencies to.")
+def run_command(journal, ip, ports, launch, exec_file, mode, parallel, speed, output) -> None:
+    """Replay the scripts of a journal and report their latency distribution.
+
+    Usage
+    -----
+    $ ansys-mechanical-replay run pymechanical_log.txt --port 10000 --output run.json
+    """
+    instances, owner = _connect(ip, ports, launch, exec_file)
+    try:
+        result = replay(read_journal(journal), instances, mode, parallel, speed)
+    finally:
+        if owner is not None:
+            owner.exit()
+    click.echo(format_summary(result.summary()))
+    if output:
+        result.save(output)
+
+
+@cli.command("compare")
+@click.help_option("--help", "-h")
+@click.argument("baseline", type=click.Path(exists=True, dir_okay=False))
+@click.argument("candidate", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--threshold",
+    default=None,
+    type=float,
+    help="Exit with an error if the p50 or p90 ratio of the candidate exceeds this value.",
+)
+def compare_command(baseline, candidate, threshold) -> None:
+    """Compare the latencies of two saved replays.
+
+    Usage
+    -----
+    $ ansys-mechanical-replay compare v252.json v261.json --threshold 1.1
+    """
+    comparison = compare(ReplayResult.load(baseline), ReplayResult.load(candidate))
+    click.echo(format_comparison(comparison))
+    if threshold is not None:
+        worst = max(comparison["ratio"]["p50"], comparison["ratio"]["p90"])
+        if worst > threshold:
+            click.echo(f"Latency regression: {worst:.3f} > {threshold}", err=True)
+            sys.exit(1)
@@ -0,0 +1,206 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Incremental reading of growing files on the server, such as solver output files.
+
+Each poll runs one script that returns only the bytes appended since the previous
+poll. The offset is kept by the client, so the server keeps no state between
+polls, and the interval between polls grows while the file does not change.
+"""
+
+import base64
+import threading
+import time
+
+from ansys.mechanical.core.remote_fs import path_script
+
+DEFAULT_TAIL_CHUNK_SIZE = 1024 * 1024
+"""Default maximum number of bytes returned by one poll."""
+
+DEFAULT_POLL_INTERVAL = 0.5
+"""Default time in seconds between two polls while the file grows."""
+
+DEFAULT_MAX_POLL_INTERVAL = 10.0
+"""Default maximum time in seconds between two polls while the file does not change."""
+
+_TAIL = """import base64 as _pm_base64
+if not _pm_os.path.isfile(_pm_path):
+    _pm_result["error"] = "not_found"
+else:
+    _pm_size = _pm_os.path.getsize(_pm_path)
+    _pm_offset = %(offset)s
+    if _pm_offset < 0:
+        _pm_offset = max(_pm_size + _pm_offset, 0)
+    elif _pm_offset > _pm_size:
+        # The file was truncated or replaced
+        _pm_offset = 0
+    with open(_pm_path, "rb") as _pm_input:
+        _pm_input.seek(_pm_offset)
+        _pm_data = _pm_input.read(%(max_bytes)s)
+    _pm_result["offset"] = _pm_offset
+    _pm_result["size"] = _pm_size
+    _pm_result["data"] = _pm_base64.b64encode(_pm_data).decode("ascii")
+_pm_json.dumps(_pm_result)
+"""
+
+
+class RemoteTail:
+    """Iterator over the bytes appended to a file on the server.
+
+    Use the :meth:`Mechanical.tail <ansys.mechanical.core.mechanical.Mechanical.tail>`
+    method rather than creating this class.
+
+    Parameters
+    ----------
+    mechanical : ansys.mechanical.core.mechanical.Mechanical
+        Mechanical instance whose server has the file.
+    path : str
+        Path of the file on the server. A relative path is resolved against the
+        project directory.
+    follow : bool, optional
+        Whether to keep polling the file after reaching its end. The default is ``True``.
+    offset : int, optional
+        Byte at which to start. A negative value counts from the end of the file.
+        The default is ``0``.
+    poll_interval : float, optional
+        Time in seconds between two polls while the file grows. The default is ``0.5``.
+    max_poll_interval : float, optional
+        Maximum time in seconds between two polls. The interval doubles after each
+        poll that finds no new bytes, up to this value. The default is ``10.0``.
+    idle_timeout : float, optional
+        Time in seconds without new bytes after which the iteration stops. The
+        default is ``None``, in which case it only stops when :meth:`stop` is called.
+    chunk_size : int, optional
+        Maximum number of bytes returned by one poll. The default is 1 MB.
+
+    Examples
+    --------
+    Print the output of a solve as it is written.
+
+    >>> for line in mechanical.tail("solve.out").lines():
+    ...     print(line)
+    """
+
+    def __init__(
+        self,
+        mechanical,
+        path: str,
+        follow: bool = True,
+        offset: int = 0,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        idle_timeout: float | None = None,
+        chunk_size: int = DEFAULT_TAIL_CHUNK_SIZE,
+    ):
+        """Initialize the tail."""
+        self._mechanical = mechanical
+        self.path = path
+        self.follow = follow
+        self.offset = offset
+        self.poll_interval = poll_interval
+        self.max_poll_interval = max(max_poll_interval, poll_interval)
+        self.idle_timeout = idle_timeout
+        self.chunk_size = chunk_size
+        self._stopped = threading.Event()
+
+    def stop(self) -> None:
+        """Stop the iteration at the next poll, even while waiting for new bytes.
+
+        Examples
+        --------
+        >>> tail.stop()
+        """
+        self._stopped.set()
+
+    def poll(self) -> bytes:
+        """Read the bytes appended since the previous poll.
+
+        Returns
+        -------
+        bytes
+            New bytes, which are empty if the file did not grow or does not exist yet.
+
+        Examples
+        --------
+        >>> tail.poll().decode()
+        'Solution converged.'
+        """
+        script = path_script(_TAIL, self.path, offset=self.offset, max_bytes=self.chunk_size)
+        result = self._mechanical._run_transfer_script("tail", script)
+        if result["error"] == "not_found":
+            if not self.follow:
+                raise FileNotFoundError(f"'{self.path}' does not exist on the server.")
+            return b""
+        data = base64.b64decode(result["data"])
+        self.offset = result["offset"] + len(data)
+        return data
+
+    def __iter__(self):
+        """Yield the new bytes as they are appended to the file."""
+        interval = self.poll_interval
+        last_data = time.monotonic()
+        while not self._stopped.is_set():
+            data = self.poll()
+            if data:
+                yield data
+                last_data = time.monotonic()
+                interval = self.poll_interval
+                if len(data) == self.chunk_size:
+                    # More bytes are waiting
+                    continue
+            elif self.idle_timeout is not None and (
+                time.monotonic() - last_data >= self.idle_timeout
+            ):
+                return
+            else:
+                interval = min(interval * 2, self.max_poll_interval)
+            if not self.follow:
+                return
+            self._stopped.wait(interval)
+
+    def lines(self, encoding: str = "utf-8"):
+        """Yield the complete lines appended to the file.
+
+        Parameters
+        ----------
+        encoding : str, optional
+            Encoding of the file. The default is ``"utf-8"``.
+
+        Yields
+        ------
+        str
+            Lines without their line ending. The last line is yielded when the
+            iteration stops, even if it has no line ending.
+
+        Examples
+        --------
+        >>> for line in mechanical.tail("solve.out", idle_timeout=600).lines():
+        ...     print(line)
+        """
+        pending = b""
+        for data in self:
+            pending += data
+            *complete, pending = pending.split(b"\n")
+            for line in complete:
+                yield line.rstrip(b"\r").decode(encoding, errors="replace")
+        if pending:
+            yield pending.rstrip(b"\r").decode(encoding, errors="replace")
@@ -0,0 +1,486 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Tracing spans for the calls of PyMechanical clients and pools.
+
+Spans are created around the scripts, file transfers, pool jobs, and instance launches.
+When the ``opentelemetry-api`` package is installed, each span is also an OpenTelemetry
+span, so a configured tracer provider exports it with the rest of the application. The
+spans can also be recorded locally and exported to a JSON file in the Chrome trace event
+format, which flame graph viewers such as Perfetto or speedscope can open.
+
+When tracing is enabled, the scripts sent to Mechanical start with a preamble that defines
+the ``pymechanical_correlation_id`` variable, and the log messages streamed back from the
+server are tagged with the same ID.
+"""
+
+import ast
+import atexit
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+import json
+import os
+from pathlib import Path
+import re
+import secrets
+import threading
+import time
+
+try:
+    from opentelemetry import trace as otel_trace
+
+    _HAS_OPENTELEMETRY = True
+    """Whether or not the OpenTelemetry API is installed."""
+except ImportError:
+    _HAS_OPENTELEMETRY = False
+
+CORRELATION_VARIABLE = "pymechanical_correlation_id"
+"""Name of the script variable that holds the correlation ID."""
+
+_UNSET = object()
+_CURRENT_SPAN: ContextVar["Span | None"] = ContextVar("pymechanical_span", default=None)
+
+
+class Span:
+    """Timed operation of a PyMechanical client.
+
+    Parameters
+    ----------
+    name : str
+        Name of the operation.
+    trace_id : str
+        Hexadecimal ID of the trace that the span belongs to.
+    span_id : str
+        Hexadecimal ID of the span.
+    parent_id : str, optional
+        ID of the parent span. The default is ``None``.
+    attributes : dict, optional
+        Attributes of the span. The default is ``None``.
+    """
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "attributes",
+        "start_ns",
+        "duration_ns",
+        "thread_id",
+        "thread_name",
+        "error",
+        "_otel_span",
+    )
+
+    def __init__(self, name, trace_id, span_id, parent_id=None, attributes=None):
+        """Initialize the span."""
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.attributes = dict(attributes or {})
+        self.start_ns = time.time_ns()
+        self.duration_ns = 0
+        thread = threading.current_thread()
+        self.thread_id = thread.ident
+        self.thread_name = thread.name
+        self.error = None
+        self._otel_span = None
+
+    @property
+    def correlation_id(self) -> str:
+        """ID that ties the server log messages of a call to this span."""
+        return self.span_id
+
+    def set_attribute(self, key: str, value) -> None:
+        """Set an attribute on the span.
+
+        Examples
+        --------
+        >>> span.set_attribute("bytes", 1024)
+        """
+        self.attributes[key] = value
+        if self._otel_span is not None:
+            self._otel_span.set_attribute(key, value)
+
+    def as_dict(self) -> dict:
+        """Get the span as a dictionary.
+
+        Examples
+        --------
+        >>> span.as_dict()["name"]
+        'mechanical.run_python_script'
+        """
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_ns": self.start_ns,
+            "duration_ns": self.duration_ns,
+            "thread": self.thread_name,
+            "error": self.error,
+            "attributes": dict(self.attributes),
+        }
+
+    def __repr__(self):
+        """Get the representation of the span."""
+        return f"Span(name={self.name!r}, span_id={self.span_id!r}, trace_id={self.trace_id!r})"
+
+
+class Tracer:
+    """Creates the spans of PyMechanical and keeps the recorded ones.
+
+    Spans are only created while recording is enabled or when the OpenTelemetry
+    API is installed. Otherwise, :meth:`span` yields ``None`` and costs a single check.
+
+    Parameters
+    ----------
+    max_spans : int, optional
+        Maximum number of recorded spans to keep. The oldest spans are dropped
+        first. The default is ``100000``.
+
+    Examples
+    --------
+    >>> from ansys.mechanical.core.tracing import Tracer
+    >>> tracer = Tracer()
+    >>> tracer.start_recording()
+    >>> with tracer.span("work", items=3):
+    ...     pass
+    >>> tracer.export_json("trace.json")
+    """
+
+    def __init__(self, max_spans: int = 100_000):
+        """Initialize the tracer."""
+        self.max_spans = max_spans
+        self._lock = threading.Lock()
+        self._spans: list[Span] = []
+        self._recording = False
+        self._otel_tracer = (
+            otel_trace.get_tracer("ansys.mechanical.core") if _HAS_OPENTELEMETRY else None
+        )
+
+    @property
+    def recording(self) -> bool:
+        """Whether the finished spans are recorded locally."""
+        return self._recording
+
+    @property
+    def enabled(self) -> bool:
+        """Whether :meth:`span` creates spans."""
+        return self._recording or self._otel_tracer is not None
+
+    def start_recording(self) -> None:
+        """Record the finished spans locally."""
+        self._recording = True
+
+    def stop_recording(self) -> None:
+        """Stop recording the finished spans. The recorded spans are kept."""
+        self._recording = False
+
+    def spans(self) -> list[Span]:
+        """Get the recorded spans."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        """Drop the recorded spans."""
+        with self._lock:
+            self._spans.clear()
+
+    @contextmanager
+    def span(self, name: str, parent=_UNSET, **attributes):
+        """Time the ``with`` block in a span.
+
+        Parameters
+        ----------
+        name : str
+            Name of the span.
+        parent : Span, optional
+            Parent of the span. The default is the current span of the calling
+            context. Pass the parent explicitly when the work runs in another thread.
+        **attributes : dict
+            Attributes of the span. Values must be strings, numbers, or Booleans.
+
+        Yields
+        ------
+        Span or None
+            Span, or ``None`` when tracing is disabled.
+
+        Examples
+        --------
+        >>> with tracer.span("upload", file="model.mechdb") as span:
+        ...     pass
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        if parent is _UNSET:
+            parent = _CURRENT_SPAN.get()
+
+        otel_manager = None
+        otel_span = None
+        trace_id = parent.trace_id if parent is not None else secrets.token_hex(16)
+        span_id = secrets.token_hex(8)
+        if self._otel_tracer is not None:
+            context = None
+            if parent is not None and parent._otel_span is not None:
+                context = otel_trace.set_span_in_context(parent._otel_span)
+            otel_manager = self._otel_tracer.start_as_current_span(
+                name, context=context, attributes=attributes
+            )
+            otel_span = otel_manager.__enter__()
+            span_context = otel_span.get_span_context()
+            if span_context.is_valid:
+                trace_id = format(span_context.trace_id, "032x")
+                span_id = format(span_context.span_id, "016x")
+            elif not self._recording:
+                # The OpenTelemetry API is installed without a configured provider.
+                otel_manager.__exit__(None, None, None)
+                yield None
+                return
+
+        span = Span(
+            name,
+            trace_id,
+            span_id,
+            parent.span_id if parent is not None else None,
+            attributes,
+        )
+        span._otel_span = otel_span
+        token = _CURRENT_SPAN.set(span)
+        start = time.perf_counter_ns()
+        exc_info = (None, None, None)
+        try:
+            yield span
+        except BaseException as error:
+            span.error = repr(error)
+            exc_info = (type(error), error, error.__traceback__)
+            raise
+        finally:
+            span.duration_ns = time.perf_counter_ns() - start
+            _CURRENT_SPAN.reset(token)
+            if otel_manager is not None:
+                otel_manager.__exit__(*exc_info)
+            if self._recording:
+                with self._lock:
+                    self._spans.append(span)
+                    if len(self._spans) > self.max_spans:
+                        del self._spans[: len(self._spans) - self.max_spans]
+
+    def export_json(self, path) -> Path:
+        """Export the recorded spans to a JSON file in the Chrome trace event format.
+
+        Parameters
+        ----------
+        path : str or pathlib.Path
+            Path of the JSON file.
+
+        Returns
+        -------
+        pathlib.Path
+            Path of the JSON file.
+
+        Examples
+        --------
+        >>> tracer.export_json("pymechanical-trace.json")
+        """
+        path = Path(path)
+        pid = os.getpid()
+        events = []
+        threads = {}
+        for span in self.spans():
+            threads[span.thread_id] = span.thread_name
+            args = {
+                "trace_id": span.trace_id,
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                **{key: str(value) for key, value in span.attributes.items()},
+            }
+            if span.error is not None:
+                args["error"] = span.error
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": "pymechanical",
+                    "ph": "X",
+                    "ts": span.start_ns / 1000,
+                    "dur": span.duration_ns / 1000,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": args,
+                }
+            )
+        for thread_id, thread_name in threads.items():
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": pid,
+                    "tid": thread_id,
+                    "args": {"name": thread_name},
+                }
+            )
+        with path.open("w", encoding="utf-8") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+        return path
+
+
+TRACER = Tracer()
+"""Tracer shared by all PyMechanical clients."""
+
+
+def enable_tracing(export_path=None) -> Tracer:
+    """Record the spans of all PyMechanical clients.
+
+    Parameters
+    ----------
+    export_path : str or pathlib.Path, optional
+        JSON file to export the recorded spans to when Python exits. The default
+        is ``None``, in which case the spans are only kept in memory.
+
+    Returns
+    -------
+    Tracer
+        Shared tracer.
+
+    Examples
+    --------
+    >>> from ansys.mechanical.core.tracing import enable_tracing
+    >>> tracer = enable_tracing("pymechanical-trace.json")
+    """
+    TRACER.start_recording()
+    if export_path is not None:
+        atexit.register(TRACER.export_json, export_path)
+    return TRACER
+
+
+def disable_tracing() -> None:
+    """Stop recording the spans of PyMechanical clients."""
+    TRACER.stop_recording()
+
+
+def current_span() -> Span | None:
+    """Get the span of the calling context, if any."""
+    return _CURRENT_SPAN.get()
+
+
+def current_correlation_id() -> str | None:
+    """Get the correlation ID of the calling context, if any."""
+    span = _CURRENT_SPAN.get()
+    return span.correlation_id if span is not None else None
+
+
+_CODING_COOKIE = re.compile(r"^[ \t\f]*#.*?coding[:=]")
+
+
+def _header_end(body: list) -> ast.stmt | None:
+    """Get the last node of the docstring and ``__future__`` imports of a module."""
+    last = None
+    for index, node in enumerate(body):
+        is_docstring = (
+            index == 0
+            and isinstance(node, ast.Expr)
+            and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, str)
+        )
+        if is_docstring or (isinstance(node, ast.ImportFrom) and node.module == "__future__"):
+            last = node
+        else:
+            break
+    return last
+
+
+def _insert(line: str, col_offset: int, text: str) -> str:
+    """Insert text in a line at a UTF-8 offset given by ``ast``."""
+    encoded = line.encode("utf-8")
+    return (encoded[:col_offset] + text.encode("utf-8") + encoded[col_offset:]).decode("utf-8")
+
+
+def add_correlation_preamble(script: str, correlation_id: str) -> str:
+    r"""Add the definition of the correlation ID variable to a script.
+
+    The assignment goes after the docstring and the ``__future__`` imports, on a line
+    that already exists when possible, so that the line numbers reported for the
+    script do not change. Otherwise, it is a new first line. The result of the last
+    statement of the script is unchanged.
+
+    Examples
+    --------
+    >>> print(add_correlation_preamble("2+3", "5f2b9c0d1e3a4b6c"))
+    pymechanical_correlation_id = "5f2b9c0d1e3a4b6c"
+    2+3
+    >>> print(add_correlation_preamble("from __future__ import annotations\nx = 1\nx", "5f2b"))
+    from __future__ import annotations; pymechanical_correlation_id = "5f2b"
+    x = 1
+    x
+    """
+    assignment = f"{CORRELATION_VARIABLE} = {json.dumps(correlation_id)}"
+    try:
+        body = ast.parse(script).body
+    except SyntaxError:
+        # Such as an IronPython 2.7 script
+        body = []
+    if body:
+        lines = script.splitlines(keepends=True)
+        header = _header_end(body)
+        first = body[0]
+        if header is not None:
+            index = header.end_lineno - 1
+            lines[index] = _insert(lines[index], header.end_col_offset, f"; {assignment}")
+            return "".join(lines)
+        # Only blank lines and comments come before the first statement
+        index = first.lineno - 2
+        if index >= 0 and not (index < 2 and _CODING_COOKIE.match(lines[index])):
+            line = lines[index]
+            ending = line[len(line.rstrip("\r\n")) :]
+            comment = line.strip()
+            lines[index] = f"{assignment}  {comment}{ending}" if comment else assignment + ending
+            return "".join(lines)
+        is_compound = hasattr(first, "body") or hasattr(first, "cases")
+        if len(body) > 1 and not is_compound:
+            index = first.lineno - 1
+            lines[index] = f"{assignment}; {lines[index]}"
+            return "".join(lines)
+    return f"{assignment}\n{script}"
+
+
+def traced(name: str):
+    """Decorate a function to run it in a span of the shared tracer.
+
+    Examples
+    --------
+    >>> @traced("pool.spawn")
+    ... def spawn(): ...
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with TRACER.span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
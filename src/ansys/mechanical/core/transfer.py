@@ -0,0 +1,1149 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Server-side helpers for resumable, verified, compressed, and deduplicated file transfers.
+
+The gRPC file transfer calls always send a whole file. To resume a transfer, the
+client runs small scripts on the server that report the size and checksum of a
+file, copy the end of a file from a byte offset, and append or rename files. To
+compress a transfer, the client sends a gzip stream that a script decompresses on
+the server, or a script compresses the file before it is downloaded. To avoid
+sending the same file twice, the server keeps a copy of the uploaded files in a
+content store, where they are named after their checksum. To update a file that
+the server already has, the client sends only the blocks that changed, as rsync
+does. To download many small files, a script packs them into one tar archive that
+the client unpacks while it arrives. The scripts are compatible with IronPython 2.7 and CPython.
+
+Server paths are passed as lists of parts that the server joins with
+``os.path.join``, so that the client does not need to know the path separator of
+the server.
+"""
+
+import hashlib
+import io
+import json
+import mmap
+from pathlib import Path
+import queue
+import shutil
+import tarfile
+import threading
+import types
+import weakref
+import zlib
+
+PART_SUFFIX = ".part"
+"""Suffix of the file that holds the bytes received so far."""
+
+SEGMENT_SUFFIX = ".pymechanical_segment"
+"""Suffix of the temporary files that hold the pieces of a resumable transfer."""
+
+DEFAULT_SEGMENT_SIZE = 64 * 1024 * 1024
+"""Default number of bytes sent in each piece of a resumable upload."""
+
+COMPRESSION_MODES = ("auto", "gzip", "grpc")
+"""Supported compression settings.
+
+* ``"gzip"``: Files are sent as gzip streams and decompressed on the other side.
+* ``"grpc"``: The messages that the client sends are compressed by gRPC.
+* ``"auto"``: Files are sent as gzip streams unless they are small or already
+  compressed, and large scripts are compressed by gRPC.
+"""
+
+DEFAULT_MIN_COMPRESS_SIZE = 64 * 1024
+"""Default size in bytes below which the ``"auto"`` setting does not compress."""
+
+COMPRESSED_EXTENSIONS = frozenset(
+    {
+        ".7z",
+        ".avi",
+        ".bz2",
+        ".docx",
+        ".gif",
+        ".gz",
+        ".jpeg",
+        ".jpg",
+        ".mp4",
+        ".png",
+        ".pptx",
+        ".tgz",
+        ".wbpz",
+        ".xlsx",
+        ".xz",
+        ".zip",
+        ".zst",
+    }
+)
+"""Extensions of the formats that are already compressed."""
+
+GZIP_SUFFIX = ".pymechanical_gz"
+"""Suffix of the temporary gzip files of a compressed transfer."""
+
+CONTENT_STORE_NAME = "pymechanical_content_store"
+"""Name of the content store directory in the per-user cache directory of the server."""
+
+CONTENT_STORE_SIZE_LIMIT = 4 * 1024**3
+"""Size in bytes above which the least recently used files of the content store are removed."""
+
+DELTA_SUFFIX = ".pymechanical_delta"
+"""Suffix of the temporary file that holds the changed blocks of a delta upload."""
+
+DEFAULT_DELTA_BLOCK_SIZE = 1024 * 1024
+"""Default size in bytes of the blocks compared by a delta upload."""
+
+DELTA_LITERAL_FRACTION = 0.5
+"""Fraction of a file not found on the server above which a delta upload sends the whole file."""
+
+ARCHIVE_SUFFIX = ".pymechanical_tar"
+"""Suffix of the temporary archive of a bulk download."""
+
+DEFAULT_READ_AHEAD = 4
+"""Default number of chunks that a streamed download reads ahead of the consumer."""
+
+_ADLER_MODULO = 65521
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+_READ_AHEAD_POLL = 0.1
+
+_PREAMBLE = """import hashlib as _pm_hashlib
+import json as _pm_json
+import os as _pm_os
+import shutil as _pm_shutil
+import gzip as _pm_gzip
+import tempfile as _pm_tempfile
+import zlib as _pm_zlib
+def _pm_sha256(path):
+    digest = _pm_hashlib.sha256()
+    with open(path, "rb") as stream:
+        while True:
+            block = stream.read(%(block)d)
+            if not block:
+                break
+            digest.update(block)
+    return digest.hexdigest()
+def _pm_info(path, checksum):
+    if not _pm_os.path.isfile(path):
+        return {"exists": False, "size": 0, "sha256": None}
+    return {
+        "exists": True,
+        "size": _pm_os.path.getsize(path),
+        "sha256": _pm_sha256(path) if checksum else None,
+    }
+""" % {"block": _HASH_BLOCK_SIZE}
+
+_FILE_INFO = """_pm_path = _pm_os.path.join(*%(path)s)
+_pm_json.dumps(_pm_info(_pm_path, %(checksum)s))
+"""
+
+_COPY_TAIL = """_pm_source = _pm_os.path.join(*%(source)s)
+_pm_target = _pm_os.path.join(*%(target)s)
+with open(_pm_source, "rb") as _pm_input:
+    _pm_input.seek(%(offset)d)
+    with open(_pm_target, "wb") as _pm_output:
+        _pm_shutil.copyfileobj(_pm_input, _pm_output, %(block)d)
+_pm_json.dumps(_pm_info(_pm_target, False))
+"""
+
+_APPEND_FILE = """_pm_source = _pm_os.path.join(*%(source)s)
+_pm_target = _pm_os.path.join(*%(target)s)
+with open(_pm_source, "rb") as _pm_input:
+    with open(_pm_target, "ab") as _pm_output:
+        _pm_shutil.copyfileobj(_pm_input, _pm_output, %(block)d)
+_pm_os.remove(_pm_source)
+_pm_json.dumps(_pm_info(_pm_target, False))
+"""
+
+_RENAME_FILE = """_pm_source = _pm_os.path.join(*%(source)s)
+_pm_target = _pm_os.path.join(*%(target)s)
+if _pm_os.path.isfile(_pm_target):
+    _pm_os.remove(_pm_target)
+_pm_os.rename(_pm_source, _pm_target)
+_pm_json.dumps(_pm_info(_pm_target, False))
+"""
+
+_COMPRESS_FILE = """_pm_source = _pm_os.path.join(*%(source)s)
+_pm_target = _pm_os.path.join(*%(target)s)
+_pm_result = _pm_info(_pm_source, False)
+_pm_result["compressed"] = _pm_result["size"] >= %(min_size)d
+if _pm_result["compressed"]:
+    with open(_pm_source, "rb") as _pm_input:
+        _pm_output = _pm_gzip.GzipFile(_pm_target, "wb", %(level)d)
+        try:
+            _pm_shutil.copyfileobj(_pm_input, _pm_output, %(block)d)
+        finally:
+            _pm_output.close()
+    _pm_result["original_size"] = _pm_result["size"]
+    _pm_result["size"] = _pm_os.path.getsize(_pm_target)
+_pm_json.dumps(_pm_result)
+"""
+
+_DECOMPRESS_FILE = """_pm_source = _pm_os.path.join(*%(source)s)
+_pm_target = _pm_os.path.join(*%(target)s)
+_pm_input = _pm_gzip.GzipFile(_pm_source, "rb")
+try:
+    with open(_pm_target, "wb") as _pm_output:
+        _pm_shutil.copyfileobj(_pm_input, _pm_output, %(block)d)
+finally:
+    _pm_input.close()
+_pm_os.remove(_pm_source)
+_pm_json.dumps(_pm_info(_pm_target, False))
+"""
+
+_CONTENT_STORE = """def _pm_content_store():
+    _pm_root = _pm_os.environ.get("LOCALAPPDATA") or _pm_os.environ.get("XDG_CACHE_HOME")
+    if not _pm_root:
+        _pm_root = _pm_os.path.join(_pm_os.path.expanduser("~"), ".cache")
+    return _pm_os.path.join(_pm_root, %(store)s)
+def _pm_place(source, target):
+    if _pm_os.path.isfile(target):
+        _pm_os.remove(target)
+    try:
+        _pm_os.link(source, target)
+    except (AttributeError, OSError):
+        _pm_shutil.copyfile(source, target)
+"""
+
+_DEDUPE_LOOKUP = """_pm_entry = _pm_os.path.join(_pm_content_store(), %(digest)s)
+_pm_target = _pm_os.path.join(*%(target)s)
+_pm_result = {"found": _pm_os.path.isfile(_pm_entry) and _pm_os.path.getsize(_pm_entry) == %(size)d}
+if _pm_result["found"] and _pm_sha256(_pm_entry) != %(digest)s:
+    # The entry or a file linked to it was changed in place
+    _pm_result["found"] = False
+    try:
+        _pm_os.remove(_pm_entry)
+    except OSError:
+        pass
+if _pm_result["found"]:
+    _pm_place(_pm_entry, _pm_target)
+    # Keep the entries used recently when the store is trimmed
+    _pm_os.utime(_pm_entry, None)
+_pm_json.dumps(_pm_result)
+"""
+
+_DEDUPE_STORE = """_pm_store = _pm_content_store()
+_pm_entry = _pm_os.path.join(_pm_store, %(digest)s)
+_pm_source = _pm_os.path.join(*%(source)s)
+if not _pm_os.path.isdir(_pm_store):
+    try:
+        _pm_os.makedirs(_pm_store, 0o700)
+    except OSError:
+        pass
+if not _pm_os.path.isfile(_pm_entry):
+    # Another session can store the same file at the same time
+    _pm_partial = "%%s.%%d.tmp" %% (_pm_entry, _pm_os.getpid())
+    _pm_place(_pm_source, _pm_partial)
+    try:
+        _pm_os.rename(_pm_partial, _pm_entry)
+    except OSError:
+        _pm_os.remove(_pm_partial)
+_pm_entries = []
+for _pm_name in _pm_os.listdir(_pm_store):
+    _pm_file = _pm_os.path.join(_pm_store, _pm_name)
+    if _pm_file != _pm_entry and not _pm_name.endswith(".tmp") and _pm_os.path.isfile(_pm_file):
+        _pm_mtime = _pm_os.path.getmtime(_pm_file)
+        _pm_entries.append((_pm_mtime, _pm_os.path.getsize(_pm_file), _pm_file))
+_pm_entries.sort()
+_pm_total = _pm_os.path.getsize(_pm_entry) + sum([_pm_size for _, _pm_size, _ in _pm_entries])
+for _pm_mtime, _pm_size, _pm_file in _pm_entries:
+    if _pm_total <= %(max_size)d:
+        break
+    try:
+        _pm_os.remove(_pm_file)
+        _pm_total -= _pm_size
+    except OSError:
+        pass
+_pm_json.dumps(_pm_info(_pm_entry, False))
+"""
+
+_BLOCK_CHECKSUMS = """_pm_path = _pm_os.path.join(*%(path)s)
+_pm_result = _pm_info(_pm_path, False)
+_pm_result["blocks"] = []
+if _pm_result["exists"]:
+    with open(_pm_path, "rb") as _pm_input:
+        while True:
+            _pm_block = _pm_input.read(%(block_size)d)
+            if not _pm_block:
+                break
+            _pm_result["blocks"].append([
+                _pm_zlib.adler32(_pm_block) & 0xFFFFFFFF,
+                _pm_hashlib.sha256(_pm_block).hexdigest(),
+                len(_pm_block),
+            ])
+_pm_json.dumps(_pm_result)
+"""
+
+_APPLY_DELTA = """_pm_target = _pm_os.path.join(*%(target)s)
+_pm_delta = _pm_os.path.join(*%(delta)s)
+_pm_partial = _pm_target + %(part_suffix)s
+_pm_digest = _pm_hashlib.sha256()
+with open(_pm_target, "rb") as _pm_old, open(_pm_delta, "rb") as _pm_new:
+    with open(_pm_partial, "wb") as _pm_output:
+        for _pm_kind, _pm_offset, _pm_length in _pm_json.loads(%(ops)s):
+            _pm_input = _pm_old if _pm_kind == "c" else _pm_new
+            _pm_input.seek(_pm_offset)
+            while _pm_length > 0:
+                _pm_piece = _pm_input.read(min(_pm_length, %(block)d))
+                if not _pm_piece:
+                    break
+                _pm_output.write(_pm_piece)
+                _pm_digest.update(_pm_piece)
+                _pm_length -= len(_pm_piece)
+_pm_result = {"sha256": _pm_digest.hexdigest(), "applied": False}
+if _pm_result["sha256"] == %(sha256)s:
+    _pm_os.remove(_pm_target)
+    _pm_os.rename(_pm_partial, _pm_target)
+    _pm_result["applied"] = True
+else:
+    _pm_os.remove(_pm_partial)
+_pm_os.remove(_pm_delta)
+_pm_json.dumps(_pm_result)
+"""
+
+_ARCHIVE_FILES = """import tarfile as _pm_tarfile
+_pm_root = _pm_os.path.join(*%(root)s)
+_pm_handle, _pm_target = _pm_tempfile.mkstemp(suffix=%(suffix)s)
+_pm_os.close(_pm_handle)
+_pm_result = {"path": _pm_target, "files": 0, "original_size": 0}
+if %(compress)s:
+    _pm_archive = _pm_tarfile.open(_pm_target, "w:gz", compresslevel=%(level)d)
+else:
+    _pm_archive = _pm_tarfile.open(_pm_target, "w")
+try:
+    for _pm_file in _pm_json.loads(%(files)s):
+        if _pm_os.path.isfile(_pm_file):
+            _pm_archive.add(_pm_file, _pm_os.path.relpath(_pm_file, _pm_root))
+            _pm_result["files"] += 1
+            _pm_result["original_size"] += _pm_os.path.getsize(_pm_file)
+finally:
+    _pm_archive.close()
+_pm_result["size"] = _pm_os.path.getsize(_pm_target)
+_pm_json.dumps(_pm_result)
+"""
+
+_REMOVE_FILE = """_pm_path = _pm_os.path.join(*%(path)s)
+if _pm_os.path.isfile(_pm_path):
+    _pm_os.remove(_pm_path)
+_pm_json.dumps(_pm_info(_pm_path, False))
+"""
+
+
+def _parts(path) -> str:
+    """Get the literal of the parts of a server path."""
+    if isinstance(path, str):
+        path = [path]
+    return json.dumps([str(part) for part in path])
+
+
+def file_info_script(path, checksum: bool = False) -> str:
+    """Get the script that reports the size and, optionally, the checksum of a server file.
+
+    Parameters
+    ----------
+    path : str or list[str]
+        Path of the file on the server, or the parts of the path.
+    checksum : bool, optional
+        Whether to compute the SHA-256 checksum of the file. The default is ``False``.
+
+    Returns
+    -------
+    str
+        Script whose result is a JSON object with the ``exists``, ``size``, and
+        ``sha256`` keys.
+    """
+    return _PREAMBLE + _FILE_INFO % {"path": _parts(path), "checksum": repr(bool(checksum))}
+
+
+def copy_tail_script(source, target, offset: int) -> str:
+    """Get the script that copies the end of a server file, from a byte offset, to another file.
+
+    Parameters
+    ----------
+    source : str or list[str]
+        Path of the file to read on the server.
+    target : str or list[str]
+        Path of the file to write on the server.
+    offset : int
+        Number of bytes to skip at the start of the source file.
+
+    Returns
+    -------
+    str
+        Script whose result is the JSON information of the target file.
+    """
+    return _PREAMBLE + _COPY_TAIL % {
+        "source": _parts(source),
+        "target": _parts(target),
+        "offset": offset,
+        "block": _HASH_BLOCK_SIZE,
+    }
+
+
+def append_file_script(source, target) -> str:
+    """Get the script that appends a server file to another and removes it.
+
+    Parameters
+    ----------
+    source : str or list[str]
+        Path of the file to append on the server.
+    target : str or list[str]
+        Path of the file to append to on the server.
+
+    Returns
+    -------
+    str
+        Script whose result is the JSON information of the target file.
+    """
+    return _PREAMBLE + _APPEND_FILE % {
+        "source": _parts(source),
+        "target": _parts(target),
+        "block": _HASH_BLOCK_SIZE,
+    }
+
+
+def rename_file_script(source, target) -> str:
+    """Get the script that renames a server file, replacing the target if it exists.
+
+    Parameters
+    ----------
+    source : str or list[str]
+        Path of the file to rename on the server.
+    target : str or list[str]
+        New path of the file on the server.
+
+    Returns
+    -------
+    str
+        Script whose result is the JSON information of the renamed file.
+    """
+    return _PREAMBLE + _RENAME_FILE % {"source": _parts(source), "target": _parts(target)}
+
+
+def remove_file_script(path) -> str:
+    """Get the script that removes a server file if it exists.
+
+    Parameters
+    ----------
+    path : str or list[str]
+        Path of the file to remove on the server.
+
+    Returns
+    -------
+    str
+        Script whose result is the JSON information of the removed file.
+    """
+    return _PREAMBLE + _REMOVE_FILE % {"path": _parts(path)}
+
+
+def compress_file_script(source, target, min_size: int = 0, level: int = 6) -> str:
+    """Get the script that writes a gzip copy of a server file.
+
+    Parameters
+    ----------
+    source : str or list[str]
+        Path of the file to compress on the server.
+    target : str or list[str]
+        Path of the gzip file to write on the server.
+    min_size : int, optional
+        Size in bytes below which the file is not compressed. The default is ``0``.
+    level : int, optional
+        Compression level, from ``1`` to ``9``. The default is ``6``.
+
+    Returns
+    -------
+    str
+        Script whose result is a JSON object. If the ``compressed`` key is true, it
+        holds the size of the gzip file and the size of the source file in the
+        ``original_size`` key. Otherwise, it holds the information of the source file.
+    """
+    return _PREAMBLE + _COMPRESS_FILE % {
+        "source": _parts(source),
+        "target": _parts(target),
+        "min_size": min_size,
+        "level": level,
+        "block": _HASH_BLOCK_SIZE,
+    }
+
+
+def decompress_file_script(source, target) -> str:
+    """Get the script that decompresses a server gzip file and removes it.
+
+    Parameters
+    ----------
+    source : str or list[str]
+        Path of the gzip file on the server.
+    target : str or list[str]
+        Path of the decompressed file to write on the server.
+
+    Returns
+    -------
+    str
+        Script whose result is the JSON information of the decompressed file.
+    """
+    return _PREAMBLE + _DECOMPRESS_FILE % {
+        "source": _parts(source),
+        "target": _parts(target),
+        "block": _HASH_BLOCK_SIZE,
+    }
+
+
+def dedupe_lookup_script(digest: str, size: int, target) -> str:
+    """Get the script that copies a file from the content store if it holds it.
+
+    Parameters
+    ----------
+    digest : str
+        SHA-256 checksum of the file.
+    size : int
+        Size of the file in bytes.
+    target : str or list[str]
+        Path on the server where the file is copied.
+
+    Returns
+    -------
+    str
+        Script whose result is a JSON object whose ``found`` key tells whether the
+        file was copied.
+    """
+    store = _CONTENT_STORE % {"store": json.dumps(CONTENT_STORE_NAME)}
+    lookup = _DEDUPE_LOOKUP % {
+        "digest": json.dumps(digest),
+        "size": size,
+        "target": _parts(target),
+    }
+    return _PREAMBLE + store + lookup
+
+
+def dedupe_store_script(source, digest: str, max_size: int = CONTENT_STORE_SIZE_LIMIT) -> str:
+    """Get the script that adds a server file to the content store.
+
+    The least recently used files of the store are removed while the store is larger
+    than ``max_size``.
+
+    Parameters
+    ----------
+    source : str or list[str]
+        Path of the uploaded file on the server.
+    digest : str
+        SHA-256 checksum of the file.
+    max_size : int, optional
+        Size of the store in bytes above which files are removed. The default is
+        ``CONTENT_STORE_SIZE_LIMIT``.
+
+    Returns
+    -------
+    str
+        Script whose result is the JSON information of the stored file.
+    """
+    store = _CONTENT_STORE % {"store": json.dumps(CONTENT_STORE_NAME)}
+    add = _DEDUPE_STORE % {
+        "digest": json.dumps(digest),
+        "source": _parts(source),
+        "max_size": max_size,
+    }
+    return _PREAMBLE + store + add
+
+
+def block_checksums_script(path, block_size: int = DEFAULT_DELTA_BLOCK_SIZE) -> str:
+    """Get the script that computes the checksums of the blocks of a server file.
+
+    Parameters
+    ----------
+    path : str or list[str]
+        Path of the file on the server.
+    block_size : int, optional
+        Size of the blocks in bytes. The default is 1 MB.
+
+    Returns
+    -------
+    str
+        Script whose result is the JSON information of the file, with a
+        ``[adler32, sha256, size]`` list for each block in the ``blocks`` key.
+    """
+    return _PREAMBLE + _BLOCK_CHECKSUMS % {"path": _parts(path), "block_size": block_size}
+
+
+def apply_delta_script(target, delta, ops: list, sha256: str) -> str:
+    """Get the script that rebuilds a server file from its blocks and the changed bytes.
+
+    The file is replaced only if the checksum of the rebuilt file matches.
+
+    Parameters
+    ----------
+    target : str or list[str]
+        Path of the file to update on the server.
+    delta : str or list[str]
+        Path of the uploaded file that holds the changed bytes. It is removed.
+    ops : list
+        Operations returned by :func:`compute_delta`.
+    sha256 : str
+        SHA-256 checksum of the local file.
+
+    Returns
+    -------
+    str
+        Script whose result is a JSON object whose ``applied`` key tells whether the
+        file was replaced.
+    """
+    return _PREAMBLE + _APPLY_DELTA % {
+        "target": _parts(target),
+        "delta": _parts(delta),
+        "part_suffix": json.dumps(PART_SUFFIX),
+        "ops": json.dumps(json.dumps(ops)),
+        "sha256": json.dumps(sha256),
+        "block": _HASH_BLOCK_SIZE,
+    }
+
+
+def archive_files_script(root, files: list, compress: bool = True, level: int = 6) -> str:
+    """Get the script that packs server files into a temporary tar archive.
+
+    Parameters
+    ----------
+    root : str or list[str]
+        Directory of the server against which the names in the archive are relative.
+    files : list[str]
+        Paths of the files to pack on the server. Missing files are skipped.
+    compress : bool, optional
+        Whether to compress the archive with gzip. The default is ``True``.
+    level : int, optional
+        Compression level, from ``1`` to ``9``. The default is ``6``.
+
+    Returns
+    -------
+    str
+        Script whose result is a JSON object with the ``path`` and ``size`` of the
+        archive, the number of packed ``files``, and their ``original_size``.
+    """
+    return _PREAMBLE + _ARCHIVE_FILES % {
+        "root": _parts(root),
+        "suffix": json.dumps(ARCHIVE_SUFFIX),
+        "compress": bool(compress),
+        "level": level,
+        "files": json.dumps(json.dumps([str(file) for file in files])),
+    }
+
+
+def _roll(checksum: int, out_byte: int, in_byte: int, window: int) -> int:
+    """Move an Adler-32 checksum one byte forward in the data."""
+    a = (checksum & 0xFFFF) - out_byte + in_byte
+    b = (checksum >> 16) - window * out_byte - 1 + a
+    return ((b % _ADLER_MODULO) << 16) | (a % _ADLER_MODULO)
+
+
+def compute_delta(
+    path, blocks: list, block_size: int, literal_stream, max_literal: int | None = None
+) -> list | None:
+    """Find the blocks of a server file in a local file and write the other bytes.
+
+    The local file is scanned with a rolling Adler-32 checksum, as rsync does, so
+    that blocks are found even when bytes were inserted or removed before them.
+    Unchanged regions are compared a block at a time, and the byte-by-byte search
+    only runs in the changed regions, so the time of the scan grows with the
+    changed bytes. The scan stops once more than ``max_literal`` bytes are not found.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Path of the local file.
+    blocks : list
+        ``[adler32, sha256, size]`` list for each block of the server file, as
+        returned by :func:`block_checksums_script`.
+    block_size : int
+        Size of the blocks in bytes.
+    literal_stream : io.BufferedWriter
+        Binary stream that receives the bytes not found on the server.
+    max_literal : int, optional
+        Number of bytes not found on the server above which the scan stops. The
+        default is ``None``, in which case the whole file is scanned.
+
+    Returns
+    -------
+    list or None
+        Operations that rebuild the local file. ``["c", offset, length]`` copies
+        bytes of the server file, and ``["d", offset, length]`` copies bytes of the
+        literal stream. ``None`` if the scan stopped at ``max_literal``.
+
+    Examples
+    --------
+    >>> with open("model.delta", "wb") as stream:
+    ...     ops = compute_delta("model.mechdb", blocks, 1024 * 1024, stream)
+    """
+    index = {}
+    for number, (weak, strong, size) in enumerate(blocks):
+        if size == block_size:
+            index.setdefault(weak, {}).setdefault(strong, number)
+    last = blocks[-1] if blocks and blocks[-1][2] != block_size else None
+
+    ops = []
+    written = 0
+
+    def emit(kind, offset, length):
+        previous = ops[-1] if ops else None
+        if previous and previous[0] == kind and previous[1] + previous[2] == offset:
+            previous[2] += length
+        elif length:
+            ops.append([kind, offset, length])
+
+    def find(weak, window):
+        candidates = index.get(weak)
+        if candidates:
+            return candidates.get(hashlib.sha256(window).hexdigest())
+        return None
+
+    with Path(path).open("rb") as stream:
+        size = Path(path).stat().st_size
+        data = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        try:
+            position = literal = 0
+            while position + block_size <= size:
+                checksum = zlib.adler32(data[position : position + block_size])
+                number = find(checksum, data[position : position + block_size])
+                limit = min(position + block_size, size - block_size)
+                while number is None and position < limit:
+                    checksum = _roll(
+                        checksum, data[position], data[position + block_size], block_size
+                    )
+                    position += 1
+                    if checksum in index:
+                        number = find(checksum, data[position : position + block_size])
+                if number is None:
+                    if max_literal is not None and written + position - literal > max_literal:
+                        return None
+                    if position >= size - block_size:
+                        break
+                    continue
+                literal_stream.write(data[literal:position])
+                emit("d", written, position - literal)
+                written += position - literal
+                emit("c", number * block_size, block_size)
+                position += block_size
+                literal = position
+
+            tail = data[position:size]
+            if last is not None and len(tail) == last[2]:
+                if hashlib.sha256(tail).hexdigest() == last[1]:
+                    literal_stream.write(data[literal:position])
+                    emit("d", written, position - literal)
+                    written += position - literal
+                    emit("c", (len(blocks) - 1) * block_size, last[2])
+                    literal = size
+            if max_literal is not None and written + size - literal > max_literal:
+                return None
+            literal_stream.write(data[literal:size])
+            emit("d", written, size - literal)
+        finally:
+            if size:
+                data.close()
+    return ops
+
+
+def check_compression(compression):
+    """Check a compression setting.
+
+    Parameters
+    ----------
+    compression : str or None
+        Compression setting, which is one of :data:`COMPRESSION_MODES` or ``None``.
+
+    Returns
+    -------
+    str or None
+        The compression setting.
+
+    Raises
+    ------
+    ValueError
+        If the setting is not supported.
+    """
+    if compression is not None and compression not in COMPRESSION_MODES:
+        raise ValueError(
+            f"The compression setting '{compression}' is not supported. "
+            f"Options are {', '.join(COMPRESSION_MODES)}, and ``None``."
+        )
+    return compression
+
+
+def should_compress(name, size: int, min_size: int = DEFAULT_MIN_COMPRESS_SIZE) -> bool:
+    """Whether the automatic policy compresses a file.
+
+    Small files and files in a compressed format are not compressed.
+
+    Parameters
+    ----------
+    name : str or pathlib.Path
+        Name of the file.
+    size : int
+        Size of the file in bytes.
+    min_size : int, optional
+        Size in bytes below which the file is not compressed. The default is 64 kB.
+
+    Examples
+    --------
+    >>> from ansys.mechanical.core.transfer import should_compress
+    >>> should_compress("file.rst", 10_000_000)
+    True
+    >>> should_compress("geometry.zip", 10_000_000)
+    False
+    """
+    return size >= min_size and Path(name).suffix.lower() not in COMPRESSED_EXTENSIONS
+
+
+def gzip_chunks(stream, chunk_size: int, level: int = 6):
+    """Compress a binary stream into gzip chunks.
+
+    Parameters
+    ----------
+    stream : io.BufferedReader
+        Binary stream to compress.
+    chunk_size : int
+        Number of bytes read from the stream at a time.
+    level : int, optional
+        Compression level, from ``1`` to ``9``. The default is ``6``.
+
+    Yields
+    ------
+    bytes
+        Pieces of the gzip stream, which are never empty.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    pending = b""
+    for block in iter(lambda: stream.read(chunk_size), b""):
+        pending += compressor.compress(block)
+        if len(pending) >= chunk_size:
+            yield pending
+            pending = b""
+    pending += compressor.flush()
+    if pending:
+        yield pending
+
+
+def gunzip_responses(responses, original_size: int, record=None):
+    """Decompress the chunks of a download of a gzip file.
+
+    Parameters
+    ----------
+    responses : Iterable
+        Messages of the ``DownloadFile`` call.
+    original_size : int
+        Size of the file before compression, reported as the size of the download.
+    record : CallRecord, optional
+        Record whose ``bytes_received`` counter receives the compressed bytes.
+
+    Yields
+    ------
+    types.SimpleNamespace
+        Messages with the ``chunk.payload`` and ``file_size`` fields of the
+        decompressed file.
+    """
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for response in responses:
+        if record is not None:
+            record.bytes_received += len(response.chunk.payload)
+        payload = decompressor.decompress(response.chunk.payload)
+        if payload:
+            yield _message(payload, original_size)
+    payload = decompressor.flush()
+    if payload:
+        yield _message(payload, original_size)
+
+
+def _message(payload, file_size):
+    """Create a message that looks like a ``DownloadFile`` response."""
+    return types.SimpleNamespace(chunk=types.SimpleNamespace(payload=payload), file_size=file_size)
+
+
+class StreamCall:
+    """Handle on a streaming call that another thread can cancel.
+
+    The call is set by the thread that starts it. If the handle was cancelled
+    before, the call is cancelled as soon as it is set.
+    """
+
+    def __init__(self):
+        """Create a handle without a call."""
+        self._lock = threading.Lock()
+        self._call = None
+        self._cancelled = False
+
+    def set(self, call) -> None:
+        """Set the call, cancelling it if the handle was cancelled."""
+        with self._lock:
+            self._call = call
+            cancelled = self._cancelled
+        if cancelled:
+            _cancel_call(call)
+
+    def cancel(self) -> None:
+        """Cancel the call, now or once it is set."""
+        with self._lock:
+            self._cancelled = True
+            call = self._call
+        if call is not None:
+            _cancel_call(call)
+
+
+def _cancel_call(call) -> None:
+    """Cancel a call if it can be cancelled."""
+    cancel = getattr(call, "cancel", None)
+    if cancel is not None:
+        cancel()
+
+
+def _put(items: queue.Queue, stopped: threading.Event, item) -> bool:
+    """Queue an item unless the consumer stopped, and tell whether it was queued."""
+    while not stopped.is_set():
+        try:
+            items.put(item, timeout=_READ_AHEAD_POLL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _read_ahead(chunks, items: queue.Queue, stopped: threading.Event) -> None:
+    """Read the chunks into the queue until they end or the consumer stops.
+
+    It does not reference the :class:`ReadAhead` object, so that an abandoned
+    object can be garbage collected and stop the thread.
+    """
+    try:
+        for chunk in chunks:
+            if not _put(items, stopped, ("chunk", chunk)):
+                return
+    except BaseException as error:
+        _put(items, stopped, ("error", error))
+    else:
+        _put(items, stopped, ("end", None))
+    finally:
+        close = getattr(chunks, "close", None)
+        if close is not None:
+            close()
+
+
+def _stop_read_ahead(stopped: threading.Event, call: StreamCall | None) -> None:
+    """Stop the background thread of a read-ahead and cancel its call."""
+    stopped.set()
+    if call is not None:
+        call.cancel()
+
+
+class ReadAhead:
+    """Iterator that reads the chunks of a download in a background thread.
+
+    Up to ``depth`` chunks are read before the consumer asks for them, so that the
+    download continues while the consumer processes a chunk and the memory stays
+    bounded. Errors of the download are raised by the consumer.
+
+    The download stops when the iterator is closed or garbage collected, so a
+    consumer that breaks out of a loop does not keep it running.
+
+    Parameters
+    ----------
+    chunks : Iterable[bytes]
+        Chunks to read. If it is a generator, it runs and is closed in the
+        background thread.
+    depth : int, optional
+        Maximum number of chunks read ahead. The default is ``4``.
+    call : StreamCall, optional
+        Handle on the call that produces the chunks. It is cancelled on close, so
+        that the download is released even if the server stalls.
+
+    Examples
+    --------
+    >>> with ReadAhead(chunks, depth=8) as stream:
+    ...     for chunk in stream:
+    ...         digest.update(chunk)
+    """
+
+    def __init__(self, chunks, depth: int = DEFAULT_READ_AHEAD, call: StreamCall | None = None):
+        """Start reading the chunks."""
+        self._queue = queue.Queue(maxsize=max(depth, 1))
+        self._stopped = threading.Event()
+        self._done = False
+        self._finalizer = weakref.finalize(self, _stop_read_ahead, self._stopped, call)
+        self._thread = threading.Thread(
+            target=_read_ahead, args=(chunks, self._queue, self._stopped), daemon=True
+        )
+        self._thread.start()
+
+    def __iter__(self):
+        """Get the iterator, which is the object itself."""
+        return self
+
+    def __next__(self) -> bytes:
+        """Get the next chunk, waiting for it if it was not read yet."""
+        if self._done:
+            raise StopIteration
+        kind, value = self._queue.get()
+        if kind == "chunk":
+            return value
+        self._done = True
+        if kind == "error":
+            raise value
+        raise StopIteration
+
+    def close(self) -> None:
+        """Stop reading the chunks and cancel the call that produces them."""
+        self._done = True
+        self._finalizer()
+
+    def __enter__(self):
+        """Enter the context."""
+        return self
+
+    def __exit__(self, *args):
+        """Stop reading the chunks."""
+        self.close()
+
+
+class ChunkReader(io.RawIOBase):
+    """Readable stream over the chunks of a download.
+
+    Parameters
+    ----------
+    chunks : Iterable[bytes]
+        Chunks of the download. They are read only as the stream is read. If they
+        have a ``close`` method, it is called when the stream is closed.
+    record : CallRecord, optional
+        Record whose ``bytes_received`` and ``chunks_received`` counters are updated.
+    callback : callable, optional
+        Function called with the number of bytes of each chunk received.
+    """
+
+    def __init__(self, chunks, record=None, callback=None):
+        """Initialize the stream."""
+        super().__init__()
+        self._source = chunks
+        self._chunks = iter(chunks)
+        self._record = record
+        self._callback = callback
+        self._chunk = memoryview(b"")
+
+    def readable(self) -> bool:
+        """Whether the stream can be read, which is always true."""
+        return True
+
+    def readinto(self, buffer) -> int:
+        """Read the next bytes into a buffer, waiting for the next chunk if needed."""
+        while not self._chunk:
+            try:
+                payload = next(self._chunks)
+            except StopIteration:
+                return 0
+            self._chunk = memoryview(payload)
+            if self._record is not None:
+                self._record.bytes_received += len(payload)
+                self._record.chunks_received += 1
+            if self._callback is not None:
+                self._callback(len(payload))
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+    def close(self) -> None:
+        """Close the stream and the chunks."""
+        if not self.closed:
+            close = getattr(self._source, "close", None)
+            if close is not None:
+                close()
+        super().close()
+
+
+def extract_archive(stream, target_dir) -> list[Path]:
+    """Unpack the files of a tar stream, compressed or not, as it is read.
+
+    Parameters
+    ----------
+    stream : io.RawIOBase
+        Stream of the archive, such as a :class:`ChunkReader`.
+    target_dir : str or pathlib.Path
+        Local directory in which the files are written.
+
+    Returns
+    -------
+    list[pathlib.Path]
+        Paths of the unpacked files.
+
+    Raises
+    ------
+    OSError
+        If a name in the archive points outside of the target directory.
+    """
+    target_dir = Path(target_dir).resolve()
+    files = []
+    with tarfile.open(fileobj=stream, mode="r|*") as archive:
+        for member in archive:
+            if not member.isfile():
+                continue
+            path = (target_dir / member.name).resolve()
+            if not path.is_relative_to(target_dir):
+                raise OSError(f"The archive holds a file outside of '{target_dir}': {member.name}")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("wb") as output:
+                shutil.copyfileobj(archive.extractfile(member), output, _HASH_BLOCK_SIZE)
+            files.append(path)
+    return files
+
+
+def local_sha256(path) -> str:
+    """Compute the SHA-256 checksum of a local file.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Path of the file.
+
+    Returns
+    -------
+    str
+        Hexadecimal checksum of the file.
+
+    Examples
+    --------
+    >>> from ansys.mechanical.core.transfer import local_sha256
+    >>> local_sha256("hsec.x_t")
+    '5d41402abc4b2a76b9719d911017c592...'
+    """
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as stream:
+        for block in iter(lambda: stream.read(_HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def part_path(path) -> Path:
+    """Get the path of the partial file of a download.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Path of the downloaded file.
+
+    Returns
+    -------
+    pathlib.Path
+        Path of the file that holds the bytes downloaded so far.
+    """
+    path = Path(path)
+    return path.with_name(path.name + PART_SUFFIX)
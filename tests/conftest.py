@@ -30,6 +30,7 @@ import shutil
 import subprocess
 import sys
 import time
+import weakref
 
 import ansys.tools.common.path as atp
 import pytest
@@ -180,6 +181,113 @@ def assets():
     return root_folder / "assets"
 
 
+def run_script_locally(script: str):
+    """Run a server script in this process and return the value of its last line."""
+    lines = script.rstrip().splitlines()
+    namespace = {}
+    exec("\n".join(lines[:-1]), namespace)
+    return eval(lines[-1], namespace)
+
+
+class FakeResponse:
+    """Message of a streaming call of a fake stub."""
+
+    def __init__(self, **fields):
+        self.__dict__.update(fields)
+
+
+class FakeChunk:
+    """Chunk of a file sent by a fake stub."""
+
+    def __init__(self, payload):
+        self.payload = payload
+
+
+class LocalStub:
+    """Stub whose server is the local file system.
+
+    Scripts run in this process, and transfers read and write local files. The
+    transfers fail after ``fail_after`` bytes if it is set.
+    """
+
+    def __init__(self, fail_after=None):
+        self.fail_after = fail_after
+        self.downloaded = 0
+        self.uploaded = 0
+        self.script_calls = 0
+        self.options = []
+
+    def RunPythonScript(self, request, **options):  # noqa: N802
+        """Run the script locally and return the value of its last line."""
+        self.script_calls += 1
+        self.options.append(options)
+        result = str(run_script_locally(request.script_code))
+        yield FakeResponse(log_info="__done__", script_result=result)
+
+    def DownloadFile(self, request, **options):  # noqa: N802
+        """Send the file in chunks, failing after a number of bytes if requested."""
+        data = Path(request.file_path).read_bytes()
+        for start in range(0, len(data), request.chunk_size):
+            if self.fail_after is not None and self.downloaded >= self.fail_after:
+                raise ConnectionError("The stream dropped.")
+            payload = data[start : start + request.chunk_size]
+            self.downloaded += len(payload)
+            yield FakeResponse(chunk=FakeChunk(payload), file_size=len(data))
+
+    def UploadFile(self, requests, **options):  # noqa: N802
+        """Write the chunks to the file, failing after a number of bytes if requested."""
+        self.options.append(options)
+        stream = None
+        try:
+            for request in requests:
+                if stream is None:
+                    stream = (Path(request.file_location) / request.file_name).open("wb")
+                if self.fail_after is not None and self.uploaded >= self.fail_after:
+                    raise ConnectionError("The stream dropped.")
+                stream.write(request.chunk.payload)
+                self.uploaded += len(request.chunk.payload)
+        finally:
+            if stream is not None:
+                stream.close()
+        return FakeResponse(is_ok=True)
+
+
+def make_fake_mechanical(stub):
+    """Create a client that talks to a fake stub instead of a Mechanical server."""
+    from ansys.mechanical.core.concurrency import CallScheduler
+    from ansys.mechanical.core.logging import ServerLogBuffer
+    from ansys.mechanical.core.mechanical import Mechanical
+
+    mechanical = Mechanical.__new__(Mechanical)
+    mechanical._exited = False
+    mechanical._stub = stub
+    mechanical._scheduler = CallScheduler()
+    mechanical._metrics = None
+    mechanical._disable_logging = True
+    mechanical._log = None
+    mechanical._log_file_mechanical = None
+    mechanical._journal = None
+    mechanical._python_script_api_version = 1
+    mechanical._channel = None
+    mechanical._instance_id = 0
+    mechanical._server_logs = ServerLogBuffer(weakref.WeakMethod(mechanical.log_message))
+    mechanical._local = False
+    return mechanical
+
+
+@pytest.fixture()
+def make_mechanical():
+    """Return a factory of clients that talk to a fake stub, such as :class:`LocalStub`."""
+    return make_fake_mechanical
+
+
+@pytest.fixture()
+def local_mechanical(tmp_path, monkeypatch):
+    """Client whose server is the local file system, with ``tmp_path`` as working directory."""
+    monkeypatch.chdir(tmp_path)
+    return make_fake_mechanical(LocalStub())
+
+
 def ensure_embedding() -> None:
     """Ensure that embedding is available."""
     from ansys.mechanical.core import HAS_EMBEDDING
@@ -389,10 +497,12 @@ def connect_to_mechanical_instance(port=None, clear_on_connect=False):
     return mechanical
 
 
-def launch_rpc_embedded_server(port: int, version: int, server_script: str):
-    """Start the server as a subprocess using `port`."""
+def launch_rpc_embedded_server(port: int, version: int, server_script: str, *args: str):
+    """Start the server as a subprocess using `port`, passing `args` to the script."""
     env_copy = os.environ.copy()
-    p = subprocess.Popen([sys.executable, server_script, str(port), str(version)], env=env_copy)
+    p = subprocess.Popen(
+        [sys.executable, server_script, str(port), str(version), *args], env=env_copy
+    )
     return p
 
 
@@ -404,15 +514,13 @@ def connect_rpc_embedded_server(port: int):
     return client
 
 
-def _launch_mechanical_rpyc_server(rootdir: str, version: int):
+def _launch_mechanical_rpyc_server(rootdir: str, version: int, *args: str):
     """Start rpyc server process, return the process object."""
     from ansys.mechanical.core.embedding.rpc.utils import get_free_port
 
     server_py = Path(rootdir) / "tests" / "scripts" / "rpc_server_embedded.py"
     port = get_free_port()
-    embedded_server = launch_rpc_embedded_server(
-        port=port, version=version, server_script=server_py
-    )
+    embedded_server = launch_rpc_embedded_server(port, version, server_py, *args)
     return embedded_server, port
 
 
@@ -37,6 +37,7 @@ from ansys.mechanical.core.embedding.app import _normalize_file_path, is_initial
 from ansys.mechanical.core.embedding.cleanup_gui import cleanup_gui
 from ansys.mechanical.core.embedding.initializer import SUPPORTED_MECHANICAL_EMBEDDING_VERSIONS
 from ansys.mechanical.core.embedding.logger import Logger
+from ansys.mechanical.core.embedding.poster import CoalescingPoster, PosterError
 from ansys.mechanical.core.embedding.ui import _launch_ui
 import ansys.mechanical.core.embedding.utils as utils
 
@@ -260,6 +261,89 @@ def test_app_poster(embedded_app, printer):
     assert str(error[0]) == "TestException"
 
 
+# @pytest.mark.embedding
+@pytest.mark.skip(reason="This test hangs on Linux with Python 3.11-3.14")
+def test_app_poster_post_many(embedded_app):
+    """Test posting several callables to the main thread at once."""
+    poster = embedded_app.poster
+    results = []
+
+    def post_many_async():
+        def get_name():
+            return embedded_app.DataModel.Project.Name
+
+        def change_name():
+            embedded_app.DataModel.Project.Name = "bar"
+
+        def raise_ex():
+            raise Exception("TestException")
+
+        results.extend(poster.post_many([get_name, change_name, raise_ex, get_name]))
+
+    import threading
+
+    thread = threading.Thread(target=post_many_async)
+    thread.start()
+    while thread.is_alive():
+        utils.sleep(40)
+    thread.join()
+    assert results[0] == "Project"
+    assert results[1] is None
+    assert isinstance(results[2], PosterError)
+    assert str(results[2].error) == "TestException"
+    assert results[3] == "bar"
+
+
+class _RecordingPoster:
+    """Poster that runs the batches on the calling thread and records them."""
+
+    def __init__(self):
+        self.batches = []
+
+    def post_many(self, callables):
+        self.batches.append(len(callables))
+        results = []
+        for callable in callables:
+            try:
+                results.append(callable())
+            except Exception as e:
+                results.append(PosterError(e))
+        return results
+
+
+def test_coalescing_poster_batches_calls():
+    """Test that calls from several threads are posted in batches."""
+    import threading
+
+    poster = _RecordingPoster()
+    coalescing_poster = CoalescingPoster(poster, window=0.05)
+    release = threading.Event()
+    futures = [coalescing_poster.submit(release.wait)]
+    futures += [coalescing_poster.submit(lambda i=i: i * 2) for i in range(10)]
+    release.set()
+    assert [future.result(timeout=10) for future in futures[1:]] == [i * 2 for i in range(10)]
+    assert sum(poster.batches) == 11
+    assert len(poster.batches) < 11
+
+    with pytest.raises(ZeroDivisionError):
+        coalescing_poster.post(lambda: 1 / 0)
+    assert coalescing_poster.try_post(lambda: "done") == "done"
+
+    coalescing_poster.close()
+    with pytest.raises(RuntimeError):
+        coalescing_poster.submit(lambda: None)
+
+
+def test_coalescing_poster_max_batch():
+    """Test that a batch never holds more than `max_batch` calls."""
+    poster = _RecordingPoster()
+    coalescing_poster = CoalescingPoster(poster, window=0.05, max_batch=3)
+    futures = [coalescing_poster.submit(lambda i=i: i) for i in range(7)]
+    coalescing_poster.close()
+    assert [future.result() for future in futures] == list(range(7))
+    assert max(poster.batches) <= 3
+
+
 @pytest.mark.embedding
 def test_app_getters_notstale(embedded_app):
     """The getters of app should be usable after a new().
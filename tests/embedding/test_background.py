@@ -86,3 +86,26 @@ def test_background_app_initialize_stopped(rootdir, run_subprocess, pytestconfig
         run_subprocess, rootdir, pytestconfig, "test_background_app_initialize_stopped", False
     )
     assert "Cannot initialize a BackgroundApp once it has been stopped!" in stderr
+
+
+@pytest.mark.embedding_scripts
+@pytest.mark.embedding_backgroundapp
+@pytest.mark.skipif(sys.platform == "win32", reason="Test not working on Windows")
+def test_background_app_post_async(rootdir, run_subprocess, pytestconfig):
+    """Work queued with post_async runs on the background thread and reports errors."""
+    stderr = _run_background_app_test(
+        run_subprocess, rootdir, pytestconfig, "test_background_app_post_async", True
+    )
+    assert "Project Project Project async" in stderr
+    assert "Failed on the background thread" in stderr
+    assert "stopped" in stderr
+
+
+@pytest.mark.embedding_scripts
+@pytest.mark.embedding_backgroundapp
+@pytest.mark.skipif(sys.platform == "win32", reason="Test not working on Windows")
+def test_async_app(rootdir, run_subprocess, pytestconfig):
+    """Work awaited through AsyncApp runs on the background thread."""
+    stderr = _run_background_app_test(run_subprocess, rootdir, pytestconfig, "test_async_app", True)
+    assert "Project Project Project gathered" in stderr
+    assert "5 script" in stderr
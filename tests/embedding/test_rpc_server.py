@@ -0,0 +1,94 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test for the embedded RPC server."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("rpyc")
+
+import conftest  # noqa: E402
+
+from ansys.mechanical.core.embedding.poster import CoalescingPoster, PosterError  # noqa: E402
+from ansys.mechanical.core.embedding.rpc.server import ForegroundAppBackend  # noqa: E402
+
+
+class RecordingPoster:
+    """Poster that runs the callables on the calling thread and records how."""
+
+    def __init__(self):
+        self.calls = []
+
+    def try_post(self, callable):
+        """Run one callable."""
+        self.calls.append("try_post")
+        return callable()
+
+    def post_many(self, callables):
+        """Run a batch of callables."""
+        self.calls.append("post_many")
+        results = []
+        for callable in callables:
+            try:
+                results.append(callable())
+            except Exception as e:
+                results.append(PosterError(e))
+        return results
+
+
+class FakeApp:
+    """App with a recording poster."""
+
+    def __init__(self):
+        self.poster = RecordingPoster()
+
+
+def test_foreground_backend_coalesces_after_start():
+    """Test that calls are posted directly until the main thread starts pumping."""
+    app = FakeApp()
+    backend = ForegroundAppBackend(app, coalesce_window=0.001)
+    # The server gets the app repr from the main thread before it pumps
+    assert backend.try_post(lambda: "repr") == "repr"
+    assert app.poster.calls == ["try_post"]
+
+    backend.start()
+    assert isinstance(backend._poster, CoalescingPoster)
+    assert backend.try_post(lambda: 2 + 3) == 5
+    assert app.poster.calls[-1] == "post_many"
+    assert backend.in_flight == 0
+    backend.close()
+
+
+@pytest.mark.embedding_scripts
+def test_embedded_server_with_coalesce_window(pytestconfig, rootdir):
+    """Test that a server with a coalesce window starts and answers concurrent calls."""
+    version = int(pytestconfig.getoption("ansys_version"))
+    server_process, port = conftest._launch_mechanical_rpyc_server(rootdir, version, "0.001")
+    client = conftest.connect_rpc_embedded_server(port=port)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(client.run_python_script, [f"{i}+1" for i in range(8)]))
+        assert results == [str(i + 1) for i in range(8)]
+    finally:
+        conftest._stop_python_server(client, server_process)
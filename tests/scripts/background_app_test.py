@@ -22,9 +22,11 @@
 
 """Test cases for background app."""
 
+import asyncio
 import sys
 import time
 
+from ansys.mechanical.core.embedding.async_app import AsyncApp
 from ansys.mechanical.core.embedding.background import BackgroundApp
 
 
@@ -83,6 +85,42 @@ def test_background_app_initialize_stopped(version):
     s = BackgroundApp(version=version)
 
 
+def test_background_app_post_async(version):
+    """Queue work on background app without waiting for it."""
+    s = BackgroundApp(version=version)
+
+    def func():
+        return s.app.DataModel.Project.Name
+
+    def fail():
+        raise ValueError("Failed on the background thread")
+
+    futures = [s.post_async(func) for _ in range(3)]
+    failed = s.post_async(fail)
+    _print_to_stderr(*[future.result(timeout=60) for future in futures], "async")
+    try:
+        failed.result(timeout=60)
+    except ValueError as e:
+        _print_to_stderr(e)
+    s.stop()
+    _print_to_stderr("stopped")
+
+
+def test_async_app(version):
+    """Run work on background app from asyncio."""
+
+    async def main():
+        app = AsyncApp(version=version)
+        names = await asyncio.gather(
+            *[app.run(lambda: app.app.DataModel.Project.Name) for _ in range(3)]
+        )
+        _print_to_stderr(*names, "gathered")
+        _print_to_stderr(await app.execute_script("2 + 3"), "script")
+        app.background_app.stop()
+
+    asyncio.run(main())
+
+
 if __name__ == "__main__":
     version = sys.argv[1]
     test_name = sys.argv[2]
@@ -90,6 +128,8 @@ if __name__ == "__main__":
         "multiple_instances": multiple_instances,
         "test_background_app_use_stopped": test_background_app_use_stopped,
         "test_background_app_initialize_stopped": test_background_app_initialize_stopped,
+        "test_background_app_post_async": test_background_app_post_async,
+        "test_async_app": test_async_app,
     }
     tests[test_name](int(version))
     print("@@success@@")
@@ -29,8 +29,10 @@ from ansys.mechanical.core.embedding.rpc import MechanicalDefaultServer
 if __name__ == "__main__":
     _port = int(sys.argv[1])
     _version = int(sys.argv[2])
+    _coalesce_window = float(sys.argv[3]) if len(sys.argv) > 3 else None
     server = MechanicalDefaultServer(
         port=_port,
         version=_version,
+        coalesce_window=_coalesce_window,
     )
     server.start()
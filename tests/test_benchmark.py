@@ -0,0 +1,101 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test for the round-trip benchmark of Mechanical servers."""
+
+import conftest
+import pytest
+
+from ansys.mechanical.core.benchmark import (
+    RoundTripStats,
+    benchmark_round_trip,
+    measure_round_trip,
+)
+
+
+class ScriptRecorder:
+    """Client that records the scripts it runs."""
+
+    def __init__(self):
+        self.scripts = []
+
+    def run_python_script(self, script):
+        """Record the script and return it."""
+        self.scripts.append(script)
+        return script
+
+
+def test_measure_round_trip_skips_warmup():
+    """Test that the warmup calls are made but not timed."""
+    calls = []
+    stats = measure_round_trip(lambda: calls.append(None), calls=25, warmup=5)
+    assert len(calls) == 30
+    assert len(stats.latencies) == 25
+    assert stats.wall_time >= sum(stats.latencies)
+    assert stats.p50 <= stats.p99 <= max(stats.latencies)
+
+
+def test_round_trip_stats_summary():
+    """Test the percentiles of the summary."""
+    stats = RoundTripStats([i / 1000 for i in range(1, 101)], wall_time=1.0)
+    summary = stats.summary()
+    assert summary["calls"] == 100
+    assert summary["p50_ms"] == pytest.approx(50)
+    assert summary["p99_ms"] == pytest.approx(99)
+    assert summary["max_ms"] == pytest.approx(100)
+    assert summary["calls_per_second"] == pytest.approx(100)
+    assert RoundTripStats().summary()["p99_ms"] == 0.0
+
+
+def test_benchmark_round_trip_runs_script():
+    """Test that each call runs the trivial script on the client."""
+    client = ScriptRecorder()
+    stats = benchmark_round_trip(client, calls=10, warmup=2, script="2")
+    assert client.scripts == ["2"] * 12
+    assert len(stats.latencies) == 10
+
+
+@pytest.mark.remote_session_connect
+def test_benchmark_round_trip_server(mechanical):
+    """Test the round-trip time of trivial calls against a running server."""
+    stats = benchmark_round_trip(mechanical, calls=50, warmup=5)
+    summary = stats.summary()
+    print(f"round trip: p50 {summary['p50_ms']:.2f} ms, p99 {summary['p99_ms']:.2f} ms")
+    assert summary["calls"] == 50
+    assert 0 < stats.p50 <= stats.p99
+
+
+@pytest.mark.embedding_scripts
+def test_benchmark_round_trip_embedded_server(pytestconfig, rootdir):
+    """Test the round-trip time of trivial calls against the embedded RPC server."""
+    pytest.importorskip("rpyc")
+    version = int(pytestconfig.getoption("ansys_version"))
+    server_process, port = conftest._launch_mechanical_rpyc_server(rootdir, version)
+    client = conftest.connect_rpc_embedded_server(port=port)
+    try:
+        stats = benchmark_round_trip(client, calls=200, warmup=20)
+    finally:
+        conftest._stop_python_server(client, server_process)
+    summary = stats.summary()
+    print(f"embedded server: p50 {summary['p50_ms']:.2f} ms, p99 {summary['p99_ms']:.2f} ms")
+    assert summary["calls"] == 200
+    assert 0 < stats.p50 <= stats.p99
@@ -0,0 +1,88 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test for the local download cache."""
+
+import hashlib
+
+from ansys.mechanical.core.cache import DownloadCache
+
+
+def write(path, content):
+    """Write a file and return the SHA-256 checksum of its content."""
+    path.write_bytes(content)
+    return hashlib.sha256(content).hexdigest()
+
+
+def test_fetch_links_cached_file(tmp_path):
+    """Test that a cached file is placed at the target and the lookups are counted."""
+    cache = DownloadCache(tmp_path / "cache")
+    digest = write(tmp_path / "file.rst", b"result")
+    assert not cache.fetch(digest, tmp_path / "copy.rst")
+    assert cache.add(digest, tmp_path / "file.rst")
+    assert cache.fetch(digest, tmp_path / "copy.rst")
+    assert (tmp_path / "copy.rst").read_bytes() == b"result"
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries, stats.size) == (1, 1, 1, 6)
+    assert stats.hit_ratio == 0.5
+    cache.close()
+
+    # The index is kept on disk
+    cache = DownloadCache(tmp_path / "cache")
+    assert cache.stats().hits == 1
+    cache.clear()
+    assert cache.stats().entries == 0
+    assert not cache.fetch(digest, tmp_path / "copy.rst")
+
+
+def test_add_rejects_mismatched_content(tmp_path):
+    """Test that a file whose content does not match the checksum is not cached."""
+    cache = DownloadCache(tmp_path / "cache")
+    write(tmp_path / "file.rst", b"result")
+    assert not cache.add(hashlib.sha256(b"other").hexdigest(), tmp_path / "file.rst")
+    assert cache.stats().entries == 0
+
+
+def test_least_recently_used_files_are_evicted(tmp_path):
+    """Test that the cache stays under its size limit by evicting the oldest files."""
+    cache = DownloadCache(tmp_path / "cache", max_size=25)
+    digests = [write(tmp_path / f"{name}.rst", name.encode() * 10) for name in "abc"]
+    cache.add(digests[0], tmp_path / "a.rst")
+    cache.add(digests[1], tmp_path / "b.rst")
+    assert cache.fetch(digests[0], tmp_path / "a_copy.rst")
+    cache.add(digests[2], tmp_path / "c.rst")
+
+    stats = cache.stats()
+    assert (stats.entries, stats.size, stats.evictions) == (2, 20, 1)
+    assert not cache.fetch(digests[1], tmp_path / "b_copy.rst")
+    assert cache.fetch(digests[0], tmp_path / "a_copy.rst")
+
+
+def test_removed_cache_file_is_a_miss(tmp_path):
+    """Test that an entry whose file was removed outside of the cache is dropped."""
+    cache = DownloadCache(tmp_path / "cache")
+    digest = write(tmp_path / "file.rst", b"result")
+    cache.add(digest, tmp_path / "file.rst")
+    cache._object_path(digest).unlink()
+    assert not cache.fetch(digest, tmp_path / "copy.rst")
+    assert cache.stats().entries == 0
@@ -0,0 +1,108 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test for the shared gRPC channel cache."""
+
+import time
+
+from ansys.mechanical.core.channels import ChannelCache
+
+
+class FakeChannel:
+    """Channel stand-in that records whether it was closed."""
+
+    def __init__(self, index=0):
+        """Initialize the fake channel."""
+        self.index = index
+        self.closed = False
+
+    def close(self):
+        """Close the fake channel."""
+        self.closed = True
+
+
+def test_channel_cache_reuses_channel_for_same_key():
+    """Test that the same key returns the same channel."""
+    cache = ChannelCache(idle_timeout=60)
+    first = cache.acquire(("localhost", 10000), FakeChannel)
+    second = cache.acquire(("localhost", 10000), FakeChannel)
+    assert first is second
+    assert cache.stats() == {"open": 1, "in_use": 1, "idle": 0}
+
+
+def test_channel_cache_separates_keys():
+    """Test that different keys get different channels."""
+    cache = ChannelCache(idle_timeout=60)
+    first = cache.acquire(("localhost", 10000), FakeChannel)
+    second = cache.acquire(("localhost", 10001), FakeChannel)
+    assert first is not second
+    assert len(cache) == 2
+
+
+def test_channel_cache_keeps_channel_until_last_release():
+    """Test that a channel closes only when its last reference is released."""
+    cache = ChannelCache(idle_timeout=0)
+    channel = cache.acquire("key", FakeChannel)
+    cache.acquire("key", FakeChannel)
+    cache.release(channel)
+    assert not channel.closed
+    cache.release(channel)
+    assert channel.closed
+    assert len(cache) == 0
+
+
+def test_channel_cache_closes_idle_channel_after_timeout():
+    """Test that an idle channel is closed by the background thread."""
+    cache = ChannelCache(idle_timeout=0.05)
+    channel = cache.acquire("key", FakeChannel)
+    cache.release(channel)
+    assert cache.stats()["idle"] == 1
+    deadline = time.monotonic() + 5
+    while not channel.closed and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert channel.closed
+
+
+def test_channel_cache_reuses_idle_channel():
+    """Test that an idle channel is picked up by a new session."""
+    cache = ChannelCache(idle_timeout=60)
+    channel = cache.acquire("key", FakeChannel)
+    cache.release(channel)
+    assert cache.acquire("key", FakeChannel) is channel
+    assert not channel.closed
+
+
+def test_channel_cache_spreads_over_subchannels():
+    """Test that sessions are spread over the requested number of channels."""
+    cache = ChannelCache(idle_timeout=60)
+    channels = [cache.acquire("key", FakeChannel, subchannels=2) for _ in range(4)]
+    assert len({id(each) for each in channels}) == 2
+    assert sorted(each.index for each in channels) == [0, 0, 1, 1]
+
+
+def test_channel_cache_close_all():
+    """Test that closing the cache closes every channel."""
+    cache = ChannelCache(idle_timeout=60)
+    channel = cache.acquire("key", FakeChannel)
+    cache.close_all()
+    assert channel.closed
+    assert len(cache) == 0
@@ -0,0 +1,205 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test for the call scheduler of a Mechanical instance."""
+
+import threading
+import time
+
+import pytest
+
+from ansys.mechanical.core.concurrency import CallScheduler
+
+
+def run_in_threads(targets):
+    """Start a thread for each target and wait for all of them."""
+    threads = [threading.Thread(target=target) for target in targets]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+
+def test_scheduler_idle_is_not_busy():
+    """Test that a new scheduler is not busy."""
+    scheduler = CallScheduler()
+    assert not scheduler.busy
+    assert scheduler.in_flight == {"script": 0, "transfer": 0, "control": 0}
+
+
+def test_scheduler_busy_during_script():
+    """Test that the scheduler is busy while a script runs."""
+    scheduler = CallScheduler()
+    with scheduler.script():
+        assert scheduler.busy
+        assert scheduler.in_flight["script"] == 1
+    assert not scheduler.busy
+
+
+def test_scheduler_nested_script_does_not_deadlock():
+    """Test that a nested script on the same thread runs immediately."""
+    scheduler = CallScheduler()
+    with scheduler.script():
+        with scheduler.script():
+            assert scheduler.in_flight["script"] == 1
+    assert not scheduler.busy
+
+
+def test_scheduler_scripts_are_serialized():
+    """Test that only one script runs at a time."""
+    scheduler = CallScheduler()
+    running = []
+    overlap = []
+
+    def target():
+        with scheduler.script():
+            running.append(1)
+            overlap.append(len(running))
+            time.sleep(0.01)
+            running.pop()
+
+    run_in_threads([target] * 5)
+    assert max(overlap) == 1
+
+
+def test_scheduler_scripts_run_by_priority():
+    """Test that queued scripts run by priority, then in submission order."""
+    scheduler = CallScheduler()
+    order = []
+    release = threading.Event()
+
+    def blocker():
+        with scheduler.script():
+            release.wait(timeout=10)
+
+    def queued(name, priority):
+        def target():
+            with scheduler.script(priority=priority):
+                order.append(name)
+
+        return target
+
+    blocking_thread = threading.Thread(target=blocker)
+    blocking_thread.start()
+    while not scheduler.in_flight["script"]:
+        time.sleep(0.001)
+
+    threads = []
+    for name, priority in [("low", 5), ("first", 0), ("second", 0)]:
+        thread = threading.Thread(target=queued(name, priority))
+        thread.start()
+        threads.append(thread)
+        while scheduler.pending_scripts < len(threads):
+            time.sleep(0.001)
+
+    release.set()
+    blocking_thread.join(timeout=10)
+    for thread in threads:
+        thread.join(timeout=10)
+    assert order == ["first", "second", "low"]
+
+
+class InterruptibleCondition(threading.Condition):
+    """Condition whose waits raise ``KeyboardInterrupt`` in the given threads."""
+
+    def __init__(self):
+        super().__init__()
+        self.interrupted = set()
+
+    def wait(self, timeout=None):
+        """Wait, unless the current thread is interrupted."""
+        if threading.get_ident() in self.interrupted:
+            raise KeyboardInterrupt
+        return super().wait(timeout)
+
+
+def test_scheduler_interrupted_waiter_leaves_queue():
+    """Test that a caller interrupted while waiting does not block the next scripts."""
+    scheduler = CallScheduler()
+    scheduler._condition = InterruptibleCondition()
+    started = threading.Event()
+    release = threading.Event()
+
+    def holder():
+        with scheduler.script():
+            started.set()
+            release.wait(timeout=10)
+
+    holder_thread = threading.Thread(target=holder)
+    holder_thread.start()
+    started.wait(timeout=10)
+    scheduler._condition.interrupted.add(threading.get_ident())
+    with pytest.raises(KeyboardInterrupt):
+        with scheduler.script():
+            pass
+    scheduler._condition.interrupted.clear()
+    assert scheduler.pending_scripts == 0
+    release.set()
+    holder_thread.join(timeout=10)
+
+    ran = threading.Event()
+
+    def next_script():
+        with scheduler.script():
+            ran.set()
+
+    run_in_threads([next_script])
+    assert ran.is_set()
+    assert not scheduler.busy
+
+
+def test_scheduler_transfers_are_limited():
+    """Test that concurrent transfers never exceed the limit."""
+    scheduler = CallScheduler(max_concurrent_transfers=2)
+    peak = []
+
+    def target():
+        with scheduler.transfer():
+            peak.append(scheduler.in_flight["transfer"])
+            time.sleep(0.01)
+
+    run_in_threads([target] * 6)
+    assert max(peak) <= 2
+
+
+def test_scheduler_transfer_runs_during_script():
+    """Test that a transfer does not wait for a running script."""
+    scheduler = CallScheduler()
+    started = threading.Event()
+
+    def target():
+        with scheduler.transfer():
+            started.set()
+
+    with scheduler.script():
+        thread = threading.Thread(target=target)
+        thread.start()
+        assert started.wait(timeout=10)
+        thread.join(timeout=10)
+
+
+def test_scheduler_invalid_limits():
+    """Test that invalid limits raise an error."""
+    with pytest.raises(ValueError):
+        CallScheduler(max_concurrent_transfers=0)
+    with pytest.raises(ValueError):
+        CallScheduler(max_pending_scripts=0)
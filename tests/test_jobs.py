@@ -0,0 +1,193 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test for the non-blocking remote jobs."""
+
+from concurrent.futures import CancelledError
+import queue
+import threading
+
+from conftest import FakeResponse
+import grpc
+import pytest
+
+from ansys.mechanical.core.jobs import JobStatus, as_completed
+
+
+class FakeRpcError(grpc.RpcError):
+    """Error raised by a fake call."""
+
+    def __init__(self, code, details=""):
+        self._code = code
+        self._details = details
+
+    def code(self):
+        """Get the status code."""
+        return self._code
+
+    def details(self):
+        """Get the error message."""
+        return self._details
+
+
+class FakeCall:
+    """Streaming call that sends the messages put in its queue."""
+
+    def __init__(self):
+        self.messages = queue.Queue()
+
+    def __iter__(self):
+        """Yield the messages until an error is put in the queue."""
+        while True:
+            message = self.messages.get(timeout=10)
+            if isinstance(message, Exception):
+                raise message
+            yield message
+
+    def cancel(self):
+        """Cancel the call."""
+        self.messages.put(FakeRpcError(grpc.StatusCode.CANCELLED, "Cancelled"))
+
+
+class FakeStub:
+    """Stub that records the requests and returns fake calls."""
+
+    def __init__(self):
+        self.calls = []
+        self.requests = []
+
+    def RunPythonScript(self, request):  # noqa: N802
+        """Start a fake call."""
+        self.requests.append(request)
+        call = FakeCall()
+        self.calls.append(call)
+        return call
+
+
+def wait_for_calls(stub, count):
+    """Wait until the stub has received a number of calls."""
+    for _ in range(1000):
+        if len(stub.calls) >= count:
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("The job did not start.")
+
+
+def test_job_streams_logs_and_result(make_mechanical):
+    """Test that a job collects its log messages and its result."""
+    stub = FakeStub()
+    job = make_mechanical(stub).submit_script("Solve()")
+    wait_for_calls(stub, 1)
+    assert job.status() == JobStatus.RUNNING
+    for message in ["10%", "50%"]:
+        stub.calls[0].messages.put(FakeResponse(log_info=message, script_result=""))
+    stub.calls[0].messages.put(FakeResponse(log_info="__done__", script_result="ok"))
+    assert job.result(timeout=10) == "ok"
+    assert list(job.logs()) == ["10%", "50%"]
+    assert job.status() == JobStatus.DONE
+    assert stub.requests[0].script_code == "Solve()"
+
+
+def test_job_result_timeout(make_mechanical):
+    """Test that waiting for a running job can time out."""
+    stub = FakeStub()
+    job = make_mechanical(stub).submit_script("Solve()")
+    with pytest.raises(TimeoutError):
+        job.result(timeout=0.05)
+    job.cancel()
+
+
+def test_job_failure(make_mechanical):
+    """Test that a server error is raised by the result."""
+    stub = FakeStub()
+    job = make_mechanical(stub).submit_script("fail()")
+    wait_for_calls(stub, 1)
+    stub.calls[0].messages.put(FakeRpcError(grpc.StatusCode.UNKNOWN, "name 'fail' is not defined"))
+    with pytest.raises(grpc.RpcError):
+        job.result(timeout=10)
+    assert job.status() == JobStatus.FAILED
+
+
+def test_job_cancel_running(make_mechanical):
+    """Test that cancelling a running job cancels its call."""
+    stub = FakeStub()
+    job = make_mechanical(stub).submit_script("Solve()")
+    wait_for_calls(stub, 1)
+    assert job.cancel()
+    with pytest.raises(CancelledError):
+        job.result(timeout=10)
+    assert job.status() == JobStatus.CANCELLED
+    assert not job.cancel()
+    wait_for_calls(stub, 2)
+    stub.calls[1].messages.put(FakeResponse(log_info="__done__", script_result="None"))
+    job._thread.join(timeout=10)
+    assert not job._thread.is_alive()
+
+
+def test_job_cancel_keeps_instance_until_server_finishes(make_mechanical):
+    """Test that the next script waits for the server to finish a cancelled script."""
+    stub = FakeStub()
+    mechanical = make_mechanical(stub)
+    first = mechanical.submit_script("Solve()")
+    wait_for_calls(stub, 1)
+    second = mechanical.submit_script("2+3")
+    assert first.cancel()
+    with pytest.raises(CancelledError):
+        first.result(timeout=10)
+    wait_for_calls(stub, 2)
+    assert stub.requests[1].script_code == "None"
+    threading.Event().wait(0.05)
+    assert second.status() == JobStatus.PENDING
+    assert len(stub.calls) == 2
+    stub.calls[1].messages.put(FakeResponse(log_info="__done__", script_result="None"))
+    wait_for_calls(stub, 3)
+    stub.calls[2].messages.put(FakeResponse(log_info="__done__", script_result="5"))
+    assert second.result(timeout=10) == "5"
+
+
+def test_job_cancel_pending(make_mechanical):
+    """Test that a pending job is cancelled without starting."""
+    stub = FakeStub()
+    mechanical = make_mechanical(stub)
+    first = mechanical.submit_script("Solve()")
+    wait_for_calls(stub, 1)
+    second = mechanical.submit_script("Solve()")
+    assert second.status() == JobStatus.PENDING
+    assert second.cancel()
+    assert second.status() == JobStatus.CANCELLED
+    stub.calls[0].messages.put(FakeResponse(log_info="__done__", script_result="first"))
+    assert first.result(timeout=10) == "first"
+    second._thread.join(timeout=10)
+    assert len(stub.calls) == 1
+
+
+def test_as_completed_yields_finished_jobs(make_mechanical):
+    """Test that jobs on several instances are yielded as they finish."""
+    stubs = [FakeStub(), FakeStub()]
+    jobs = [make_mechanical(stub).submit_script("Solve()") for stub in stubs]
+    for stub in stubs:
+        wait_for_calls(stub, 1)
+    stubs[1].calls[0].messages.put(FakeResponse(log_info="__done__", script_result="second"))
+    finished = as_completed(jobs, timeout=10)
+    assert next(finished) is jobs[1]
+    stubs[0].calls[0].messages.put(FakeResponse(log_info="__done__", script_result="first"))
+    assert next(finished) is jobs[0]
@@ -0,0 +1,157 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test for the script journal."""
+
+import errno
+import gzip
+import threading
+import time
+
+import pytest
+
+from ansys.mechanical.core.journal import (
+    JournalEntry,
+    ScriptJournal,
+    format_entry,
+    read_journal,
+)
+import ansys.mechanical.core.mechanical as mechanical_module
+
+
+def test_journal_round_trip(tmp_path):
+    """Test that the entries written to a journal are read back with their timing."""
+    path = tmp_path / "journal.txt"
+    journal = ScriptJournal(path)
+    journal.write("2+3", start=100.0, duration=0.5)
+    journal.write("x = 1\nx\n", start=101.0, duration=0.25)
+    journal.close()
+    assert read_journal(path) == [
+        JournalEntry(1, "2+3", 100.0, 0.5),
+        JournalEntry(2, "x = 1\nx", 101.0, 0.25),
+    ]
+
+
+def test_journal_flush_writes_queued_scripts(tmp_path):
+    """Test that flushing the journal writes the queued scripts."""
+    path = tmp_path / "journal.txt"
+    journal = ScriptJournal(path, flush_interval=60)
+    journal.write("2+3")
+    assert journal.flush(timeout=5)
+    assert "2+3" in path.read_text()
+    journal.close()
+
+
+def test_journal_gzip(tmp_path):
+    """Test that a journal ending with .gz is compressed and can be appended to."""
+    path = tmp_path / "journal.txt.gz"
+    for script in ["first", "second"]:
+        journal = ScriptJournal(path)
+        journal.write(script)
+        journal.close()
+    with gzip.open(path, "rt") as file:
+        assert "first" in file.read()
+    assert [entry.script for entry in read_journal(path)] == ["first", "second"]
+
+
+def test_journal_write_after_close(tmp_path):
+    """Test that a closed journal rejects scripts."""
+    journal = ScriptJournal(tmp_path / "journal.txt")
+    journal.close()
+    with pytest.raises(ValueError):
+        journal.write("2+3")
+
+
+class _FullDisk:
+    """Stream whose writes fail as on a full disk."""
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    def write(self, data):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    def flush(self):
+        self.raw.flush()
+
+    def close(self):
+        pass
+
+
+def test_journal_write_error_raised_once(tmp_path):
+    """Test that an error of the writer thread is raised by the next call, once."""
+    journal = ScriptJournal(tmp_path / "journal.txt", flush_interval=60)
+    journal._stream = _FullDisk(journal._raw)
+    journal.write("2+3")
+    with pytest.raises(OSError) as error:
+        journal.flush(timeout=5)
+    assert error.value.errno == errno.ENOSPC
+    assert journal.flush(timeout=5)
+    with pytest.raises(OSError):
+        # The writer thread may fail before the write returns
+        journal.write("x = 1")
+        journal.close()
+    journal.close()
+
+
+def test_read_journal_without_headers(tmp_path):
+    """Test that a journal without headers is read as a single entry."""
+    path = tmp_path / "journal.txt"
+    path.write_text("a = 1\nb = 2\n")
+    assert read_journal(path) == [JournalEntry(0, "a = 1\nb = 2")]
+
+
+def test_format_entry_header_is_comment():
+    """Test that each entry starts with a comment line."""
+    text = format_entry(JournalEntry(3, "2+3", 1.5, 0.1))
+    assert text == '# pymechanical: {"seq": 3, "start": 1.5, "duration": 0.1}\n2+3\n'
+
+
+def test_concurrent_scripts_share_one_journal(make_mechanical, tmp_path, monkeypatch):
+    """Test that scripts logged from several threads create a single journal."""
+    created = []
+
+    class SlowJournal(ScriptJournal):
+        def __init__(self, *args, **kwargs):
+            # Widen the window in which another thread could create a second journal
+            time.sleep(0.05)
+            super().__init__(*args, **kwargs)
+            created.append(self)
+
+    monkeypatch.setattr(mechanical_module, "ScriptJournal", SlowJournal)
+    path = tmp_path / "journal.txt"
+    mechanical = make_mechanical(None)
+    mechanical._disable_logging = False
+    mechanical._log_file_mechanical = str(path)
+    threads = [
+        threading.Thread(target=mechanical._log_mechanical_script, args=(f"x = {index}",))
+        for index in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    mechanical._journal.close()
+    assert len(created) == 1
+    assert sorted(entry.script for entry in read_journal(path)) == [
+        f"x = {index}" for index in range(8)
+    ]
@@ -22,11 +22,16 @@
 
 """Testing of log module."""
 
+import gc
+import json
 import logging as deflogging  # Default logging
+import logging.handlers
 from pathlib import Path
 import re
+import time
+import weakref
 
-from conftest import HAS_GRPC
+from conftest import HAS_GRPC, FakeResponse, LocalStub
 import pytest
 
 from ansys.mechanical.core import (
@@ -433,3 +438,255 @@ def test_lowercases():
 
         for each_logger in LOG._instances.values():
             each_logger.setLevel(each_loglevel.lower())
+
+
+def test_server_log_buffer_hands_messages_to_handler():
+    """Test that a background thread hands the buffered messages to the handler."""
+    emitted = []
+    buffer = logging.ServerLogBuffer(lambda level, message: emitted.append((level, message)))
+    for index in range(5):
+        buffer.put("INFO", f"message {index}")
+    assert buffer.flush(timeout=5)
+    assert emitted == [("INFO", f"message {index}") for index in range(5)]
+    assert buffer.recent(2) == ["message 3", "message 4"]
+    buffer.close()
+
+
+def test_server_log_buffer_drops_oldest_on_overflow():
+    """Test that the oldest pending messages are dropped when the handler falls behind."""
+    emitted = []
+    buffer = logging.ServerLogBuffer(lambda level, message: emitted.append(message), capacity=3)
+    with buffer._condition:
+        # The handler thread cannot drain while the condition is held
+        for index in range(5):
+            buffer.put("INFO", str(index))
+    buffer.flush(timeout=5)
+    assert buffer.stats["overflow"] == 2
+    assert emitted == ["2", "3", "4"]
+    buffer.close()
+
+
+def test_server_log_buffer_sampling():
+    """Test that a sample rate keeps a fraction of the messages of a level."""
+    emitted = []
+    buffer = logging.ServerLogBuffer(
+        lambda level, message: emitted.append(level), sample_rates={"DEBUG": 0.25}
+    )
+    for _ in range(8):
+        buffer.put("DEBUG", "detail")
+        buffer.put("ERROR", "failure")
+    buffer.flush(timeout=5)
+    assert emitted.count("DEBUG") == 2
+    assert emitted.count("ERROR") == 8
+    assert buffer.stats["sampled"] == 6
+    assert len(buffer.recent()) == 16
+    buffer.close()
+
+
+def test_server_log_buffer_rate_limit():
+    """Test that a rate limit caps the burst of messages of a level."""
+    emitted = []
+    buffer = logging.ServerLogBuffer(
+        lambda level, message: emitted.append(message), rate_limits={"INFO": 3}
+    )
+    with buffer._condition:
+        for index in range(10):
+            buffer.put("INFO", str(index))
+    buffer.flush(timeout=5)
+    assert emitted == ["0", "1", "2"]
+    assert buffer.stats["rate_limited"] == 7
+    buffer.close()
+
+
+def test_server_log_buffer_invalid_sample_rate():
+    """Test that a sample rate must be a fraction."""
+    buffer = logging.ServerLogBuffer(print)
+    with pytest.raises(ValueError):
+        buffer.set_sample_rate("DEBUG", 2)
+
+
+class _Receiver:
+    """Object whose method handles the messages of a server log buffer."""
+
+    def __init__(self):
+        self.messages = []
+
+    def receive(self, level, message):
+        self.messages.append(message)
+
+
+def test_server_log_buffer_weak_method():
+    """Test that a buffer does not keep the object of a weak method alive."""
+    receiver = _Receiver()
+    buffer = logging.ServerLogBuffer(weakref.WeakMethod(receiver.receive))
+    buffer.put("INFO", "kept")
+    assert buffer.flush(timeout=5)
+    assert receiver.messages == ["kept"]
+    reference = weakref.ref(receiver)
+    gc.disable()
+    try:
+        del receiver
+        assert reference() is None
+    finally:
+        gc.enable()
+    buffer.put("INFO", "dropped")
+    assert buffer.flush(timeout=5)
+    buffer.close()
+
+
+def test_client_collected_without_cyclic_gc(make_mechanical):
+    """Test that the server log buffer does not make a reference cycle with its client."""
+    reference = weakref.ref(make_mechanical(LocalStub()))
+    gc.disable()
+    try:
+        assert reference() is None
+    finally:
+        gc.enable()
+
+
+class _LoggingStub(LocalStub):
+    """Stub that streams log messages before the result of a script."""
+
+    def RunPythonScript(self, request, **options):  # noqa: N802
+        for index in range(3):
+            yield FakeResponse(log_info=f"step {index}")
+        yield from super().RunPythonScript(request, **options)
+
+
+def test_run_python_script_flushes_server_logs(make_mechanical):
+    """Test that the log messages of a script are handled before its result is returned."""
+    handled = []
+
+    def slow_emit(level, message):
+        time.sleep(0.05)
+        handled.append(message)
+
+    mechanical = make_mechanical(_LoggingStub())
+    mechanical._server_logs = logging.ServerLogBuffer(slow_emit)
+    assert mechanical.run_python_script("2+3", enable_logging=True, log_level="INFO") == "5"
+    assert handled == ["step 0", "step 1", "step 2"]
+    mechanical._server_logs.close()
+
+
+@pytest.fixture
+def async_log_file(tmp_path):
+    """Add a file handler to the global logger and remove it at the end of the test."""
+    handlers = list(LOG.logger.handlers)
+    level = LOG.logger.level
+    file_handler = LOG.file_handler
+    file_path = tmp_path / "async.log"
+    LOG.log_to_file(str(file_path), level="DEBUG")
+    LOG.logger.setLevel("DEBUG")
+    yield file_path
+    LOG.disable_async()
+    LOG.file_handler.close()
+    LOG.logger.handlers = handlers
+    LOG.logger.setLevel(level)
+    LOG.file_handler = file_handler
+
+
+def test_async_logging_routes_records_through_queue(async_log_file):
+    """Test that the records are written by the listener thread after a flush."""
+    LOG.enable_async(batch_size=1000, flush_interval=60)
+    handlers = LOG.logger.handlers
+    assert len(handlers) == 1
+    assert isinstance(handlers[0], deflogging.handlers.QueueHandler)
+    LOG.info("queued message")
+    LOG.disable_async()
+    assert "queued message" in async_log_file.read_text()
+    assert LOG.file_handler in LOG.logger.handlers
+
+
+def test_async_logging_flushes_steady_trickle(async_log_file):
+    """Test that a partial batch is written within the flush interval while records keep coming."""
+    LOG.enable_async(batch_size=1000, flush_interval=0.2)
+    start = time.monotonic()
+    LOG.info("trickle 0")
+    index = 1
+    # Records arrive more often than the flush interval, so the queue is never idle
+    while "trickle 0" not in async_log_file.read_text() and time.monotonic() - start < 3:
+        time.sleep(0.02)
+        LOG.info("trickle %d", index)
+        index += 1
+    elapsed = time.monotonic() - start
+    LOG.disable_async()
+    assert "trickle 0" in async_log_file.read_text()
+    assert elapsed < 1
+
+
+def test_async_logging_twice_raises(async_log_file):
+    """Test that the asynchronous mode cannot be enabled twice."""
+    LOG.enable_async()
+    with pytest.raises(RuntimeError):
+        LOG.enable_async()
+
+
+def test_async_logging_json_format(async_log_file):
+    """Test that the JSON format writes one object per record with the instance fields."""
+    formatter = LOG.file_handler.formatter
+    LOG.enable_async(json_format=True)
+    LOG.warning("json message")
+    LOG.disable_async()
+    lines = [line for line in async_log_file.read_text().splitlines() if line.startswith("{")]
+    record = json.loads(lines[-1])
+    assert record["message"] == "json message"
+    assert record["level"] == "WARNING"
+    assert {"instance_name", "port", "call_id"} <= set(record)
+    assert LOG.file_handler.formatter is formatter
+
+
+def test_log_to_file_rotation(tmp_path):
+    """Test that a maximum size rotates the log file."""
+    logger = deflogging.getLogger("pymechanical_rotation_test")
+    logger.setLevel(deflogging.DEBUG)
+    logging.addfile_handler(logger, str(tmp_path / "rotate.log"), max_bytes=200, backup_count=2)
+    for index in range(50):
+        logger.info("rotated message %d", index, extra={"instance_name": "test"})
+    logger.file_handler.close()
+    logger.removeHandler(logger.file_handler)
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "rotate.log",
+        "rotate.log.1",
+        "rotate.log.2",
+    ]
+
+
+class _Instance:
+    """Minimal object that an instance logger can refer to."""
+
+    def __init__(self, name):
+        """Initialize the instance."""
+        self.name = name
+
+
+def test_instance_logger_unique_names():
+    """Test that instance loggers with the same name get a counter suffix."""
+    instances = [_Instance("registry_test") for _ in range(3)]
+    names = [LOG.add_instance_logger("registry_test", each).logger.name for each in instances]
+    assert names == ["registry_test", "registry_test_1", "registry_test_2"]
+    for name in names:
+        LOG.remove_instance_logger(name)
+
+
+def test_instance_logger_removed_on_garbage_collection():
+    """Test that the logger of an instance is removed when the instance is collected."""
+    count = LOG.instance_count
+    instance = _Instance("collected_test")
+    LOG.add_instance_logger("collected_test", instance)
+    assert LOG.instance_count == count + 1
+    del instance
+    gc.collect()
+    assert LOG.instance_count == count
+    assert "collected_test" not in deflogging.root.manager.loggerDict
+
+
+def test_remove_instance_logger_closes_own_handlers(tmp_path):
+    """Test that removing a logger closes its file but not the shared global handlers."""
+    instance = _Instance("closed_test")
+    instance_logger = LOG.add_instance_logger("closed_test", instance)
+    instance_logger.log_to_file(str(tmp_path / "instance.log"))
+    file_handler = instance_logger.file_handler
+    LOG.remove_instance_logger("closed_test")
+    assert file_handler.stream is None
+    assert not instance_logger.logger.handlers
+    assert LOG.std_out_handler.stream is not None
@@ -0,0 +1,131 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test for the client metrics."""
+
+import pytest
+
+from ansys.mechanical.core.metrics import (
+    ClientMetrics,
+    Histogram,
+    PoolMetrics,
+    merge_operations,
+)
+
+
+class FakeInstance:
+    """Instance that only exposes client metrics."""
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+
+
+def test_histogram_quantiles():
+    """Test the quantile estimates of a histogram."""
+    histogram = Histogram(buckets=(0.1, 1.0, 10.0))
+    for value in [0.05] * 90 + [0.5] * 9 + [5.0]:
+        histogram.observe(value)
+    assert histogram.count == 100
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.99) == 1.0
+    assert histogram.quantile(1.0) == 5.0
+
+
+def test_histogram_merge_rejects_different_buckets():
+    """Test that histograms with different buckets cannot be merged."""
+    with pytest.raises(ValueError):
+        Histogram(buckets=(1.0,)).merge(Histogram(buckets=(2.0,)))
+
+
+def test_client_metrics_track_records_transfer():
+    """Test that a tracked call records its bytes and chunks."""
+    metrics = ClientMetrics()
+    with metrics.track("upload") as record:
+        record.bytes_sent = 2048
+        record.chunks_sent = 2
+    stats = metrics.as_dict()["upload"]
+    assert stats["calls"] == 1
+    assert stats["errors"] == 0
+    assert stats["bytes_sent"] == 2048
+    assert stats["chunks_sent"] == 2
+    assert stats["latency"]["count"] == 1
+
+
+def test_client_metrics_track_counts_errors():
+    """Test that a failing call is counted as an error and re-raised."""
+    metrics = ClientMetrics()
+    with pytest.raises(RuntimeError):
+        with metrics.track("run_python_script"):
+            raise RuntimeError("failed")
+    assert metrics.as_dict()["run_python_script"]["errors"] == 1
+
+
+def test_client_metrics_reset():
+    """Test that resetting the metrics clears all operations."""
+    metrics = ClientMetrics()
+    with metrics.track("list_files"):
+        pass
+    metrics.reset()
+    assert metrics.as_dict() == {}
+
+
+def test_client_metrics_to_prometheus_labels():
+    """Test that the Prometheus export carries the labels of the client."""
+    metrics = ClientMetrics(labels={"instance": "a"})
+    with metrics.track("download"):
+        pass
+    text = metrics.to_prometheus()
+    assert "# TYPE pymechanical_client_call_duration_seconds histogram" in text
+    assert 'pymechanical_client_calls_total{instance="a",operation="download"} 1' in text
+
+
+def test_merge_operations_sums_clients():
+    """Test that the operations of several clients are summed."""
+    first, second = ClientMetrics(), ClientMetrics()
+    for metrics in (first, second):
+        with metrics.track("upload") as record:
+            record.bytes_sent = 10
+    merged = merge_operations(first.operations(), second.operations())
+    assert merged["upload"].calls == 2
+    assert merged["upload"].bytes_sent == 20
+
+
+def test_pool_metrics_rollup():
+    """Test that the pool metrics roll up queue waits, jobs, and instances."""
+    clients = [ClientMetrics(), ClientMetrics()]
+    for metrics in clients:
+        with metrics.track("run_python_script"):
+            pass
+    pool_metrics = PoolMetrics(lambda: [(i, FakeInstance(m)) for i, m in enumerate(clients)])
+    pool_metrics.record_wait(0.2)
+    with pool_metrics.track_job(0):
+        pass
+
+    rollup = pool_metrics.as_dict()
+    assert rollup["queue_wait"]["count"] == 1
+    assert rollup["jobs"] == {"0": 1}
+    assert 0.0 <= rollup["utilization"]["0"] <= 1.0
+    assert set(rollup["instances"]) == {"0", "1"}
+    assert rollup["totals"]["run_python_script"]["calls"] == 2
+    text = pool_metrics.to_prometheus()
+    assert 'pymechanical_pool_jobs_total{index="0"} 1' in text
+    assert 'pymechanical_pool_calls_total{index="1",operation="run_python_script"} 1' in text
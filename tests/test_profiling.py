@@ -0,0 +1,110 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test for the profiling of remote scripts."""
+
+import json
+import sys
+
+from ansys.mechanical.core.profiling import (
+    ProfileResult,
+    StatementTiming,
+    _split_statements,
+    build_profile_script,
+    fetch_profile_script,
+    parse_profile,
+)
+
+
+def run_as_server(script, namespace):
+    """Run a script like the server does and return its last value as a string."""
+    *body, last = script.rstrip().splitlines()
+    exec("\n".join(body), namespace)
+    if last.startswith("_pymechanical_result ="):
+        return ""
+    return str(eval(last, namespace))
+
+
+def profile_locally(script, key="test"):
+    """Profile a script in this process and fetch its profile."""
+    namespace = {}
+    result = run_as_server(build_profile_script(script, key), namespace)
+    payload = run_as_server(fetch_profile_script(key), {"sys": sys})
+    return parse_profile(result, script, payload)
+
+
+def test_split_statements_last_expression():
+    """Test that the last expression of a script is evaluated."""
+    chunks = _split_statements("a = 1; b = 2\n(a +\n b)")
+    assert chunks == [[1, "exec", "a = 1"], [1, "exec", "b = 2"], [2, "eval", "(a +\n b)"]]
+
+
+def test_split_statements_keeps_decorators():
+    """Test that a decorated function keeps its decorators."""
+    chunks = _split_statements("@staticmethod\ndef f():\n    pass\n")
+    assert chunks == [[1, "exec", "@staticmethod\ndef f():\n    pass"]]
+
+
+def test_split_statements_unparsable_script():
+    """Test that an IronPython 2.7 script runs as a single statement."""
+    assert _split_statements("print 'x'") == [[1, "exec", "print 'x'"]]
+
+
+def test_profile_script_returns_result():
+    """Test that the wrapped script returns the value of the last expression."""
+    profile = profile_locally("""
+        import math
+        values = [math.factorial(200) for _ in range(50)]
+        len(values)
+        """)
+    assert profile.result == "50"
+    assert profile.profiler == "cProfile"
+    assert [entry.line for entry in profile.statements] == [2, 3, 4]
+    assert any(entry.function.endswith("factorial>") for entry in profile.functions)
+    assert not any(entry.function.endswith("exec>") for entry in profile.functions)
+
+
+def test_profile_script_statement_has_empty_result():
+    """Test that a script ending with an assignment returns an empty string."""
+    assert profile_locally("value = 2 + 3").result == ""
+
+
+def test_profile_fetch_forgets_profile():
+    """Test that a profile can only be fetched once."""
+    profile_locally("2 + 3", key="once")
+    assert run_as_server(fetch_profile_script("once"), {"sys": sys}) == "null"
+
+
+def test_profile_result_table_without_functions():
+    """Test that the statements are ranked when no function is profiled."""
+    profile = ProfileResult(
+        result="",
+        total_time=3.0,
+        statements=[StatementTiming(1, "Model.Solve()", 2.5), StatementTiming(2, "x = 1", 0.5)],
+    )
+    assert profile.top(1)[0].source == "Model.Solve()"
+    assert "Model.Solve()" in profile.table().splitlines()[2]
+
+
+def test_parse_profile_missing_payload():
+    """Test that a missing profile keeps the result."""
+    assert parse_profile("5", "2+3", json.dumps(None)) == ProfileResult("5")
@@ -0,0 +1,110 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test for the progress reporting of file transfers."""
+
+import pytest
+
+from ansys.mechanical.core.progress import (
+    TqdmProgress,
+    TransferMonitor,
+    TransferProgress,
+    as_monitor,
+    start_transfer,
+)
+
+
+def test_callback_is_throttled():
+    """Test that the callback is called at start, at most once per interval, and at the end."""
+    reports = []
+    monitor = TransferMonitor(reports.append, min_interval=3600)
+    with monitor.start("file.rst", total=100, direction="upload") as transfer:
+        for _ in range(10):
+            transfer.update(10)
+    assert [report.bytes_done for report in reports] == [0, 100]
+    assert reports[-1].finished
+    assert reports[-1].direction == "upload"
+    assert reports[-1].fraction == 1.0
+    assert monitor.bytes_transferred == 100
+    assert monitor.transfers_completed == 1
+
+    reports.clear()
+    monitor.min_interval = 0
+    with monitor.start("file.rst", total=100) as transfer:
+        transfer.update(50)
+    assert [report.bytes_done for report in reports] == [0, 50, 50]
+
+
+def test_aggregate_of_concurrent_transfers():
+    """Test that a parent monitor sums the running transfers of its children."""
+    pool = TransferMonitor()
+    first = TransferMonitor(parent=pool).start("a.rst", total=100)
+    second = TransferMonitor(parent=pool).start("b.rst", total=300)
+    first.update(50)
+    second.update(100)
+    progress = pool.aggregate()
+    assert progress.bytes_done == 150
+    assert progress.total == 400
+    assert progress.rate > 0
+    assert progress.eta > 0
+    assert not progress.finished
+    assert sorted(active.name for active in pool.active()) == ["a.rst", "b.rst"]
+
+    first.finish()
+    first.finish()
+    assert pool.transfers_completed == 1
+    assert pool.aggregate().bytes_done == 100
+    pool.start("c.rst").update(1)
+    assert pool.aggregate().total is None
+
+
+def test_progress_estimates():
+    """Test the fraction and time estimates."""
+    progress = TransferProgress(1, "file.rst", "download", 25, 100, rate=5.0, elapsed=5.0)
+    assert progress.fraction == 0.25
+    assert progress.eta == 15.0
+    unknown = TransferProgress(1, "file.rst", "download", 25, None, rate=0.0, elapsed=0.0)
+    assert unknown.fraction is None
+    assert unknown.eta is None
+
+
+def test_as_monitor():
+    """Test that callables are wrapped in a monitor and other values are rejected."""
+    assert as_monitor(None) is None
+    monitor = TransferMonitor()
+    assert as_monitor(monitor) is monitor
+    assert as_monitor(print).callback is print
+    with pytest.raises(TypeError):
+        as_monitor(42)
+    assert start_transfer(None, "file.rst", 10, "upload") is None
+
+
+def test_tqdm_progress(capsys):
+    """Test that a progress bar is shown for each transfer and closed at its end."""
+    callback = TqdmProgress(file=None, disable=False)
+    monitor = TransferMonitor(callback, min_interval=0)
+    with monitor.start("file.rst", total=100) as transfer:
+        transfer.update(40)
+        bar = callback._bars[transfer.transfer_id]
+        assert bar.n == 40
+    assert not callback._bars
+    assert "Downloading file.rst" in capsys.readouterr().err
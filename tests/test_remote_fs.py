@@ -0,0 +1,123 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test for the remote file system."""
+
+import os
+
+import pytest
+
+
+@pytest.fixture
+def mechanical(tmp_path, local_mechanical):
+    """Create a client whose server is the local file system, in a project directory."""
+    (tmp_path / "file.rst").write_bytes(b"x" * 100)
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "deep.rst").write_bytes(b"x" * 50)
+    (tmp_path / "sub" / "notes.txt").write_bytes(b"x" * 10)
+    return local_mechanical
+
+
+def test_stat_and_exists(mechanical, tmp_path):
+    """Test that a relative path is resolved against the project directory."""
+    stat = mechanical.fs.stat("file.rst")
+    assert stat.path == str(tmp_path / "file.rst")
+    assert stat.size == 100
+    assert not stat.is_dir
+    assert mechanical.fs.exists("sub")
+    assert not mechanical.fs.exists("missing.rst")
+    with pytest.raises(FileNotFoundError):
+        mechanical.fs.stat("missing.rst")
+
+
+def test_glob(mechanical, tmp_path):
+    """Test that the patterns are matched on the server, with and without recursion."""
+    assert mechanical.fs.glob("*.rst") == [str(tmp_path / "file.rst")]
+    assert mechanical.fs.glob("**/*.rst", recursive=True) == [
+        str(tmp_path / "file.rst"),
+        str(tmp_path / "sub" / "deep.rst"),
+    ]
+    assert mechanical.fs.glob("*", include_dirs=False) == [str(tmp_path / "file.rst")]
+
+
+def test_mkdir_du_remove(mechanical, tmp_path):
+    """Test that directories are created, measured, and removed."""
+    path = mechanical.fs.mkdir("new/nested")
+    assert path == str(tmp_path / "new" / "nested")
+    with pytest.raises(FileExistsError):
+        mechanical.fs.mkdir("new", exist_ok=False)
+
+    usage = mechanical.fs.du("sub")
+    assert (usage.bytes, usage.files) == (60, 2)
+
+    with pytest.raises(OSError):
+        mechanical.fs.remove("sub")
+    mechanical.fs.remove("sub", recursive=True)
+    assert not (tmp_path / "sub").exists()
+    with pytest.raises(FileNotFoundError):
+        mechanical.fs.remove("sub")
+
+
+def test_remove_locked_file(mechanical, tmp_path, monkeypatch):
+    """Test that a file that cannot be removed gives the error result of the script."""
+
+    def locked(path):
+        raise PermissionError(f"'{path}' is locked")
+
+    monkeypatch.setattr(os, "remove", locked)
+    with pytest.raises(OSError, match="is locked") as error:
+        mechanical.fs.remove("file.rst")
+    # Reported by the client from the script result, not raised inside the script
+    assert error.type is OSError
+    assert (tmp_path / "file.rst").exists()
+
+
+def test_get_files_uses_one_call(mechanical, tmp_path):
+    """Test that resolving the files of a download does not list the project."""
+    assert mechanical._get_files("file.rst") == [str(tmp_path / "file.rst")]
+    assert mechanical._get_files("sub/*") == [
+        str(tmp_path / "sub" / "deep.rst"),
+        str(tmp_path / "sub" / "notes.txt"),
+    ]
+    assert mechanical._stub.script_calls == 2
+    with pytest.raises(ValueError):
+        mechanical._get_files("missing.rst")
+
+
+def test_get_files_matches_subdirectories(mechanical, tmp_path):
+    """Test that a pattern matches the files of subdirectories, as when filtering listed files."""
+    assert mechanical._get_files("*.rst") == [
+        str(tmp_path / "file.rst"),
+        str(tmp_path / "sub" / "deep.rst"),
+    ]
+    notes = str(tmp_path / "sub" / "notes.txt")
+    assert mechanical._get_files("**/*.txt", recursive=True) == [notes]
+    assert mechanical.fs.match(str(tmp_path / "sub" / "*")) == [
+        str(tmp_path / "sub" / "deep.rst"),
+        str(tmp_path / "sub" / "notes.txt"),
+    ]
+
+
+def test_get_files_rejects_directory(mechanical):
+    """Test that a directory cannot be downloaded as a file."""
+    with pytest.raises(ValueError):
+        mechanical._get_files("sub")
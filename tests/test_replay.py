@@ -0,0 +1,154 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test for the journal replay benchmark."""
+
+import math
+import threading
+import time
+
+from click.testing import CliRunner
+import pytest
+
+from ansys.mechanical.core.journal import JournalEntry
+from ansys.mechanical.core.replay import (
+    ReplayRecord,
+    ReplayResult,
+    cli,
+    compare,
+    percentile,
+    ratio,
+    replay,
+)
+
+
+class FakeInstance:
+    """Instance that records the scripts it runs."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.scripts = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def run_python_script(self, script):
+        """Run a script, failing on ``fail``."""
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+            self.scripts.append(script)
+        if script == "fail":
+            raise RuntimeError("failed")
+        return ""
+
+
+def make_result(latencies):
+    """Create a replay result with the given latencies."""
+    records = [ReplayRecord(seq, latency) for seq, latency in enumerate(latencies, 1)]
+    return ReplayResult(records, wall_time=sum(latencies))
+
+
+def test_percentile_nearest_rank():
+    """Test the nearest-rank percentile."""
+    values = [float(value) for value in range(1, 101)]
+    assert percentile(values, 0.5) == 50.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_replay_fast_records_errors():
+    """Test that a replay runs every script and records the failing ones."""
+    instance = FakeInstance()
+    entries = [JournalEntry(1, "2+3"), JournalEntry(2, "fail"), JournalEntry(3, "x = 1")]
+    result = replay(entries, [instance])
+    assert instance.scripts == ["2+3", "fail", "x = 1"]
+    assert [record.seq for record in result.records] == [1, 2, 3]
+    assert "failed" in result.records[1].error
+    assert result.summary()["errors"] == 1
+
+
+def test_replay_parallel_uses_each_instance_once():
+    """Test that parallel scripts never share an instance."""
+    instances = [FakeInstance(delay=0.02), FakeInstance(delay=0.02)]
+    entries = [JournalEntry(seq, "2+3") for seq in range(1, 9)]
+    result = replay(entries, instances, parallel=2)
+    assert len(result.records) == 8
+    assert all(instance.max_active == 1 for instance in instances)
+    assert all(instance.scripts for instance in instances)
+
+
+def test_replay_timed_keeps_original_spacing():
+    """Test that the timed mode waits for the original start times."""
+    entries = [JournalEntry(1, "a", start=100.0), JournalEntry(2, "b", start=100.4)]
+    result = replay(entries, [FakeInstance()], mode="timed", speed=2.0)
+    assert result.wall_time >= 0.2
+
+
+def test_replay_invalid_mode():
+    """Test that an unknown replay mode is rejected."""
+    with pytest.raises(ValueError):
+        replay([], [FakeInstance()], mode="slow")
+
+
+def test_replay_result_save_load(tmp_path):
+    """Test that a saved replay result is loaded back."""
+    result = make_result([0.1, 0.2])
+    path = result.save(tmp_path / "run.json")
+    assert ReplayResult.load(path) == result
+
+
+def test_compare_reports_slowest_scripts():
+    """Test that a comparison reports the ratios and the largest slowdowns."""
+    comparison = compare(make_result([0.1, 0.1, 0.1]), make_result([0.1, 0.3, 0.1]))
+    assert comparison["ratio"]["max"] == pytest.approx(3.0)
+    assert comparison["slowest"][0]["seq"] == 2
+
+
+def test_compare_command_threshold(tmp_path):
+    """Test that the compare command fails on a regression beyond the threshold."""
+    baseline = make_result([0.1] * 10).save(tmp_path / "baseline.json")
+    candidate = make_result([0.2] * 10).save(tmp_path / "candidate.json")
+    runner = CliRunner()
+    passing = runner.invoke(cli, ["compare", str(baseline), str(baseline), "--threshold", "1.1"])
+    assert passing.exit_code == 0
+    failing = runner.invoke(cli, ["compare", str(baseline), str(candidate), "--threshold", "1.1"])
+    assert failing.exit_code == 1
+    assert "p90" in failing.output
+
+
+def test_compare_zero_baseline(tmp_path):
+    """Test that a regression from a zero baseline fails the threshold."""
+    assert ratio(0.0, 0.0) == 1.0
+    assert ratio(0.1, 0.0) == math.inf
+    baseline = make_result([0.0] * 10).save(tmp_path / "baseline.json")
+    candidate = make_result([0.2] * 10).save(tmp_path / "candidate.json")
+    comparison = compare(ReplayResult.load(baseline), ReplayResult.load(candidate))
+    assert comparison["ratio"]["p50"] == math.inf
+    runner = CliRunner()
+    passing = runner.invoke(cli, ["compare", str(baseline), str(baseline), "--threshold", "1.1"])
+    assert passing.exit_code == 0
+    failing = runner.invoke(cli, ["compare", str(baseline), str(candidate), "--threshold", "1.1"])
+    assert failing.exit_code == 1
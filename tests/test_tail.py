@@ -0,0 +1,83 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test for the incremental reading of remote files."""
+
+import threading
+
+import pytest
+
+
+def test_tail_fetches_only_new_bytes(local_mechanical, tmp_path):
+    """Test that each poll returns only the bytes appended since the previous one."""
+    output = tmp_path / "solve.out"
+    output.write_bytes(b"first\n")
+    tail = local_mechanical.tail("solve.out")
+    assert tail.poll() == b"first\n"
+    assert tail.poll() == b""
+    with output.open("ab") as f:
+        f.write(b"second\n")
+    assert tail.poll() == b"second\n"
+    assert tail.offset == 13
+
+    assert local_mechanical.tail("solve.out", offset=-7).poll() == b"second\n"
+
+
+def test_tail_restarts_after_truncation(local_mechanical, tmp_path):
+    """Test that a file that shrank is read again from its start."""
+    output = tmp_path / "solve.out"
+    output.write_bytes(b"a long first run\n")
+    tail = local_mechanical.tail("solve.out")
+    tail.poll()
+    output.write_bytes(b"rerun\n")
+    assert tail.poll() == b"rerun\n"
+
+
+def test_tail_without_follow(local_mechanical, tmp_path):
+    """Test that the iteration stops at the end of the file in chunks of bounded size."""
+    (tmp_path / "solve.out").write_bytes(b"line 1\r\nline 2\nline 3")
+    tail = local_mechanical.tail("solve.out", follow=False, chunk_size=4)
+    assert list(tail.lines()) == ["line 1", "line 2", "line 3"]
+    assert local_mechanical._stub.script_calls == 6
+
+    with pytest.raises(FileNotFoundError):
+        list(local_mechanical.tail("missing.out", follow=False))
+
+
+def test_tail_follow_waits_for_the_file(local_mechanical, tmp_path):
+    """Test that following a missing file waits for it and stops when idle."""
+    tail = local_mechanical.tail("solve.out", poll_interval=0.01, max_poll_interval=0.02)
+    chunks = []
+
+    def write():
+        (tmp_path / "solve.out").write_bytes(b"converged\n")
+
+    writer = threading.Timer(0.05, write)
+    writer.start()
+    for chunk in tail:
+        chunks.append(chunk)
+        tail.stop()
+    writer.join()
+    assert chunks == [b"converged\n"]
+
+    tail = local_mechanical.tail("solve.out", idle_timeout=0.05, poll_interval=0.01)
+    assert list(tail) == [b"converged\n"]
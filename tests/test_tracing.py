@@ -0,0 +1,141 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test for the tracing spans."""
+
+import json
+import threading
+
+import pytest
+
+from ansys.mechanical.core.tracing import (
+    Tracer,
+    add_correlation_preamble,
+    current_correlation_id,
+    current_span,
+)
+
+
+@pytest.fixture
+def tracer():
+    """Tracer that records its spans."""
+    tracer = Tracer()
+    tracer.start_recording()
+    return tracer
+
+
+def test_tracer_disabled_yields_no_span():
+    """Test that a tracer that does not record creates no span."""
+    tracer = Tracer()
+    tracer._otel_tracer = None
+    with tracer.span("work") as span:
+        assert span is None
+    assert tracer.spans() == []
+
+
+def test_tracer_nests_spans(tracer):
+    """Test that a span started inside another one is its child."""
+    with tracer.span("outer") as outer:
+        with tracer.span("inner") as inner:
+            assert current_span() is inner
+            assert current_correlation_id() == inner.span_id
+        assert current_span() is outer
+    assert current_span() is None
+    assert inner.parent_id == outer.span_id
+    assert inner.trace_id == outer.trace_id
+    assert [span.name for span in tracer.spans()] == ["inner", "outer"]
+
+
+def test_tracer_explicit_parent_across_threads(tracer):
+    """Test that a span in another thread can use an explicit parent."""
+    children = []
+
+    with tracer.span("map") as parent:
+
+        def job():
+            with tracer.span("job", parent=parent) as child:
+                children.append(child)
+
+        thread = threading.Thread(target=job)
+        thread.start()
+        thread.join()
+
+    assert children[0].parent_id == parent.span_id
+    assert children[0].trace_id == parent.trace_id
+
+
+def test_tracer_records_error(tracer):
+    """Test that a failing span records the error and re-raises it."""
+    with pytest.raises(ValueError):
+        with tracer.span("work"):
+            raise ValueError("bad input")
+    assert "bad input" in tracer.spans()[0].error
+
+
+def test_tracer_keeps_newest_spans(tracer):
+    """Test that the oldest spans are dropped beyond the maximum."""
+    tracer.max_spans = 2
+    for name in ["first", "second", "third"]:
+        with tracer.span(name):
+            pass
+    assert [span.name for span in tracer.spans()] == ["second", "third"]
+
+
+def test_tracer_export_json(tracer, tmp_path):
+    """Test that the spans are exported in the Chrome trace event format."""
+    with tracer.span("mechanical.upload", file="model.mechdb") as span:
+        pass
+    path = tracer.export_json(tmp_path / "trace.json")
+    events = json.loads(path.read_text())["traceEvents"]
+    complete = [event for event in events if event["ph"] == "X"]
+    assert complete[0]["name"] == "mechanical.upload"
+    assert complete[0]["args"]["span_id"] == span.span_id
+    assert complete[0]["args"]["file"] == "model.mechdb"
+    assert any(event["ph"] == "M" for event in events)
+
+
+def test_add_correlation_preamble_keeps_last_statement():
+    """Test that the preamble is a single line before the script."""
+    script = add_correlation_preamble("2+3", "abc")
+    assert script.splitlines() == ['pymechanical_correlation_id = "abc"', "2+3"]
+
+
+def test_add_correlation_preamble_after_future_imports():
+    """Test that the ``__future__`` imports stay first in a script with a docstring."""
+    original = '"""Script."""\nfrom __future__ import annotations\nx: int = 1\nx'
+    script = add_correlation_preamble(original, "abc")
+    namespace = {}
+    exec(compile(script, "script", "exec"), namespace)
+    assert namespace["pymechanical_correlation_id"] == "abc"
+    assert len(script.splitlines()) == len(original.splitlines())
+
+
+@pytest.mark.parametrize(
+    "original",
+    ["x = 1\nraise ValueError(x)", "# Comment\nx = 1\nraise ValueError(x)", "\nraise ValueError"],
+)
+def test_add_correlation_preamble_keeps_line_numbers(original):
+    """Test that the errors of a traced script are reported on their original line."""
+    script = add_correlation_preamble(original, "abc")
+    with pytest.raises(ValueError) as error:
+        exec(compile(script, "script", "exec"), {})
+    assert error.traceback[-1].lineno + 1 == len(original.splitlines())
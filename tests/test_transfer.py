@@ -0,0 +1,500 @@
+# Copyright (C) 2022 - 2026 Synopsys, Inc. and ANSYS, Inc. All rights reserved.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test for the resumable file transfers."""
+
+import gc
+import hashlib
+import io
+import json
+import os
+import tarfile
+import threading
+import time
+import zlib
+
+from conftest import LocalStub, run_script_locally
+import grpc
+import pytest
+
+from ansys.mechanical.core import transfer
+from ansys.mechanical.core.cache import DownloadCache
+from ansys.mechanical.core.mechanical import Mechanical
+from ansys.mechanical.core.metrics import ClientMetrics
+from ansys.mechanical.core.progress import TransferMonitor
+from ansys.mechanical.core.transfer import (
+    CONTENT_STORE_NAME,
+    PART_SUFFIX,
+    ReadAhead,
+    StreamCall,
+    compute_delta,
+    copy_tail_script,
+    dedupe_lookup_script,
+    dedupe_store_script,
+    extract_archive,
+    file_info_script,
+    local_sha256,
+    should_compress,
+)
+
+
+@pytest.fixture
+def data(tmp_path):
+    """Create a source file with known content."""
+    path = tmp_path / "server" / "result.rst"
+    path.parent.mkdir()
+    path.write_bytes(bytes(range(256)) * 40)
+    return path
+
+
+def test_file_info_script(data):
+    """Test that the file information script reports the size and the checksum."""
+    info = json.loads(run_script_locally(file_info_script(str(data), checksum=True)))
+    assert info == {"exists": True, "size": 10240, "sha256": local_sha256(data)}
+    missing = json.loads(run_script_locally(file_info_script([str(data.parent), "missing.rst"])))
+    assert missing["exists"] is False
+
+
+def test_copy_tail_script(data, tmp_path):
+    """Test that the tail script copies the bytes after the offset."""
+    target = tmp_path / "tail"
+    info = json.loads(run_script_locally(copy_tail_script(str(data), str(target), 10000)))
+    assert info["size"] == 240
+    assert target.read_bytes() == data.read_bytes()[10000:]
+
+
+def test_download_resumes_from_partial_file(make_mechanical, data, tmp_path):
+    """Test that a resumed download only requests the missing bytes."""
+    out_file = tmp_path / "result.rst"
+    mechanical = make_mechanical(LocalStub(fail_after=4096))
+    with pytest.raises(ConnectionError):
+        mechanical._download(str(data), str(out_file), chunk_size=1024, progress_bar=False)
+    part = tmp_path / ("result.rst" + PART_SUFFIX)
+    assert part.stat().st_size == 4096
+    assert not out_file.exists()
+
+    stub = LocalStub()
+    mechanical = make_mechanical(stub)
+    mechanical._download(str(data), str(out_file), chunk_size=1024, resume=True)
+    assert stub.downloaded == 10240 - 4096
+    assert out_file.read_bytes() == data.read_bytes()
+    assert not part.exists()
+    assert not (data.parent / "result.rst.pymechanical_segment").exists()
+
+
+def test_download_checksum_mismatch(make_mechanical, data, tmp_path):
+    """Test that a partial file with other content fails the checksum and is removed."""
+    out_file = tmp_path / "result.rst"
+    part = tmp_path / ("result.rst" + PART_SUFFIX)
+    part.write_bytes(b"\0" * 100)
+    mechanical = make_mechanical(LocalStub())
+    with pytest.raises(OSError, match="checksum"):
+        mechanical._download(str(data), str(out_file), chunk_size=1024, resume=True)
+    assert not part.exists()
+
+
+def test_upload_resumes_from_remote_part(make_mechanical, data, tmp_path):
+    """Test that a resumed upload only sends the pieces missing on the server."""
+    destination = tmp_path / "project"
+    destination.mkdir()
+    mechanical = make_mechanical(LocalStub(fail_after=4096))
+    with pytest.raises(ConnectionError):
+        mechanical.upload(
+            data,
+            str(destination),
+            chunk_size=1024,
+            progress_bar=False,
+            resume=True,
+            segment_size=2048,
+        )
+    assert (destination / ("result.rst" + PART_SUFFIX)).stat().st_size == 4096
+
+    stub = LocalStub()
+    mechanical = make_mechanical(stub)
+    mechanical.upload(
+        data, str(destination), chunk_size=1024, progress_bar=False, resume=True, segment_size=2048
+    )
+    assert stub.uploaded == 10240 - 4096
+    assert (destination / "result.rst").read_bytes() == data.read_bytes()
+    assert sorted(path.name for path in destination.iterdir()) == ["result.rst"]
+
+
+def test_should_compress():
+    """Test that the automatic policy skips small and already compressed files."""
+    assert should_compress("file.rst", 1024 * 1024)
+    assert not should_compress("file.rst", 1024)
+    assert not should_compress("archive.ZIP", 1024 * 1024)
+
+
+def test_gzip_upload(make_mechanical, data, tmp_path):
+    """Test that a gzip upload is decompressed on the server and reports its ratio."""
+    destination = tmp_path / "project"
+    destination.mkdir()
+    mechanical = make_mechanical(LocalStub())
+    mechanical._metrics = ClientMetrics()
+    mechanical.upload(data, str(destination), progress_bar=False, compression="gzip")
+    assert sorted(path.name for path in destination.iterdir()) == ["result.rst"]
+    assert (destination / "result.rst").read_bytes() == data.read_bytes()
+    stats = mechanical._metrics.as_dict()["upload"]
+    assert stats["bytes_uncompressed"] == 10240
+    assert stats["bytes_sent"] < 1024
+    assert stats["compression_ratio"] > 10
+
+
+def test_gzip_download(make_mechanical, data, tmp_path):
+    """Test that a download compressed on the server is decompressed locally."""
+    out_file = tmp_path / "result.rst"
+    stub = LocalStub()
+    mechanical = make_mechanical(stub)
+    mechanical.compression = "gzip"
+    mechanical._download(str(data), str(out_file), chunk_size=1024)
+    assert out_file.read_bytes() == data.read_bytes()
+    assert stub.downloaded < 1024
+    assert sorted(path.name for path in data.parent.iterdir()) == ["result.rst"]
+
+
+def test_auto_compression_skips_small_download(make_mechanical, data, tmp_path):
+    """Test that the automatic policy downloads a small file as it is."""
+    out_file = tmp_path / "result.rst"
+    stub = LocalStub()
+    mechanical = make_mechanical(stub)
+    mechanical._download(str(data), str(out_file), compression="auto")
+    assert out_file.read_bytes() == data.read_bytes()
+    assert stub.downloaded == 10240
+
+
+def test_grpc_compression_of_calls(make_mechanical, data, tmp_path):
+    """Test that the gRPC setting compresses the scripts and the uploads."""
+    stub = LocalStub()
+    mechanical = make_mechanical(stub)
+    mechanical.compression = "grpc"
+    mechanical.upload(data, str(tmp_path), progress_bar=False)
+    mechanical.run_python_script("1 + 1")
+    assert stub.options == [{"compression": grpc.Compression.Gzip}] * 2
+
+
+def test_invalid_compression(make_mechanical):
+    """Test that an unknown compression setting is rejected."""
+    mechanical = make_mechanical(LocalStub())
+    with pytest.raises(ValueError):
+        mechanical.compression = "zstd"
+
+
+@pytest.fixture
+def content_store(tmp_path, monkeypatch):
+    """Content store of the local server, in the temporary directory of the test."""
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
+    return tmp_path / "cache" / CONTENT_STORE_NAME
+
+
+def test_dedupe_upload(make_mechanical, data, tmp_path, content_store):
+    """Test that a repeated upload is copied from the content store in one script."""
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+
+    stub = LocalStub()
+    mechanical = make_mechanical(stub)
+    mechanical.upload(data, str(first), progress_bar=False, dedupe=True)
+    assert stub.uploaded == 10240
+    assert (content_store / local_sha256(data)).is_file()
+
+    stub = LocalStub()
+    mechanical = make_mechanical(stub)
+    mechanical.upload(data, str(second), progress_bar=False, dedupe=True)
+    assert stub.uploaded == 0
+    assert len(stub.options) == 1
+    assert (second / "result.rst").read_bytes() == data.read_bytes()
+
+
+def test_dedupe_lookup_verifies_checksum(data, tmp_path, content_store):
+    """Test that a store entry changed in place is removed instead of used."""
+    digest = local_sha256(data)
+    run_script_locally(dedupe_store_script(str(data), digest))
+    entry = content_store / digest
+    entry.write_bytes(b"x" * data.stat().st_size)
+    target = tmp_path / "copy.rst"
+    result = json.loads(run_script_locally(dedupe_lookup_script(digest, 10240, str(target))))
+    assert result == {"found": False}
+    assert not entry.exists()
+    assert not target.exists()
+
+
+def test_dedupe_store_is_bounded(tmp_path, content_store):
+    """Test that the least recently used entries are removed beyond the size limit."""
+    digests = []
+    for index in range(3):
+        source = tmp_path / f"source{index}.bin"
+        source.write_bytes(bytes([index]) * 1000)
+        digests.append(local_sha256(source))
+        run_script_locally(dedupe_store_script(str(source), digests[-1], max_size=2500))
+        entry = content_store / digests[-1]
+        os.utime(entry, (index, index))
+    target = tmp_path / "copy.bin"
+    run_script_locally(dedupe_lookup_script(digests[1], 1000, str(target)))
+    source = tmp_path / "source3.bin"
+    source.write_bytes(b"3" * 1000)
+    run_script_locally(dedupe_store_script(str(source), local_sha256(source), max_size=2500))
+    assert sorted(path.name for path in content_store.iterdir()) == sorted(
+        [digests[1], local_sha256(source)]
+    )
+    assert target.samefile(content_store / digests[1])
+
+
+def test_compute_delta_finds_shifted_blocks(tmp_path):
+    """Test that the delta finds the server blocks after an insertion and a change."""
+    old = bytes(range(256)) * 64
+    new = b"inserted" + old[:5000] + b"changed" + old[5007:]
+    local = tmp_path / "local.bin"
+    local.write_bytes(new)
+    block_size = 512
+    blocks = [
+        [zlib.adler32(block), hashlib.sha256(block).hexdigest(), len(block)]
+        for block in (old[start : start + block_size] for start in range(0, len(old), block_size))
+    ]
+    literal = io.BytesIO()
+    ops = compute_delta(local, blocks, block_size, literal)
+    rebuilt = b"".join(
+        (old if kind == "c" else literal.getvalue())[offset : offset + length]
+        for kind, offset, length in ops
+    )
+    assert rebuilt == new
+    assert len(literal.getvalue()) <= len(b"inserted") + block_size
+
+
+def test_compute_delta_stops_at_max_literal(tmp_path, monkeypatch):
+    """Test that the byte-by-byte search stops once too many bytes are not found."""
+    old = bytes(range(256)) * 64
+    local = tmp_path / "local.bin"
+    local.write_bytes(bytes(reversed(old)))
+    block_size = 512
+    blocks = [
+        [zlib.adler32(block), hashlib.sha256(block).hexdigest(), len(block)]
+        for block in (old[start : start + block_size] for start in range(0, len(old), block_size))
+    ]
+    rolls = []
+    roll = transfer._roll
+    monkeypatch.setattr(transfer, "_roll", lambda *args: rolls.append(1) or roll(*args))
+    assert compute_delta(local, blocks, block_size, io.BytesIO(), max_literal=1024) is None
+    assert len(rolls) <= 1024 + block_size
+
+
+def test_delta_upload_sends_mostly_changed_file(make_mechanical, data, tmp_path):
+    """Test that a delta upload sends the whole file when most of it changed."""
+    destination = tmp_path / "project"
+    destination.mkdir()
+    (destination / "result.rst").write_bytes(data.read_bytes())
+    data.write_bytes(bytes(reversed(data.read_bytes())))
+
+    stub = LocalStub()
+    mechanical = make_mechanical(stub)
+    mechanical.upload(data, str(destination), progress_bar=False, delta=True, block_size=1024)
+    assert stub.uploaded == 10240
+    # Only the block checksums ran on the server, not the rebuild of the file
+    assert stub.script_calls == 1
+    assert (destination / "result.rst").read_bytes() == data.read_bytes()
+
+
+def test_delta_upload(make_mechanical, data, tmp_path):
+    """Test that a delta upload only sends the changed block and rebuilds the file."""
+    destination = tmp_path / "project"
+    destination.mkdir()
+    (destination / "result.rst").write_bytes(data.read_bytes())
+    changed = bytearray(data.read_bytes())
+    changed[5000:5004] = b"edit"
+    data.write_bytes(bytes(changed))
+
+    stub = LocalStub()
+    mechanical = make_mechanical(stub)
+    mechanical.upload(data, str(destination), progress_bar=False, delta=True, block_size=1024)
+    assert stub.uploaded == 1024
+    assert (destination / "result.rst").read_bytes() == bytes(changed)
+    assert sorted(path.name for path in destination.iterdir()) == ["result.rst"]
+
+
+def test_delta_upload_without_server_copy(make_mechanical, data, tmp_path):
+    """Test that a delta upload sends the whole file when the server has no copy."""
+    stub = LocalStub()
+    mechanical = make_mechanical(stub)
+    mechanical.upload(data, str(tmp_path), progress_bar=False, delta=True)
+    assert stub.uploaded == 10240
+    assert (tmp_path / "result.rst").read_bytes() == data.read_bytes()
+
+
+@pytest.mark.parametrize("compression", [False, "gzip"])
+def test_archive_download_project(make_mechanical, tmp_path, monkeypatch, compression):
+    """Test that the project files are downloaded as one archive and unpacked."""
+    project = tmp_path / "server" / "Project_Mech_Files"
+    (project / "sub").mkdir(parents=True)
+    names = {"solve.out": b"out" * 1000, "sub/file0.dat": b"dat" * 1000, "sub/empty.log": b""}
+    for name, content in names.items():
+        (project / name).write_bytes(content)
+    files = [str(project / name) for name in names]
+    monkeypatch.setattr(Mechanical, "project_directory", str(project) + "/")
+    stub = LocalStub()
+    mechanical = make_mechanical(stub)
+    mechanical._metrics = ClientMetrics()
+    monkeypatch.setattr(mechanical, "list_files", lambda: files)
+
+    target = tmp_path / "local"
+    local_files = mechanical.download_project(
+        target_dir=str(target), archive=True, compression=compression
+    )
+    assert sorted(local_files) == sorted(
+        str(target / "Project_Mech_Files" / name) for name in names
+    )
+    for name, content in names.items():
+        assert (target / "Project_Mech_Files" / name).read_bytes() == content
+    stats = mechanical.metrics.operations()["download_archive"]
+    assert stats.calls == 1
+    if compression:
+        assert stub.downloaded < 1000
+        assert stats.compression_ratio > 1
+    assert sorted(path.name for path in (tmp_path / "server").iterdir()) == ["Project_Mech_Files"]
+
+
+def test_extract_archive_rejects_outside_paths(tmp_path):
+    """Test that an archive cannot write outside of the target directory."""
+    stream = io.BytesIO()
+    with tarfile.open(fileobj=stream, mode="w") as archive:
+        member = tarfile.TarInfo("../evil.txt")
+        member.size = 4
+        archive.addfile(member, io.BytesIO(b"evil"))
+    stream.seek(0)
+    with pytest.raises(OSError, match="outside"):
+        extract_archive(stream, tmp_path / "target")
+    assert not (tmp_path / "evil.txt").exists()
+
+
+def test_iter_chunks_reads_ahead_with_bounded_memory(make_mechanical, data):
+    """Test that a streamed download reads a bounded number of chunks ahead."""
+    stub = LocalStub()
+    mechanical = make_mechanical(stub)
+    mechanical._metrics = ClientMetrics()
+    with mechanical.iter_chunks(str(data), chunk_size=256, read_ahead=2) as chunks:
+        first = next(chunks)
+        deadline = time.monotonic() + 5
+        while stub.downloaded < 4 * 256 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        # The chunk being consumed, the queued chunks, and the one waiting for space
+        assert stub.downloaded == 4 * 256
+        assert first + b"".join(chunks) == data.read_bytes()
+    stats = mechanical.metrics.operations()["download_stream"]
+    assert stats.bytes_received == 10240
+    assert stats.chunks_received == 40
+
+
+class StalledCall:
+    """Streaming call whose server stopped sending until it is cancelled."""
+
+    def __init__(self):
+        self.cancelled = threading.Event()
+
+    def __iter__(self):
+        """Get the iterator, which is the call itself."""
+        return self
+
+    def __next__(self):
+        """Wait until the call is cancelled."""
+        self.cancelled.wait()
+        raise ConnectionError("The call was cancelled.")
+
+    def cancel(self):
+        """Cancel the call."""
+        self.cancelled.set()
+
+
+def test_read_ahead_close_cancels_stalled_call():
+    """Test that closing a read-ahead releases a call that stopped sending chunks."""
+    call = StalledCall()
+    handle = StreamCall()
+    handle.set(call)
+    chunks = ReadAhead(call, call=handle)
+    chunks.close()
+    chunks._thread.join(timeout=5)
+    assert call.cancelled.is_set()
+    assert not chunks._thread.is_alive()
+
+    # A call set after the cancellation is cancelled right away
+    late_call = StalledCall()
+    handle.set(late_call)
+    assert late_call.cancelled.is_set()
+
+
+def test_iter_chunks_released_when_abandoned(make_mechanical, data):
+    """Test that breaking out of a streamed download releases its transfer slot."""
+    mechanical = make_mechanical(LocalStub())
+    for chunk in mechanical.iter_chunks(str(data), chunk_size=256, read_ahead=1):
+        assert chunk == data.read_bytes()[:256]
+        break
+    gc.collect()
+    deadline = time.monotonic() + 5
+    while mechanical._scheduler.busy and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not mechanical._scheduler.busy
+
+
+def test_open_remote(make_mechanical, data):
+    """Test that a server file is read as a stream and that errors reach the reader."""
+    mechanical = make_mechanical(LocalStub())
+    with mechanical.open_remote(str(data), chunk_size=1000) as stream:
+        assert stream.read(10) == data.read_bytes()[:10]
+        assert stream.read() == data.read_bytes()[10:]
+
+    mechanical = make_mechanical(LocalStub(fail_after=2000))
+    with mechanical.open_remote(str(data), chunk_size=1000) as stream:
+        with pytest.raises(ConnectionError):
+            stream.read()
+
+
+def test_transfer_progress(make_mechanical, data, tmp_path):
+    """Test that uploads and downloads report their progress to the monitor."""
+    reports = []
+    mechanical = make_mechanical(LocalStub())
+    mechanical.progress = TransferMonitor(reports.append, min_interval=0)
+    destination = tmp_path / "project"
+    destination.mkdir()
+    mechanical.upload(data, str(destination), progress_bar=False, chunk_size=4096)
+    mechanical._download(str(destination / "result.rst"), str(tmp_path / "out.rst"))
+    uploads = [report for report in reports if report.direction == "upload"]
+    downloads = [report for report in reports if report.direction == "download"]
+    assert [report.bytes_done for report in uploads] == [0, 4096, 8192, 10240, 10240]
+    assert uploads[-1].finished
+    assert downloads[-1].bytes_done == downloads[-1].total == 10240
+    assert downloads[-1].finished
+    assert mechanical.progress.bytes_transferred == 20480
+
+
+def test_download_cache(make_mechanical, data, tmp_path):
+    """Test that a file already in the cache is not transferred again."""
+    stub = LocalStub()
+    mechanical = make_mechanical(stub)
+    mechanical.cache = DownloadCache(tmp_path / "cache")
+    mechanical._download(str(data), str(tmp_path / "first.rst"))
+    assert stub.downloaded == 10240
+    mechanical._download(str(data), str(tmp_path / "second.rst"))
+    assert stub.downloaded == 10240
+    assert (tmp_path / "second.rst").read_bytes() == data.read_bytes()
+    stats = mechanical.cache.stats()
+    assert (stats.hits, stats.misses) == (1, 1)